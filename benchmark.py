@@ -0,0 +1,430 @@
+"""
+Benchmarks for image-slicer.
+
+Usage:
+    python benchmark.py workers [--size 4096] [--tile-size 256] [--workers 1 2 4 8]
+    python benchmark.py join [--grids 10 100 1000] [--tile-size 4]
+    python benchmark.py discover [--entries 10000 1000000] [--noise 0.1]
+    python benchmark.py suite [--sizes 1024 4096] [--bands 1 3 4] [--formats png jpg]
+                              [--output results.json]
+    python benchmark.py compare baseline.json results.json [--threshold 0.1]
+
+The suite runs every measurement in a fresh process, so peak RSS is per
+measurement, and reports the median of --repeat runs. compare exits with
+status 1 if any measurement is slower, or uses more memory, than the
+baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import pyvips
+
+from image_slicer import ImageJoiner, ImageSlicer
+from image_slicer.slicer import _join_grid
+
+
+def make_image(path: str, size: int) -> None:
+    """Writes a synthetic RGB test image that does not compress trivially."""
+    image = pyvips.Image.gaussnoise(size, size, mean=128, sigma=40)
+    image = image.bandjoin([image, image]).cast("uchar")
+    image.write_to_file(path)
+
+
+def bench_workers(
+    source: str, tile_size: int, workers_list: list[int], output_root: str
+) -> None:
+    """Prints tiles/sec for ImageSlicer.slice at each worker count."""
+    slicer = ImageSlicer(source)
+    print(
+        f"{'workers':>8} {'tiles':>8} {'seconds':>10} {'tiles/sec':>10} {'speedup':>8}"
+    )
+    baseline = None
+    for workers in workers_list:
+        output_dir = os.path.join(output_root, f"workers_{workers}")
+        start = time.perf_counter()
+        slicer.slice(
+            output_dir=output_dir,
+            tile_width=tile_size,
+            tile_height=tile_size,
+            workers=workers,
+        )
+        elapsed = time.perf_counter() - start
+        tiles = len(os.listdir(output_dir))
+        rate = tiles / elapsed
+        baseline = baseline or rate
+        print(
+            f"{workers:>8} {tiles:>8} {elapsed:>10.3f} {rate:>10.1f} "
+            f"{rate / baseline:>7.2f}x"
+        )
+
+
+def chained_join(grid: list[list[pyvips.Image]]) -> pyvips.Image:
+    """The previous join strategy: pairwise horizontal then vertical joins."""
+    rows = []
+    for row_tiles in grid:
+        row_image = row_tiles[0]
+        for tile in row_tiles[1:]:
+            row_image = row_image.join(tile, "horizontal")
+        rows.append(row_image)
+    final_image = rows[0]
+    for row_image in rows[1:]:
+        final_image = final_image.join(row_image, "vertical")
+    return final_image
+
+
+def bench_join(grids: list[int], tile_size: int, chained_limit: int) -> None:
+    """Prints the time to build and render an NxN mosaic of in-memory tiles."""
+    tile = (pyvips.Image.black(tile_size, tile_size) + 128).cast("uchar")
+    tile = tile.copy_memory()
+    header = ("grid", "tiles", "arrayjoin s", "us/tile", "chained s")
+    print("{:>11} {:>9} {:>12} {:>8} {:>10}".format(*header))
+    for n in grids:
+        grid = [[tile] * n for _ in range(n)]
+
+        start = time.perf_counter()
+        _join_grid(grid).avg()
+        elapsed = time.perf_counter() - start
+
+        chained = "-"
+        if n <= chained_limit:
+            start = time.perf_counter()
+            chained_join(grid).avg()
+            chained = f"{time.perf_counter() - start:.3f}"
+
+        print(
+            f"{f'{n}x{n}':>11} {n * n:>9} {elapsed:>12.3f} "
+            f"{elapsed / (n * n) * 1e6:>8.2f} {chained:>10}"
+        )
+
+
+def iterdir_discover(tiles_dir: str, naming_format: str) -> dict:
+    """The previous discovery: iterdir, a stat per entry and uncompiled regexes."""
+    pattern = naming_format.replace("{row}", r"(\d+)").replace("{col}", r"(\d+)")
+    pattern = "^" + pattern + "$"
+    tiles = {}
+    for file_path in Path(tiles_dir).iterdir():
+        if file_path.is_file():
+            match = re.match(pattern, file_path.name)
+            if match:
+                tiles[(int(match.group(1)), int(match.group(2)))] = file_path
+    return tiles
+
+
+def bench_discover(entries_list: list[int], noise: float, root: str) -> None:
+    """Prints tile discovery time for directories of empty tile files."""
+    print(f"{'entries':>9} {'iterdir s':>10} {'scandir s':>10} {'speedup':>8}")
+    for entries in entries_list:
+        tiles_dir = os.path.join(root, f"entries_{entries}")
+        os.makedirs(tiles_dir)
+        tile_count = int(entries * (1 - noise))
+        side = max(1, int(tile_count**0.5))
+        for i in range(entries):
+            if i < side * side:
+                name = f"tile_{i // side}_{i % side}.png"
+            else:
+                name = f"other_{i}.txt"
+            open(os.path.join(tiles_dir, name), "wb").close()
+
+        start = time.perf_counter()
+        old = iterdir_discover(tiles_dir, "tile_{row}_{col}.png")
+        old_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new = ImageJoiner(tiles_dir)._discover_tiles()
+        elapsed = time.perf_counter() - start
+
+        assert old.keys() == new.keys()
+        print(
+            f"{entries:>9} {old_elapsed:>10.3f} {elapsed:>10.3f} "
+            f"{old_elapsed / elapsed:>7.2f}x"
+        )
+
+
+def make_suite_image(path: str, size: int, bands: int) -> None:
+    """Writes a synthetic noise image with the given size and bands."""
+    image = pyvips.Image.gaussnoise(size, size, mean=128, sigma=40).cast("uchar")
+    if bands > 1:
+        image = image.bandjoin([image.rot180()] * (bands - 1))
+    image.write_to_file(path)
+
+
+def peak_rss_mb() -> float | None:
+    """The peak resident set size of this process in MB, where available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_case(name: str, source: str, tile_size: int, work_dir: str) -> dict:
+    """
+    Runs one measurement. This is called in a fresh process, so the source
+    is opened and libvips starts cold every time.
+    """
+    tiles_dir = os.path.join(work_dir, "tiles")
+    suffix = os.path.splitext(source)[1]
+    start = time.perf_counter()
+    if name == "slice":
+        shutil.rmtree(tiles_dir, ignore_errors=True)
+        ImageSlicer(source).slice(
+            tiles_dir,
+            f"tile_{{row}}_{{col}}{suffix}",
+            tile_width=tile_size,
+            tile_height=tile_size,
+        )
+        tiles = len(os.listdir(tiles_dir))
+    elif name == "generate_tiles":
+        tiles = 0
+        for tile, _, _ in ImageSlicer(source).generate_tiles(
+            tile_width=tile_size, tile_height=tile_size
+        ):
+            tile.write_to_memory()
+            tiles += 1
+    elif name == "join":
+        ImageJoiner(tiles_dir, f"tile_{{row}}_{{col}}{suffix}").join(
+            os.path.join(work_dir, f"joined{suffix}")
+        )
+        tiles = len(os.listdir(tiles_dir))
+    else:
+        raise ValueError(f"Unknown benchmark: {name}")
+    return {
+        "seconds": time.perf_counter() - start,
+        "tiles": tiles,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def bench_suite(
+    sizes: list[int],
+    bands_list: list[int],
+    formats: list[str],
+    tile_size: int,
+    repeat: int,
+    root: str,
+) -> dict:
+    """Measures slice, generate_tiles and join on every synthetic image."""
+    context = multiprocessing.get_context("spawn")
+    results = []
+    header = ("benchmark", "image", "tiles", "seconds", "tiles/s", "MB/s", "RSS MB")
+    print("{:>15} {:>18} {:>7} {:>9} {:>9} {:>8} {:>8}".format(*header))
+    for size in sizes:
+        for bands in bands_list:
+            for fmt in formats:
+                work_dir = os.path.join(root, f"{size}_{bands}_{fmt}")
+                os.makedirs(work_dir)
+                source = os.path.join(work_dir, f"source.{fmt}")
+                make_suite_image(source, size, bands)
+                megabytes = size * size * bands / 1e6
+                # join needs the tiles written by slice, so it runs last.
+                for name in ("slice", "generate_tiles", "join"):
+                    runs = []
+                    for _ in range(repeat):
+                        with context.Pool(1) as pool:
+                            runs.append(
+                                pool.apply(
+                                    run_case, (name, source, tile_size, work_dir)
+                                )
+                            )
+                    seconds = statistics.median(run["seconds"] for run in runs)
+                    rss = [run["peak_rss_mb"] for run in runs]
+                    result = {
+                        "benchmark": name,
+                        "size": size,
+                        "bands": bands,
+                        "format": fmt,
+                        "tile_size": tile_size,
+                        "tiles": runs[0]["tiles"],
+                        "seconds": seconds,
+                        "tiles_per_sec": runs[0]["tiles"] / seconds,
+                        "mb_per_sec": megabytes / seconds,
+                        "peak_rss_mb": None if None in rss else max(rss),
+                    }
+                    results.append(result)
+                    rss_text = (
+                        "-"
+                        if result["peak_rss_mb"] is None
+                        else f"{result['peak_rss_mb']:.0f}"
+                    )
+                    print(
+                        f"{name:>15} {f'{size}px {bands}b {fmt}':>18} "
+                        f"{result['tiles']:>7} {seconds:>9.3f} "
+                        f"{result['tiles_per_sec']:>9.1f} "
+                        f"{result['mb_per_sec']:>8.1f} {rss_text:>8}"
+                    )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "libvips": ".".join(str(pyvips.version(i)) for i in range(3)),
+            "pyvips": pyvips.__version__,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def result_key(result: dict) -> tuple:
+    """Identifies a measurement across runs."""
+    return tuple(
+        result[k] for k in ("benchmark", "size", "bands", "format", "tile_size")
+    )
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> int:
+    """
+    Prints the change in time and peak RSS of every measurement found in
+    both runs, returning the number of regressions beyond ``threshold``.
+    """
+    previous = {result_key(r): r for r in baseline["results"]}
+    header = ("benchmark", "image", "base s", "new s", "time", "RSS", "")
+    print("{:>15} {:>18} {:>9} {:>9} {:>8} {:>8} {}".format(*header))
+    regressions = 0
+    for result in current["results"]:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        time_ratio = result["seconds"] / old["seconds"]
+        rss_ratio = None
+        if result["peak_rss_mb"] and old["peak_rss_mb"]:
+            rss_ratio = result["peak_rss_mb"] / old["peak_rss_mb"]
+        regressed = time_ratio > 1 + threshold or (
+            rss_ratio is not None and rss_ratio > 1 + threshold
+        )
+        regressions += regressed
+        image = f"{result['size']}px {result['bands']}b {result['format']}"
+        rss_text = "-" if rss_ratio is None else f"{rss_ratio:.2f}x"
+        print(
+            f"{result['benchmark']:>15} {image:>18} {old['seconds']:>9.3f} "
+            f"{result['seconds']:>9.3f} {time_ratio:>7.2f}x {rss_text:>8} "
+            f"{'REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    workers_parser = subparsers.add_parser("workers", help="slice() thread scaling")
+    workers_parser.add_argument("--size", type=int, default=4096)
+    workers_parser.add_argument("--tile-size", type=int, default=256)
+    workers_parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, 8, os.cpu_count() or 1]
+    )
+
+    join_parser = subparsers.add_parser("join", help="join time against grid size")
+    join_parser.add_argument(
+        "--grids", type=int, nargs="+", default=[10, 32, 100, 316, 1000]
+    )
+    join_parser.add_argument("--tile-size", type=int, default=4)
+    join_parser.add_argument(
+        "--chained-limit",
+        type=int,
+        default=100,
+        help="Largest grid to also time with chained pairwise joins.",
+    )
+
+    discover_parser = subparsers.add_parser(
+        "discover", help="tile discovery time against directory size"
+    )
+    discover_parser.add_argument(
+        "--entries", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    discover_parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.1,
+        help="Fraction of entries that are not tiles.",
+    )
+
+    suite_parser = subparsers.add_parser(
+        "suite", help="slice, generate_tiles and join on synthetic images"
+    )
+    suite_parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 4096])
+    suite_parser.add_argument("--bands", type=int, nargs="+", default=[1, 3, 4])
+    suite_parser.add_argument(
+        "--formats", nargs="+", default=["png", "jpg", "tif"], help="File suffixes."
+    )
+    suite_parser.add_argument("--tile-size", type=int, default=256)
+    suite_parser.add_argument("--repeat", type=int, default=3)
+    suite_parser.add_argument("--output", help="Write the results as JSON here.")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two suite results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown or RSS growth reported as a regression.",
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark == "suite":
+        with tempfile.TemporaryDirectory() as tmp:
+            report = bench_suite(
+                args.sizes,
+                args.bands,
+                args.formats,
+                args.tile_size,
+                args.repeat,
+                tmp,
+            )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+        return
+
+    if args.benchmark == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        if compare_results(baseline, current, args.threshold):
+            sys.exit(1)
+        return
+
+    if args.benchmark == "join":
+        bench_join(args.grids, args.tile_size, args.chained_limit)
+        return
+
+    if args.benchmark == "discover":
+        with tempfile.TemporaryDirectory() as tmp:
+            bench_discover(args.entries, args.noise, tmp)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.png")
+        make_image(source, args.size)
+        print(f"Slicing {args.size}x{args.size} into {args.tile_size}px tiles")
+        bench_workers(
+            source, args.tile_size, sorted(set(args.workers)), os.path.join(tmp, "out")
+        )
+
+
+if __name__ == "__main__":
+    main()
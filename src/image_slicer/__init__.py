@@ -4,6 +4,43 @@ A high-performance Python library to slice images into tiles.
 
 __version__ = "3.1.0"
 
-from .slicer import ImageJoiner, ImageSlicer, join_image, slice_image
+from .aio import (
+    generate_encoded_tiles_async,
+    generate_tiles_async,
+    join_image_async,
+    slice_image_async,
+)
+from .archive import TileArchive, TileArchiveWriter
+from .cache import TileCache
+from .limits import VipsLimits
+from .progress import JoinEvent, ProgressReporter, TileEvent
+from .slicer import (
+    ImageJoiner,
+    ImageSlicer,
+    join_image,
+    join_tiles,
+    slice_image,
+    slice_images,
+    slice_pyramid,
+)
 
-__all__ = ["ImageSlicer", "ImageJoiner", "slice_image", "join_image"]
+__all__ = [
+    "ImageSlicer",
+    "ImageJoiner",
+    "TileArchive",
+    "TileArchiveWriter",
+    "TileCache",
+    "ProgressReporter",
+    "VipsLimits",
+    "TileEvent",
+    "JoinEvent",
+    "slice_image",
+    "slice_images",
+    "slice_pyramid",
+    "join_image",
+    "join_tiles",
+    "slice_image_async",
+    "join_image_async",
+    "generate_tiles_async",
+    "generate_encoded_tiles_async",
+]
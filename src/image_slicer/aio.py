@@ -0,0 +1,238 @@
+"""
+asyncio counterparts of the slicing and joining API.
+
+Crop, encode and write work is offloaded to an executor one tile at a time,
+with a bounded number of tiles in flight, so many jobs can share one event
+loop without each one blocking a thread for its whole duration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from typing import Any, TypeVar
+
+import pyvips  # type: ignore[import-untyped]
+
+from .slicer import ImageSlicer, _check_workers, _write_atomically, join_image
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Done(enum.Enum):
+    """The type of the sentinel returned by :func:`_next` when exhausted."""
+
+    DONE = enum.auto()
+
+
+_DONE = _Done.DONE
+
+
+def _next(iterator: Iterator[T]) -> T | _Done:
+    """Returns the next item of ``iterator``, or _DONE if there is none."""
+    return next(iterator, _DONE)
+
+
+async def _amap(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int = 1,
+    executor: Executor | None = None,
+) -> AsyncIterator[R]:
+    """
+    Maps a function over an iterable in an executor, yielding results in
+    order.
+
+    Items are pulled from the iterable in the executor as well, since
+    producing them may decode pixels. At most ``workers`` calls are in flight,
+    so a slow consumer applies backpressure to the producer.
+    """
+    _check_workers(workers)
+    loop = asyncio.get_running_loop()
+    iterator = iter(items)
+    pending: deque[asyncio.Future[R]] = deque()
+    try:
+        while True:
+            item = await loop.run_in_executor(executor, _next, iterator)
+            if item is _DONE:
+                break
+            pending.append(loop.run_in_executor(executor, func, item))
+            if len(pending) >= workers:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def generate_tiles_async(
+    slicer: ImageSlicer,
+    cols: int | None = None,
+    rows: int | None = None,
+    number_of_tiles: int | None = None,
+    tile_width: int | None = None,
+    tile_height: int | None = None,
+    executor: Executor | None = None,
+) -> AsyncIterator[tuple[pyvips.Image, int, int]]:
+    """
+    An async iterator over the tiles of ``slicer`` as pyvips.Image objects.
+
+    Args:
+        slicer: The ImageSlicer to take tiles from.
+        cols: The number of columns to slice the image into.
+        rows: The number of rows to slice the image into.
+        number_of_tiles: The total number of tiles to create.
+        tile_width: The desired width of each tile.
+        tile_height: The desired height of each tile.
+        executor: The executor to run blocking work in. Defaults to the
+                  event loop's default executor.
+
+    Yields:
+        A tuple containing the pyvips.Image object for the tile,
+        its row number, and its column number.
+    """
+    loop = asyncio.get_running_loop()
+    tiles = slicer.generate_tiles(cols, rows, number_of_tiles, tile_width, tile_height)
+    while True:
+        tile = await loop.run_in_executor(executor, _next, tiles)
+        if tile is _DONE:
+            break
+        yield tile
+
+
+async def generate_encoded_tiles_async(
+    slicer: ImageSlicer,
+    fmt: str = ".png",
+    cols: int | None = None,
+    rows: int | None = None,
+    number_of_tiles: int | None = None,
+    tile_width: int | None = None,
+    tile_height: int | None = None,
+    save_options: dict[str, Any] | None = None,
+    workers: int = 1,
+    executor: Executor | None = None,
+) -> AsyncIterator[tuple[bytes, int, int]]:
+    """
+    An async iterator over the tiles of ``slicer`` encoded in memory.
+
+    Args:
+        slicer: The ImageSlicer to take tiles from.
+        fmt: The format to encode to, as a file extension such as ".png".
+        cols: The number of columns to slice the image into.
+        rows: The number of rows to slice the image into.
+        number_of_tiles: The total number of tiles to create.
+        tile_width: The desired width of each tile.
+        tile_height: The desired height of each tile.
+        save_options: Options passed to the libvips saver for ``fmt``.
+        workers: The maximum number of tiles encoded concurrently.
+        executor: The executor to run blocking work in. Defaults to the
+                  event loop's default executor.
+
+    Yields:
+        A tuple containing the encoded bytes of the tile, its row number,
+        and its column number.
+    """
+    options = save_options or {}
+
+    def encode_tile(item: tuple[pyvips.Image, int, int]) -> tuple[bytes, int, int]:
+        tile, row, col = item
+        return tile.write_to_buffer(fmt, **options), row, col
+
+    tiles = slicer.generate_tiles(cols, rows, number_of_tiles, tile_width, tile_height)
+    async for encoded in _amap(encode_tile, tiles, workers, executor):
+        yield encoded
+
+
+async def slice_image_async(
+    source: str | Any,
+    output_dir: str,
+    naming_format: str = "tile_{row}_{col}.png",
+    cols: int | None = None,
+    rows: int | None = None,
+    number_of_tiles: int | None = None,
+    tile_width: int | None = None,
+    tile_height: int | None = None,
+    workers: int = 1,
+    streaming: bool = False,
+    save_options: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+) -> int:
+    """
+    The async counterpart of :func:`slice_image`.
+
+    Each tile is cropped, encoded and written as a separate executor task,
+    with at most ``workers`` tiles in flight for this job.
+
+    Args:
+        source: A path to the image file, a PIL Image object or a NumPy array.
+        output_dir: The directory to save the tiles in.
+        naming_format: A format string for the output filenames.
+        cols: The number of columns to slice the image into.
+        rows: The number of rows to slice the image into.
+        number_of_tiles: The total number of tiles to create.
+        tile_width: The desired width of each tile.
+        tile_height: The desired height of each tile.
+        workers: The maximum number of tiles written concurrently.
+        streaming: If True, read the source top to bottom in strips one tile
+                   row high to bound peak memory.
+        save_options: Options passed to the libvips saver for each tile.
+        executor: The executor to run blocking work in. Defaults to the
+                  event loop's default executor.
+
+    Returns:
+        The number of tiles written.
+    """
+    _check_workers(workers)
+    loop = asyncio.get_running_loop()
+    slicer = await loop.run_in_executor(
+        executor, lambda: ImageSlicer(source, streaming=streaming)
+    )
+    await loop.run_in_executor(executor, lambda: os.makedirs(output_dir, exist_ok=True))
+    options = save_options or {}
+
+    def write_tile(item: tuple[pyvips.Image, int, int]) -> None:
+        tile, row, col = item
+        filename = naming_format.format(row=row, col=col)
+        _write_atomically(tile, os.path.join(output_dir, filename), options)
+
+    tiles = slicer.generate_tiles(cols, rows, number_of_tiles, tile_width, tile_height)
+    written = 0
+    async for _ in _amap(write_tile, tiles, workers, executor):
+        written += 1
+    return written
+
+
+async def join_image_async(
+    tiles_dir: str,
+    output_path: str,
+    naming_format: str | None = None,
+    save_options: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+) -> None:
+    """
+    The async counterpart of :func:`join_image`.
+
+    The join is written by a single libvips pipeline, which runs in the
+    executor.
+
+    Args:
+        tiles_dir: Directory or archive containing the tiles to join.
+        output_path: Path where the joined image will be saved.
+        naming_format: The naming format used for the tiles. Defaults to the
+                       format recorded in a tile archive, or
+                       "tile_{row}_{col}.png".
+        save_options: Options passed to the libvips saver for the output.
+        executor: The executor to run blocking work in. Defaults to the
+                  event loop's default executor.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        executor,
+        lambda: join_image(tiles_dir, output_path, naming_format, save_options),
+    )
@@ -0,0 +1,162 @@
+"""
+Single-file tile archives.
+
+An archive is an uncompressed (stored) zip file holding one encoded tile per
+entry, named with the same naming format used for tile directories. The zip
+central directory acts as the offset table, so any tile can be read with one
+seek, and the archive can still be inspected or extracted with standard zip
+tools.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from types import TracebackType
+
+import pyvips  # type: ignore[import-untyped]
+
+DEFAULT_NAMING_FORMAT = "tile_{row}_{col}.png"
+
+
+class TileArchiveWriter:
+    """
+    Packs encoded tiles into a single archive file.
+
+    Attributes:
+        path (str): Path to the archive file.
+        naming_format (str): The naming format used for the tile entries.
+    """
+
+    def __init__(self, path: str, naming_format: str = DEFAULT_NAMING_FORMAT):
+        """
+        Create a new archive, replacing any existing file at ``path``.
+
+        Args:
+            path: Path to the archive file.
+            naming_format: A format string for the tile entry names.
+                           Available placeholders: {row}, {col}.
+        """
+        self.path = path
+        self.naming_format = naming_format
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED)
+        self._rows = 0
+        self._cols = 0
+
+    def add(self, row: int, col: int, data: bytes) -> None:
+        """Add the encoded bytes of the tile at (row, col)."""
+        name = self.naming_format.format(row=row, col=col)
+        self._zip.writestr(name, data)
+        self._rows = max(self._rows, row + 1)
+        self._cols = max(self._cols, col + 1)
+
+    def close(self) -> None:
+        """Write the index and close the archive."""
+        if self._zip.fp is None:
+            return
+        metadata = {
+            "naming_format": self.naming_format,
+            "rows": self._rows,
+            "cols": self._cols,
+        }
+        self._zip.comment = json.dumps(metadata).encode()
+        self._zip.close()
+
+    def __enter__(self) -> TileArchiveWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class TileArchive:
+    """
+    Random access to the tiles in an archive.
+
+    Attributes:
+        path (str): Path to the archive file.
+        naming_format (str): The naming format used for the tile entries.
+        rows (Optional[int]): The number of tile rows, if recorded.
+        cols (Optional[int]): The number of tile columns, if recorded.
+    """
+
+    def __init__(self, path: str, naming_format: str | None = None):
+        """
+        Open an archive for reading.
+
+        Args:
+            path: Path to the archive file.
+            naming_format: The naming format used for the tile entries.
+                           Defaults to the format recorded in the archive,
+                           or "tile_{row}_{col}.png" for plain zip files.
+
+        Raises:
+            ValueError: If the file is not a zip archive.
+        """
+        if not zipfile.is_zipfile(path):
+            raise ValueError(f"Not a tile archive: {path}")
+
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "r")
+
+        metadata = {}
+        if self._zip.comment:
+            try:
+                metadata = json.loads(self._zip.comment)
+            except ValueError:
+                metadata = {}
+
+        self.naming_format = (
+            naming_format or metadata.get("naming_format") or DEFAULT_NAMING_FORMAT
+        )
+        self.rows: int | None = metadata.get("rows")
+        self.cols: int | None = metadata.get("cols")
+
+    def names(self) -> list[str]:
+        """Return the names of all entries in the archive."""
+        return self._zip.namelist()
+
+    def read_name(self, name: str) -> bytes:
+        """Return the encoded bytes of the entry called ``name``."""
+        return self._zip.read(name)
+
+    def read(self, row: int, col: int) -> bytes:
+        """
+        Return the encoded bytes of the tile at (row, col).
+
+        Raises:
+            KeyError: If the archive has no such tile.
+        """
+        return self._zip.read(self.naming_format.format(row=row, col=col))
+
+    def open_tile(self, row: int, col: int) -> pyvips.Image:
+        """Return the tile at (row, col) as a pyvips.Image."""
+        return pyvips.Image.new_from_buffer(self.read(row, col), "")
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        row, col = position
+        try:
+            self._zip.getinfo(self.naming_format.format(row=row, col=col))
+        except KeyError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._zip.close()
+
+    def __enter__(self) -> TileArchive:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
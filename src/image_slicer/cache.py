@@ -0,0 +1,94 @@
+"""
+A size-bounded LRU cache of encoded tiles.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TileCache:
+    """
+    A thread-safe least-recently-used cache of encoded tiles, bounded by the
+    total size of the tiles it holds.
+
+    Attributes:
+        max_bytes (int): The most bytes of tile data the cache holds.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that were not.
+        evictions (int): The number of tiles dropped to make room.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        """
+        Args:
+            max_bytes: The most bytes of tile data to hold. 0 disables the
+                       cache. Defaults to 64 MiB.
+
+        Raises:
+            ValueError: If max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._tiles: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the tile stored under ``key``, or None, counting the lookup."""
+        with self._lock:
+            data = self._tiles.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: Hashable, data: bytes) -> None:
+        """
+        Store a tile, evicting the least recently used tiles to make room.
+        Tiles larger than the whole cache are not stored.
+        """
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._tiles.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            while self._bytes + len(data) > self.max_bytes:
+                _, evicted = self._tiles.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+            self._tiles[key] = data
+            self._bytes += len(data)
+
+    def clear(self) -> None:
+        """Drop every tile. The counters are kept."""
+        with self._lock:
+            self._tiles.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """The counters, the number of tiles held and their size in bytes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "tiles": len(self._tiles),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._tiles)
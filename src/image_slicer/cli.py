@@ -2,20 +2,255 @@
 Command-line interface for image-slicer.
 """
 
+from __future__ import annotations
+
 import argparse
+import os
+import sys
+from typing import Any
+
+from .limits import VipsLimits
+from .progress import ProgressReporter
+from .slicer import (
+    PYRAMID_LAYOUTS,
+    ImageSlicer,
+    _plan_batch,
+    slice_image,
+    slice_images,
+    slice_pyramid,
+)
+
+
+def _parse_option_value(value: str) -> Any:
+    """Converts a command-line option value to a bool, int or float if it is one."""
+    if value.lower() in ("true", "yes"):
+        return True
+    if value.lower() in ("false", "no"):
+        return False
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _save_option(text: str) -> tuple[str, Any]:
+    """Parses a KEY=VALUE save option."""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    return key, _parse_option_value(value)
+
+
+def _tile_coord(text: str) -> tuple[int, int]:
+    """Parses a ROW,COL tile coordinate."""
+    try:
+        row, col = (int(part) for part in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROW,COL, got {text!r}") from None
+    return row, col
+
+
+def _add_save_option_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the encoder tuning options shared by imslice and imjoin."""
+    group = parser.add_argument_group(
+        "encoder options",
+        "Options passed to the libvips saver chosen by the file extension.",
+    )
+    group.add_argument(
+        "-q",
+        "--quality",
+        type=int,
+        help="Quality factor for lossy formats such as JPEG and WebP.",
+    )
+    group.add_argument(
+        "--compression",
+        type=_parse_option_value,
+        help="Compression level for PNG (0-9), or method for TIFF (e.g. deflate).",
+    )
+    group.add_argument(
+        "--effort",
+        type=int,
+        help="CPU effort for PNG, WebP, AVIF and JPEG XL encoders.",
+    )
+    group.add_argument(
+        "--lossless", action="store_true", help="Use lossless compression."
+    )
+    group.add_argument("--strip", action="store_true", help="Strip metadata.")
+    group.add_argument(
+        "--save-option",
+        dest="save_options",
+        type=_save_option,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Any other saver option, e.g. tile=true. May be repeated.",
+    )
+
+
+def _save_options_from_args(args: argparse.Namespace) -> dict[str, Any]:
+    """Collects the encoder tuning options into a save_options dict."""
+    options: dict[str, Any] = {}
+    if args.quality is not None:
+        options["Q"] = args.quality
+    if args.compression is not None:
+        options["compression"] = args.compression
+    if args.effort is not None:
+        options["effort"] = args.effort
+    if args.lossless:
+        options["lossless"] = True
+    if args.strip:
+        options["strip"] = True
+    options.update(args.save_options)
+    return options
+
+
+def _add_progress_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the progress reporting options shared by imslice and imjoin."""
+    group = parser.add_argument_group("progress options")
+    group.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show throughput and an ETA on stderr while the job runs.",
+    )
+    group.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print a breakdown of where the time went to stderr at the end.",
+    )
+
+
+def _add_limit_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the libvips resource limit options shared by imslice and imjoin."""
+    group = parser.add_argument_group(
+        "libvips options",
+        "Limits applied for the duration of the job. Default: libvips' own.",
+    )
+    group.add_argument(
+        "--vips-cache-max",
+        type=int,
+        metavar="OPERATIONS",
+        help="The maximum number of operations libvips caches.",
+    )
+    group.add_argument(
+        "--vips-cache-max-mem",
+        type=int,
+        metavar="MB",
+        help="The maximum memory cached operations may hold, in MB.",
+    )
+    group.add_argument(
+        "--vips-cache-max-files",
+        type=int,
+        metavar="FILES",
+        help="The maximum number of files cached operations may keep open.",
+    )
+    group.add_argument(
+        "--vips-concurrency",
+        type=int,
+        metavar="THREADS",
+        help="The number of threads each libvips pipeline uses.",
+    )
+
+
+def _limits_from_args(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> VipsLimits | None:
+    """Creates VipsLimits from the libvips options, or for --stats."""
+    cache_max_mem = args.vips_cache_max_mem
+    if cache_max_mem is not None:
+        cache_max_mem *= 2**20
+    values = (
+        args.vips_cache_max,
+        cache_max_mem,
+        args.vips_cache_max_files,
+        args.vips_concurrency,
+    )
+    if all(value is None for value in values) and not args.stats:
+        return None
+    try:
+        return VipsLimits(*values)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+def _progress_reporter(args: argparse.Namespace) -> ProgressReporter | None:
+    """Creates a ProgressReporter if --progress or --stats was given."""
+    if not (args.progress or args.stats):
+        return None
+    return ProgressReporter(sys.stderr, live=args.progress)
+
 
-from .slicer import slice_image
+def _finish_progress(
+    reporter: ProgressReporter | None,
+    stats: bool,
+    limits: VipsLimits | None = None,
+) -> None:
+    """Ends the status line and writes the --stats summary, if requested."""
+    if reporter is None:
+        return
+    reporter.close()
+    if not stats:
+        return
+    sys.stderr.write(reporter.summary() + "\n")
+    if limits is not None:
+        rss = limits.rss_highwater
+        sys.stderr.write(
+            f"libvips cache high-water: {limits.cache_highwater} operations, "
+            f"RSS high-water: {'-' if rss is None else f'{rss / 2**20:.0f} MB'}\n"
+        )
+
+
+def _is_batch(sources: list[str]) -> bool:
+    """Whether the sources name more than a single image file."""
+    if len(sources) != 1:
+        return True
+    source = sources[0]
+    return (
+        source == "-"
+        or os.path.isdir(source)
+        or (not os.path.exists(source) and any(c in source for c in "*?["))
+    )
+
+
+def _write_summary(summary: dict[str, Any]) -> None:
+    """Writes a batch throughput summary to stderr."""
+    seconds = max(summary["seconds"], 1e-9)
+    total = summary["images"] + len(summary["failed"])
+    sys.stderr.write(
+        f"Sliced {summary['images']} of {total} images into {summary['tiles']} "
+        f"tiles in {summary['seconds']:.2f}s: "
+        f"{summary['images'] / seconds:.1f} images/s, "
+        f"{summary['tiles'] / seconds:.1f} tiles/s, "
+        f"{summary['pixels'] / seconds / 1e6:.1f} Mpixels/s\n"
+    )
+    for path, error in summary["failed"]:
+        sys.stderr.write(f"Failed: {path}: {error}\n")
 
 
 def main():
     """
     The main function for the image-slicer CLI.
     """
+    if sys.argv[1:2] == ["serve"]:
+        # Imported here, as the server module uses this one's helpers.
+        from .server import main as serve_main
+
+        serve_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
-        description="Slice an image into smaller tiles.",
+        description="Slice an image into smaller tiles. Run 'imslice serve "
+        "-h' for the tile server.",
         formatter_class=argparse.RawTextHelpFormatter,
     )
-    parser.add_argument("source_path", help="Path to the source image.")
+    parser.add_argument(
+        "source_path",
+        nargs="+",
+        help="Path to the source image. Several paths, a directory, a quoted "
+        "glob pattern,\nor - to read paths from stdin, slice each image into "
+        "its own subdirectory\nof OUTPUT_DIR.",
+    )
     parser.add_argument("output_dir", help="Directory to save the tiles in.")
 
     group = parser.add_mutually_exclusive_group(required=True)
@@ -51,8 +286,172 @@ def main():
         "Available placeholders: {row}, {col}. "
         'Default: "tile_{row}_{col}.png"',
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of threads used to encode and write tiles. Default: 1",
+    )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=1,
+        help="The number of processes to shard the tile rows across. "
+        "Each process opens the source itself. Default: 1",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Read the source top to bottom in strips one tile row high, "
+        "bounding peak memory by one row of tiles.",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Pack the tiles into a single uncompressed zip archive at "
+        "OUTPUT_DIR instead of writing one file per tile.",
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help="Write a manifest.json describing the tiles, which imjoin uses "
+        "instead of scanning the directory.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep tiles already in OUTPUT_DIR that are up to date and only "
+        "write missing or stale ones. Use the options of the interrupted run.",
+    )
+    parser.add_argument(
+        "--blank",
+        choices=["skip", "link"],
+        help="Skip uniform tiles, recording them in the manifest (implies "
+        "--manifest), or hardlink them to one encoded copy.",
+    )
+    parser.add_argument(
+        "--blank-tolerance",
+        type=float,
+        default=0,
+        help="The largest per-band difference between the minimum and maximum "
+        "of a tile for it to count as uniform. Default: 0",
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        default=0,
+        help="Grow each tile by this many pixels on every side, so "
+        "neighbouring tiles overlap. Default: 0",
+    )
+    parser.add_argument(
+        "--padding",
+        choices=["black", "white", "copy", "mirror", "repeat"],
+        help="Pad the halo of edge tiles so every tile has the same size, "
+        "instead of clipping it at the image edges.",
+    )
+    parser.add_argument(
+        "--region",
+        type=int,
+        nargs=4,
+        metavar=("LEFT", "TOP", "WIDTH", "HEIGHT"),
+        help="Only write the tiles that intersect this box, keeping their "
+        "row and column numbers in the full grid.",
+    )
+    parser.add_argument(
+        "--tile-coords",
+        type=_tile_coord,
+        nargs="+",
+        metavar="ROW,COL",
+        help="Only write the tiles at these grid positions.",
+    )
+    parser.add_argument(
+        "--pyramid",
+        choices=PYRAMID_LAYOUTS,
+        help="Tile the image at every zoom level in one pass, writing a "
+        "DeepZoom (dz), XYZ (google), Zoomify or IIIF pyramid at OUTPUT_DIR. "
+        "Needs square --tile-size; the tile format comes from --format.",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Hardlink tiles whose encoded bytes match a tile already written.",
+    )
+
+    batch = parser.add_argument_group("batch options")
+    batch.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of images sliced concurrently. Default: 1",
+    )
+    batch.add_argument(
+        "--continue-on-error",
+        action="store_true",
+        help="Report images that fail to slice and carry on with the rest.",
+    )
+
+    _add_progress_arguments(parser)
+    _add_limit_arguments(parser)
+    _add_save_option_arguments(parser)
 
     args = parser.parse_args()
+    sources = args.source_path
+    if _is_batch(sources) and args.archive:
+        parser.error("--archive cannot be combined with several sources")
+    if args.archive:
+        for flag, used in (
+            ("--processes", args.processes > 1),
+            ("--manifest", args.manifest),
+            ("--resume", args.resume),
+            ("--blank", args.blank),
+            ("--dedupe", args.dedupe),
+            ("--overlap", args.overlap),
+            ("--region", args.region),
+            ("--tile-coords", args.tile_coords),
+            ("--progress", args.progress),
+            ("--stats", args.stats),
+        ):
+            if used:
+                parser.error(f"--archive cannot be combined with {flag}")
+
+    if args.pyramid:
+        if _is_batch(sources):
+            parser.error("--pyramid cannot be combined with several sources")
+        for flag, used in (
+            ("--grid", args.grid),
+            ("--number-of-tiles", args.number_of_tiles),
+            ("--archive", args.archive),
+            ("--processes", args.processes > 1),
+            ("--manifest", args.manifest),
+            ("--resume", args.resume),
+            ("--blank", args.blank),
+            ("--dedupe", args.dedupe),
+            ("--padding", args.padding),
+            ("--region", args.region),
+            ("--tile-coords", args.tile_coords),
+            ("--progress", args.progress),
+            ("--stats", args.stats),
+        ):
+            if used:
+                parser.error(f"--pyramid cannot be combined with {flag}")
+        if not args.tile_size or args.tile_size[0] != args.tile_size[1]:
+            parser.error("--pyramid needs a square --tile-size")
+
+        slice_pyramid(
+            sources[0],
+            args.output_dir,
+            layout=args.pyramid,
+            tile_size=args.tile_size[0],
+            suffix=os.path.splitext(args.naming_format)[1] or ".png",
+            overlap=args.overlap if args.overlap else None,
+            save_options=_save_options_from_args(args),
+            streaming=args.streaming,
+            limits=_limits_from_args(parser, args),
+        )
+        return
 
     cols, rows = (None, None)
     if args.grid:
@@ -62,8 +461,70 @@ def main():
     if args.tile_size:
         tile_width, tile_height = args.tile_size
 
+    limits = _limits_from_args(parser, args)
+    if args.archive:
+        slicer = ImageSlicer(sources[0], streaming=args.streaming, limits=limits)
+        slicer.slice_to_archive(
+            archive_path=args.output_dir,
+            naming_format=args.naming_format,
+            cols=cols,
+            rows=rows,
+            number_of_tiles=args.number_of_tiles,
+            tile_width=tile_width,
+            tile_height=tile_height,
+            workers=args.workers,
+            save_options=_save_options_from_args(args),
+        )
+        return
+
+    options: dict[str, Any] = {
+        "workers": args.workers,
+        "processes": args.processes,
+        "save_options": _save_options_from_args(args),
+        "manifest": args.manifest,
+        "resume": args.resume,
+        "blank": args.blank,
+        "blank_tolerance": args.blank_tolerance,
+        "dedupe": args.dedupe,
+        "overlap": args.overlap,
+        "padding": args.padding,
+        "progress": _progress_reporter(args),
+        "region": args.region,
+        "tile_coords": args.tile_coords,
+    }
+
+    if _is_batch(sources):
+        if sources == ["-"]:
+            sources = [line.strip() for line in sys.stdin if line.strip()]
+        # Sources that match nothing or collide are usage errors. Failures
+        # while slicing an image are not, so only the plan is checked here.
+        try:
+            _plan_batch(sources, args.continue_on_error)
+        except ValueError as error:
+            parser.error(str(error))
+        summary = slice_images(
+            sources,
+            args.output_dir,
+            naming_format=args.naming_format,
+            cols=cols,
+            rows=rows,
+            number_of_tiles=args.number_of_tiles,
+            tile_width=tile_width,
+            tile_height=tile_height,
+            jobs=args.jobs,
+            streaming=args.streaming,
+            continue_on_error=args.continue_on_error,
+            limits=limits,
+            **options,
+        )
+        _finish_progress(options["progress"], args.stats, limits)
+        _write_summary(summary)
+        if summary["failed"]:
+            sys.exit(1)
+        return
+
     slice_image(
-        source=args.source_path,
+        source=sources[0],
         output_dir=args.output_dir,
         naming_format=args.naming_format,
         cols=cols,
@@ -71,7 +532,11 @@ def main():
         number_of_tiles=args.number_of_tiles,
         tile_width=tile_width,
         tile_height=tile_height,
+        streaming=args.streaming,
+        limits=limits,
+        **options,
     )
+    _finish_progress(options["progress"], args.stats, limits)
 
 
 if __name__ == "__main__":
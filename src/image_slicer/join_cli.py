@@ -4,6 +4,15 @@ Command-line interface for joining image tiles.
 
 import argparse
 
+from .cli import (
+    _add_limit_arguments,
+    _add_progress_arguments,
+    _add_save_option_arguments,
+    _finish_progress,
+    _limits_from_args,
+    _progress_reporter,
+    _save_options_from_args,
+)
 from .slicer import join_image
 
 
@@ -24,19 +33,102 @@ def main():
         "-f",
         "--format",
         dest="naming_format",
-        default="tile_{row}_{col}.png",
         help="A format string for the tile filenames. "
         "Available placeholders: {row}, {col}. "
-        'Default: "tile_{row}_{col}.png"',
+        'Default: the format recorded in a tile archive, or "tile_{row}_{col}.png"',
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Open and decode one row of tiles at a time, bounding open files "
+        "and memory by one row. Needs temporary disk space next to the output.",
+    )
+    parser.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Also search subdirectories, matching the format against paths "
+        'relative to TILES_DIR, e.g. "{row}/{col}.png".',
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        help="The overlap the tiles were sliced with. Each tile is cropped "
+        "back to its grid cell. Default: read from the manifest, or 0",
+    )
+    parser.add_argument(
+        "--padded",
+        action="store_true",
+        default=None,
+        help="The edge tiles were sliced with --padding. "
+        "Default: read from the manifest",
+    )
+    parser.add_argument(
+        "--blend",
+        action="store_true",
+        help="Cross-fade overlapping tiles instead of cropping the overlap "
+        "off, hiding seams between independently processed tiles.",
+    )
+    tiff = parser.add_argument_group(
+        "tiled TIFF options",
+        "Write a tiled, pyramidal BigTIFF for fast random-access viewing. "
+        "Choose the codec with --compression (default: deflate) and --quality.",
+    )
+    tiff.add_argument(
+        "--tiled-tiff",
+        action="store_true",
+        help="Write OUTPUT_PATH, which must end in .tif or .tiff, as a tiled, "
+        "pyramidal BigTIFF.",
+    )
+    tiff.add_argument(
+        "--tiff-tile-size",
+        type=int,
+        metavar="SIZE",
+        help="The width and height of the TIFF tiles, a multiple of 16. "
+        "Default: 256",
+    )
+    tiff.add_argument(
+        "--no-pyramid",
+        action="store_true",
+        help="Write only the full-resolution level.",
+    )
+    _add_progress_arguments(parser)
+    _add_limit_arguments(parser)
+    _add_save_option_arguments(parser)
+
     args = parser.parse_args()
+    if not args.tiled_tiff and (args.tiff_tile_size or args.no_pyramid):
+        parser.error("--tiff-tile-size and --no-pyramid need --tiled-tiff")
+    if args.tiled_tiff and not args.output_path.lower().endswith((".tif", ".tiff")):
+        parser.error("--tiled-tiff needs an OUTPUT_PATH ending in .tif or .tiff")
+    if args.tiff_tile_size is not None and (
+        args.tiff_tile_size < 16 or args.tiff_tile_size % 16
+    ):
+        parser.error("--tiff-tile-size must be a positive multiple of 16")
+    save_options = _save_options_from_args(args)
+    if args.tiff_tile_size:
+        save_options["tile_width"] = save_options["tile_height"] = args.tiff_tile_size
+    if args.no_pyramid:
+        save_options["pyramid"] = False
+    reporter = _progress_reporter(args)
+    limits = _limits_from_args(parser, args)
 
     join_image(
         tiles_dir=args.tiles_dir,
         output_path=args.output_path,
         naming_format=args.naming_format,
+        save_options=save_options,
+        streaming=args.streaming,
+        recursive=args.recursive,
+        overlap=args.overlap,
+        padded=args.padded,
+        blend=args.blend,
+        progress=reporter,
+        limits=limits,
+        tiled_tiff=args.tiled_tiff,
     )
+    _finish_progress(reporter, args.stats, limits)
 
 
 if __name__ == "__main__":
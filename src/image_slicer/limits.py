@@ -0,0 +1,220 @@
+"""
+Per-job libvips resource limits.
+
+libvips keeps a process-wide operation cache and thread pool whose limits
+default to values that suit neither small containers nor large servers.
+:class:`VipsLimits` sets them for the duration of a job, restores the
+previous values afterwards, and records the high-water marks the job
+reached.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import Any
+
+import pyvips  # type: ignore[import-untyped]
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+def _current_rss() -> int | None:
+    """The resident set size of this process in bytes, where /proc has it."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * resource.getpagesize() if resource is not None else None
+
+
+def _peak_rss() -> int | None:
+    """The peak resident set size of this process in bytes, if known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class VipsLimits:
+    """
+    A context manager that sets libvips cache and thread limits for a job.
+
+    The limits are process-wide, so jobs running concurrently in one
+    process share them. Each limit left as None keeps its current value.
+    While the block runs, a background thread samples the number of
+    operations in the libvips cache and the resident set size of the
+    process.
+
+    Entering the same instance again while it is in use, for example from
+    overlapping calls on one ImageSlicer, joins the session already
+    running. The limits are restored and the high-water marks recorded
+    when the last of them exits.
+
+    Attributes:
+        cache_max (Optional[int]): The maximum number of operations to
+            cache.
+        cache_max_mem (Optional[int]): The maximum memory, in bytes, that
+            cached operations may hold.
+        cache_max_files (Optional[int]): The maximum number of files cached
+            operations may keep open.
+        concurrency (Optional[int]): The number of threads each libvips
+            pipeline uses.
+        cache_highwater (int): The most operations the cache held during
+            the last job.
+        rss_highwater (Optional[int]): The largest resident set size, in
+            bytes, sampled during the last job. Where the current size
+            cannot be read, this is the peak of the whole process so far.
+        seconds (float): The duration of the last job, from the first
+            entry to the last exit.
+    """
+
+    def __init__(
+        self,
+        cache_max: int | None = None,
+        cache_max_mem: int | None = None,
+        cache_max_files: int | None = None,
+        concurrency: int | None = None,
+        interval: float = 0.05,
+    ):
+        """
+        Args:
+            cache_max: The maximum number of operations to cache.
+            cache_max_mem: The maximum bytes of memory cached operations may
+                           hold.
+            cache_max_files: The maximum number of open files cached
+                             operations may hold.
+            concurrency: The number of threads per libvips pipeline.
+            interval: Seconds between samples of the high-water marks.
+
+        Raises:
+            ValueError: If a limit is negative, or concurrency is not
+                        positive.
+        """
+        for name, value in (
+            ("cache_max", cache_max),
+            ("cache_max_mem", cache_max_mem),
+            ("cache_max_files", cache_max_files),
+        ):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative.")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be a positive integer.")
+
+        self.cache_max = cache_max
+        self.cache_max_mem = cache_max_mem
+        self.cache_max_files = cache_max_files
+        self.concurrency = concurrency
+        self.interval = interval
+        self.cache_highwater = 0
+        self.rss_highwater: int | None = None
+        self.seconds = 0.0
+        self._start = 0.0
+        self._saved: tuple[int, int, int, int] | None = None
+        self._depth = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Only the settings are sent to worker processes.
+        return (
+            VipsLimits,
+            (
+                self.cache_max,
+                self.cache_max_mem,
+                self.cache_max_files,
+                self.concurrency,
+                self.interval,
+            ),
+        )
+
+    def _sample(self) -> None:
+        self.cache_highwater = max(self.cache_highwater, pyvips.cache_get_size())
+        rss = _current_rss()
+        if rss is not None:
+            self.rss_highwater = max(self.rss_highwater or 0, rss)
+
+    def _run_sampler(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> VipsLimits:
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                self._begin()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        with self._lock:
+            self._depth -= 1
+            if self._depth == 0:
+                self._end()
+
+    def _begin(self) -> None:
+        """Apply the limits and start sampling the high-water marks."""
+        self._saved = (
+            pyvips.cache_get_max(),
+            pyvips.cache_get_max_mem(),
+            pyvips.cache_get_max_files(),
+            pyvips.concurrency_get(),
+        )
+        if self.cache_max is not None:
+            pyvips.cache_set_max(self.cache_max)
+        if self.cache_max_mem is not None:
+            pyvips.cache_set_max_mem(self.cache_max_mem)
+        if self.cache_max_files is not None:
+            pyvips.cache_set_max_files(self.cache_max_files)
+        if self.concurrency is not None:
+            pyvips.concurrency_set(self.concurrency)
+
+        self.cache_highwater = 0
+        self.rss_highwater = None
+        self._start = time.perf_counter()
+        self._sample()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._run_sampler, daemon=True)
+        self._sampler.start()
+
+    def _end(self) -> None:
+        """Stop sampling and restore the previous limits."""
+        assert self._saved is not None and self._sampler is not None
+        self._stop.set()
+        self._sampler.join()
+        self._sampler = None
+        self._sample()
+        if self.rss_highwater is None:
+            self.rss_highwater = _peak_rss()
+        self.seconds = time.perf_counter() - self._start
+
+        cache_max, cache_max_mem, cache_max_files, concurrency = self._saved
+        self._saved = None
+        pyvips.cache_set_max(cache_max)
+        pyvips.cache_set_max_mem(cache_max_mem)
+        pyvips.cache_set_max_files(cache_max_files)
+        pyvips.concurrency_set(concurrency)
+
+    def report(self) -> dict[str, Any]:
+        """The limits applied and the high-water marks of the last job."""
+        return {
+            "cache_max": self.cache_max,
+            "cache_max_mem": self.cache_max_mem,
+            "cache_max_files": self.cache_max_files,
+            "concurrency": self.concurrency,
+            "cache_highwater": self.cache_highwater,
+            "rss_highwater": self.rss_highwater,
+            "seconds": self.seconds,
+        }
@@ -0,0 +1,254 @@
+"""
+Progress and timing instrumentation for slicing and joining.
+
+``ImageSlicer.slice`` and ``ImageJoiner.join`` accept a ``progress``
+callback, which is called with a :class:`TileEvent` for every tile sliced or
+a :class:`JoinEvent` as a join advances. :class:`ProgressReporter` is a
+ready-made callback that shows throughput and an ETA while a job runs and
+summarises where the time went when it ends.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, NamedTuple
+
+
+class TileEvent(NamedTuple):
+    """
+    Reports one tile handled by ``ImageSlicer.slice``.
+
+    Attributes:
+        row (int): The row number of the tile.
+        col (int): The column number of the tile.
+        status (str): "written" if the tile was encoded and written,
+            "linked" if it was hardlinked to an identical tile, "skipped" if
+            it was a blank tile left out, or "kept" if ``resume`` kept the
+            file from an earlier run.
+        crop_seconds (float): Time spent cropping the tile. Pixels are only
+            decoded here in streaming mode; otherwise they are computed on
+            demand and counted as encode time.
+        encode_seconds (float): Time spent computing and encoding the
+            tile's pixels, including blank detection.
+        write_seconds (float): Time spent writing or linking the tile file.
+        bytes_written (int): The number of bytes written for the tile.
+        done (int): The number of tiles handled so far, including this one.
+        total (int): The number of tiles in the grid.
+    """
+
+    row: int
+    col: int
+    status: str
+    crop_seconds: float = 0.0
+    encode_seconds: float = 0.0
+    write_seconds: float = 0.0
+    bytes_written: int = 0
+    done: int = 0
+    total: int = 0
+
+
+class JoinEvent(NamedTuple):
+    """
+    Reports the progress of ``ImageJoiner.join``.
+
+    Attributes:
+        stage (str): "open" while tiles are opened (and, in streaming mode,
+            decoded), then "write" while the output is computed and encoded.
+        done (int): Tiles opened, or pixels written, so far.
+        total (int): The number of tiles, or of output pixels.
+        seconds (float): The time since the join started.
+    """
+
+    stage: str
+    done: int
+    total: int
+    seconds: float
+
+
+def _counted(
+    callback: Callable[[TileEvent], None], total: int
+) -> Callable[[TileEvent], None]:
+    """
+    Wraps a progress callback to fill in ``done`` and ``total``.
+
+    Tile events arrive from worker threads; the callback is called with one
+    event at a time, in the order they are counted.
+    """
+    lock = threading.Lock()
+    done = 0
+
+    def report(event: TileEvent) -> None:
+        nonlocal done
+        with lock:
+            done += 1
+            callback(event._replace(done=done, total=total))
+
+    return report
+
+
+def _format_seconds(seconds: float) -> str:
+    """Formats a duration as H:MM:SS."""
+    minutes, secs = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+class ProgressReporter:
+    """
+    A progress callback that reports throughput, an ETA and a timing
+    breakdown.
+
+    Pass an instance as the ``progress`` argument of ``slice`` or ``join``.
+    With ``live`` set, a status line is rewritten on ``stream`` at most every
+    ``interval`` seconds; :meth:`summary` describes the finished job.
+
+    Attributes:
+        tiles (int): The number of tile events received.
+        statuses (dict[str, int]): The number of tiles with each status.
+        crop_seconds (float): The total crop time over all tiles.
+        encode_seconds (float): The total encode time over all tiles.
+        write_seconds (float): The total write time over all tiles.
+        bytes_written (int): The total bytes written.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str] | None = None,
+        live: bool = True,
+        interval: float = 0.5,
+    ):
+        """
+        Args:
+            stream: Where to write the live status line. Defaults to
+                    sys.stderr.
+            live: Whether to write a status line as events arrive.
+            interval: The minimum number of seconds between status lines.
+        """
+        self.stream = stream if stream is not None else sys.stderr
+        self.live = live
+        self.interval = interval
+        self.tiles = 0
+        self.statuses: dict[str, int] = {}
+        self.crop_seconds = 0.0
+        self.encode_seconds = 0.0
+        self.write_seconds = 0.0
+        self.bytes_written = 0
+        self._start = time.perf_counter()
+        self._last_line = 0.0
+        self._line_written = False
+        self._stage_seconds: dict[str, float] = {}
+        self._join_tiles = 0
+        self._join_pixels = 0
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """The seconds since the reporter was created."""
+        return time.perf_counter() - self._start
+
+    def __call__(self, event: TileEvent | JoinEvent) -> None:
+        with self._lock:
+            if isinstance(event, JoinEvent):
+                self._add_join_event(event)
+            else:
+                self._add_tile_event(event)
+
+    def _add_tile_event(self, event: TileEvent) -> None:
+        self.tiles += 1
+        self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+        self.crop_seconds += event.crop_seconds
+        self.encode_seconds += event.encode_seconds
+        self.write_seconds += event.write_seconds
+        self.bytes_written += event.bytes_written
+        if not self._due(event.done == event.total):
+            return
+        elapsed = max(self.elapsed(), 1e-9)
+        line = f"{self.tiles} tiles"
+        if event.total:
+            line = f"{event.done}/{event.total} tiles"
+        line += (
+            f"  {self.tiles / elapsed:.1f} tiles/s"
+            f"  {self.bytes_written / elapsed / 1e6:.1f} MB/s"
+        )
+        if 0 < event.done < event.total:
+            eta = elapsed / event.done * (event.total - event.done)
+            line += f"  ETA {_format_seconds(eta)}"
+        self._write_line(line)
+
+    def _add_join_event(self, event: JoinEvent) -> None:
+        self._stage_seconds[event.stage] = event.seconds
+        if event.stage == "open":
+            self._join_tiles = event.done
+        else:
+            self._join_pixels = event.done
+        if not self._due(event.done == event.total):
+            return
+        percent = 100 * event.done // max(event.total, 1)
+        line = f"{event.stage} {percent}%"
+        if event.stage == "open":
+            line = f"open {event.done}/{event.total} tiles"
+        elif 0 < event.done < event.total:
+            started = self._stage_seconds.get("open", 0.0)
+            rate = event.done / max(event.seconds - started, 1e-9)
+            eta = (event.total - event.done) / rate
+            line += f"  {rate / 1e6:.1f} Mpixels/s  ETA {_format_seconds(eta)}"
+        self._write_line(line)
+
+    def _due(self, final: bool) -> bool:
+        """Whether a status line should be written now."""
+        if not self.live:
+            return False
+        now = time.perf_counter()
+        if not final and now - self._last_line < self.interval:
+            return False
+        self._last_line = now
+        return True
+
+    def _write_line(self, line: str) -> None:
+        self.stream.write(f"\r{line}\033[K")
+        self.stream.flush()
+        self._line_written = True
+
+    def close(self) -> None:
+        """Ends the live status line, if one was written."""
+        if self._line_written:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._line_written = False
+
+    def summary(self) -> str:
+        """Describes the finished job and where its time went."""
+        elapsed = max(self.elapsed(), 1e-9)
+        lines = []
+        if self.tiles:
+            lines.append(
+                f"Sliced {self.tiles} tiles in {elapsed:.2f}s: "
+                f"{self.tiles / elapsed:.1f} tiles/s, "
+                f"{self.bytes_written / elapsed / 1e6:.1f} MB/s written"
+            )
+            lines.append(
+                "  "
+                + ", ".join(
+                    f"{count} {status}" for status, count in self.statuses.items()
+                )
+            )
+            busy = self.crop_seconds + self.encode_seconds + self.write_seconds
+            for name, seconds in (
+                ("crop", self.crop_seconds),
+                ("encode", self.encode_seconds),
+                ("write", self.write_seconds),
+            ):
+                share = 100 * seconds / busy if busy else 0
+                lines.append(f"  {name:<7}{seconds:9.2f}s {share:5.1f}%")
+        if self._stage_seconds:
+            opened = self._stage_seconds.get("open", 0.0)
+            written = self._stage_seconds.get("write", opened) - opened
+            lines.append(f"Joined {self._join_tiles} tiles in {elapsed:.2f}s")
+            lines.append(f"  {'open':<7}{opened:9.2f}s")
+            lines.append(
+                f"  {'write':<7}{written:9.2f}s "
+                f"{self._join_pixels / max(written, 1e-9) / 1e6:.1f} Mpixels/s"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,174 @@
+"""
+A local HTTP tile server, run with ``imslice serve``.
+
+Tiles are cut from one source image and encoded on demand through
+:meth:`ImageSlicer.get_tile`, so nothing is written to disk and popular
+tiles are answered from its LRU cache. ``GET /{row}/{col}`` returns a tile
+and ``GET /stats`` returns the cache counters as JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import mimetypes
+import re
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .cli import _add_save_option_arguments, _save_options_from_args
+from .slicer import ImageSlicer
+
+# An optional extension is allowed, so /3/7.png works as well as /3/7.
+_TILE_PATH = re.compile(r"/(\d+)/(\d+)(\.\w+)?")
+
+
+def make_server(
+    slicer: ImageSlicer,
+    tile_width: int,
+    tile_height: int,
+    fmt: str = ".png",
+    save_options: dict[str, Any] | None = None,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    quiet: bool = False,
+) -> ThreadingHTTPServer:
+    """
+    Creates a threaded HTTP server for the tiles of ``slicer``.
+
+    Call ``serve_forever()`` on the result to start serving, and
+    ``server_close()`` when done.
+
+    Args:
+        slicer: The ImageSlicer to cut tiles from. Its ``tile_cache`` holds
+                the encoded tiles.
+        tile_width: The width of each tile.
+        tile_height: The height of each tile.
+        fmt: The format to encode tiles to, as a file extension.
+        save_options: Options passed to the libvips saver for ``fmt``.
+        host: The address to listen on.
+        port: The port to listen on. 0 picks a free port.
+        quiet: If True, do not log each request to stderr.
+
+    Returns:
+        The server, bound but not yet serving.
+    """
+    content_type = mimetypes.guess_type(f"tile{fmt}")[0] or "application/octet-stream"
+
+    class TileHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path == "/stats":
+                body = json.dumps(slicer.tile_cache.stats()).encode()
+                self._send(body, "application/json")
+                return
+
+            match = _TILE_PATH.fullmatch(path)
+            if match is None:
+                self.send_error(404, "Expected /{row}/{col} or /stats")
+                return
+            ext = match[3]
+            if (
+                ext is not None
+                and ext.lower() != fmt.lower()
+                and mimetypes.guess_type(f"tile{ext}")[0] != content_type
+            ):
+                self.send_error(404, f"Tiles are served as {fmt}")
+                return
+            try:
+                data = slicer.get_tile(
+                    int(match[1]),
+                    int(match[2]),
+                    fmt,
+                    tile_width=tile_width,
+                    tile_height=tile_height,
+                    save_options=save_options,
+                )
+            except ValueError as error:
+                self.send_error(404, str(error))
+                return
+            self._send(data, content_type)
+
+        def _send(self, body: bytes, body_type: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", body_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, message: str, *args: Any) -> None:
+            if not quiet:
+                super().log_message(message, *args)
+
+    return ThreadingHTTPServer((host, port), TileHandler)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    The main function for ``imslice serve``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="imslice serve",
+        description="Serve the tiles of an image over HTTP, cut and encoded "
+        "on demand.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument("source_path", help="Path to the source image.")
+    parser.add_argument(
+        "-t",
+        "--tile-size",
+        type=int,
+        nargs=2,
+        default=[256, 256],
+        metavar=("WIDTH", "HEIGHT"),
+        help="The width and height of each tile. Default: 256 256",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="fmt",
+        default=".png",
+        help='The tile format, as a file extension. Default: ".png"',
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Default: 127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="Default: 8000")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        metavar="MB",
+        help="The most encoded tile data to keep in memory, in MB. Default: 64",
+    )
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request.")
+    _add_save_option_arguments(parser)
+
+    args = parser.parse_args(argv)
+    fmt = args.fmt if args.fmt.startswith(".") else f".{args.fmt}"
+    tile_width, tile_height = args.tile_size
+    slicer = ImageSlicer(args.source_path, tile_cache_size=args.cache_size * 2**20)
+    server = make_server(
+        slicer,
+        tile_width,
+        tile_height,
+        fmt,
+        _save_options_from_args(args),
+        args.host,
+        args.port,
+        args.quiet,
+    )
+
+    # The bound port, which differs from args.port when that is 0.
+    port = server.server_address[1]
+    sys.stderr.write(
+        f"Serving {math.ceil(slicer.height / tile_height)} rows by "
+        f"{math.ceil(slicer.width / tile_width)} columns of {fmt} tiles "
+        f"on http://{args.host}:{port}/{{row}}/{{col}}\n"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -4,21 +4,111 @@ Core image slicing logic.
 
 from __future__ import annotations
 
-import io
+import contextlib
+import functools
+import glob
+import hashlib
+import json
 import math
+import mmap
+import multiprocessing
 import os
 import re
-from collections.abc import Generator
+import string
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Container, Generator, Iterable, Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, NamedTuple, TypeVar
 
 import pyvips  # type: ignore[import-untyped]
 
+from .archive import TileArchive, TileArchiveWriter
+from .cache import TileCache
+from .limits import VipsLimits
+from .progress import JoinEvent, TileEvent, _counted
+
 try:
     from PIL import Image as PILImage
 except ImportError:
     PILImage = None  # type: ignore[assignment]
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# NumPy dtypes and the libvips band formats they map onto.
+_DTYPE_TO_FORMAT = {
+    "uint8": "uchar",
+    "int8": "char",
+    "uint16": "ushort",
+    "int16": "short",
+    "uint32": "uint",
+    "int32": "int",
+    "float32": "float",
+    "float64": "double",
+    "complex64": "complex",
+    "complex128": "dpcomplex",
+}
+
+_FORMAT_TO_DTYPE = {fmt: dtype for dtype, fmt in _DTYPE_TO_FORMAT.items()}
+
+# PIL modes whose raw bytes can be wrapped directly, as (format, interpretation).
+_PIL_MODES = {
+    "L": ("uchar", "b-w"),
+    "LA": ("uchar", "b-w"),
+    "RGB": ("uchar", "srgb"),
+    "RGBA": ("uchar", "srgb"),
+    "CMYK": ("uchar", "cmyk"),
+    "I;16": ("ushort", "grey16"),
+    "I": ("int", "b-w"),
+    "F": ("float", "b-w"),
+}
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Edge padding modes for overlapping tiles, as libvips extend modes.
+_PADDING_MODES = (None, "black", "white", "copy", "mirror", "repeat")
+
+# dzsave layouts: DeepZoom, XYZ ({z}/{y}/{x}), Zoomify and IIIF.
+PYRAMID_LAYOUTS = ("dz", "google", "zoomify", "iiif", "iiif3")
+
+# Saver options for joining to a tiled, pyramidal BigTIFF. save_options
+# passed to the join override them.
+TILED_TIFF_OPTIONS = {
+    "tile": True,
+    "tile_width": 256,
+    "tile_height": 256,
+    "pyramid": True,
+    "bigtiff": True,
+    "compression": "deflate",
+}
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+# The fields every manifest written by slice() has.
+_MANIFEST_FIELDS = (
+    "width",
+    "height",
+    "tile_width",
+    "tile_height",
+    "rows",
+    "cols",
+    "naming_format",
+    "tiles",
+)
+
 
 def _find_factors(n: int) -> list[tuple[int, int]]:
     """Finds all factor pairs of an integer."""
@@ -59,6 +149,357 @@ def _get_grid_from_tiles(
     return best_pair
 
 
+def _image_from_pil(image: Any) -> pyvips.Image:
+    """
+    Wraps the pixels of a PIL Image as a pyvips Image without encoding them.
+    Modes with no direct libvips equivalent are converted first.
+    """
+    if image.mode not in _PIL_MODES:
+        if image.mode == "1":
+            image = image.convert("L")
+        elif image.mode.startswith("I;16"):
+            image = image.convert("I")
+        elif "A" in image.getbands() or "transparency" in image.info:
+            image = image.convert("RGBA")
+        else:
+            image = image.convert("RGB")
+
+    band_format, interpretation = _PIL_MODES[image.mode]
+    vips_image = pyvips.Image.new_from_memory(
+        image.tobytes(),
+        image.width,
+        image.height,
+        len(image.getbands()),
+        band_format,
+    )
+    return vips_image.copy(interpretation=interpretation)
+
+
+def _image_from_array(array: Any) -> pyvips.Image:
+    """
+    Wraps an object exposing the NumPy array interface as a pyvips Image.
+
+    C-contiguous arrays are shared with libvips rather than copied. Arrays
+    must be (height, width) or (height, width, bands).
+    """
+    if np is None:
+        raise ValueError("NumPy is required to load array sources.")
+
+    array = np.asarray(array)
+    if array.dtype == np.bool_:
+        array = array.astype(np.uint8) * 255
+    if array.ndim == 2:
+        array = array[:, :, np.newaxis]
+    if array.ndim != 3:
+        raise ValueError(
+            "Array sources must have shape (height, width) or "
+            f"(height, width, bands), not {array.shape}."
+        )
+
+    dtype = array.dtype.newbyteorder("=")
+    if dtype.name not in _DTYPE_TO_FORMAT:
+        raise ValueError(f"Unsupported array dtype: {array.dtype}")
+    array = np.ascontiguousarray(array, dtype=dtype)
+
+    height, width, bands = array.shape
+    band_format = _DTYPE_TO_FORMAT[dtype.name]
+    image = pyvips.Image.new_from_memory(array, width, height, bands, band_format)
+    if band_format == "ushort":
+        image = image.copy(interpretation="grey16" if bands < 3 else "rgb16")
+    return image
+
+
+def _tile_image(tile: Any) -> pyvips.Image:
+    """
+    Converts a tile given to :func:`join_tiles` to a pyvips Image.
+
+    Encoded bytes are decoded lazily by libvips, and arrays are shared
+    rather than copied, so no tile is decoded before the output needs it.
+    """
+    if isinstance(tile, pyvips.Image):
+        return tile
+    if isinstance(tile, (bytes, bytearray, memoryview)):
+        return pyvips.Image.new_from_buffer(tile, "")
+    if PILImage is not None and isinstance(tile, PILImage.Image):
+        return _image_from_pil(tile)
+    if hasattr(tile, "__array_interface__") or hasattr(tile, "__array__"):
+        return _image_from_array(tile)
+    raise ValueError(
+        "Tiles must be pyvips Images, encoded bytes, PIL Images or objects "
+        f"exposing the NumPy array interface, not {type(tile).__name__}."
+    )
+
+
+def _compile_naming_format(naming_format: str) -> re.Pattern[str]:
+    """
+    Compiles a tile naming format into a regex with ``row`` and ``col`` groups.
+
+    Literal text is escaped, and format specs such as ``{row:03d}`` are
+    accepted, since zero-padded numbers still parse as integers.
+
+    Raises:
+        ValueError: If the format uses a placeholder other than {row} and
+                    {col}, or does not use both.
+    """
+    pattern = "^"
+    seen = set()
+    for literal, field, _, _ in string.Formatter().parse(naming_format):
+        pattern += re.escape(literal)
+        if field is None:
+            continue
+        if field not in ("row", "col"):
+            raise ValueError(
+                f"Unsupported placeholder {{{field}}} in naming format: "
+                f"{naming_format}"
+            )
+        pattern += rf"(?P={field})" if field in seen else rf"(?P<{field}>\d+)"
+        seen.add(field)
+    if seen != {"row", "col"}:
+        raise ValueError(
+            f"Naming format must contain {{row}} and {{col}}: {naming_format}"
+        )
+    return re.compile(pattern + "$")
+
+
+def _scan_files(path: str, recursive: bool = False) -> Iterator[tuple[str, str]]:
+    """
+    Yields (name, path) for the files under ``path``, where name is relative
+    to ``path`` with "/" separators.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no extra stat is needed per entry on most platforms.
+    """
+    stack = [("", path)]
+    while stack:
+        prefix, directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield prefix + entry.name, entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append((prefix + entry.name + "/", entry.path))
+
+
+def _write_manifest(output_dir: str, manifest: dict[str, Any]) -> None:
+    """Atomically writes a slice manifest into ``output_dir``."""
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def _atomic_path(path: str) -> str:
+    """
+    Returns the temporary path a file is written to before being renamed to
+    ``path``. It keeps the extension so libvips picks the same saver.
+    """
+    return f"{path}.partial{os.path.splitext(path)[1]}"
+
+
+def _write_atomically(tile: pyvips.Image, path: str, options: dict[str, Any]) -> None:
+    """
+    Writes a tile to a temporary file and renames it to ``path``, so an
+    interrupted write never leaves a truncated tile behind.
+    """
+    temp_path = _atomic_path(path)
+    tile.write_to_file(temp_path, **options)
+    os.replace(temp_path, path)
+
+
+def _is_current(path: str, min_mtime: float | None, size: int | None) -> bool:
+    """
+    Whether the tile at ``path`` can be kept by a resumed slice: it exists,
+    is not empty, matches the recorded size if there is one, and is not
+    older than the source.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    if st.st_size == 0 or (size is not None and st.st_size != size):
+        return False
+    return min_mtime is None or st.st_mtime >= min_mtime
+
+
+def _uniform_fill(tile: pyvips.Image, tolerance: float = 0) -> list[float] | None:
+    """
+    Returns the per-band value of a uniform tile, or None if the tile is not
+    uniform.
+
+    A tile is uniform if, in every band, its maximum and minimum differ by
+    at most ``tolerance``. The value is the band mean, rounded for integer
+    band formats. All the statistics come from a single pass over the tile.
+    """
+    stats = tile.stats().tolist()
+    # Row 0 summarises all bands; each following row is one band, starting
+    # with its min, max, sum, sum of squares and mean.
+    bands = stats[1:]
+    if any(band[1] - band[0] > tolerance for band in bands):
+        return None
+    if tile.format in ("float", "double", "complex", "dpcomplex"):
+        return [band[4] for band in bands]
+    return [round(band[4]) for band in bands]
+
+
+def _link_or_copy(source: str, path: str, data: bytes | None = None) -> None:
+    """
+    Atomically places a hardlink to ``source`` at ``path``, copying the file
+    instead where hardlinks are not supported.
+    """
+    temp_path = _atomic_path(path)
+    try:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        os.link(source, temp_path)
+    except OSError:
+        if data is None:
+            with open(source, "rb") as f:
+                data = f.read()
+        with open(temp_path, "wb") as f:
+            f.write(data)
+    os.replace(temp_path, path)
+
+
+def _file_record(path: str, row: int, col: int) -> list[Any]:
+    """Builds the manifest record of an existing tile file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return [row, col, len(data), hashlib.sha256(data).hexdigest()]
+
+
+def _read_manifest(tiles_dir: str | Path) -> dict[str, Any] | None:
+    """
+    Reads the slice manifest in ``tiles_dir``, or returns None if there is
+    no usable manifest.
+    """
+    try:
+        with open(os.path.join(tiles_dir, MANIFEST_FILENAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if any(field not in manifest for field in _MANIFEST_FIELDS):
+        return None
+    return manifest
+
+
+def _tile_rect(
+    left: int,
+    top: int,
+    width: int,
+    height: int,
+    overlap: int,
+    padded: bool,
+    image_width: int,
+    image_height: int,
+) -> tuple[int, int, int, int]:
+    """
+    Grows a grid cell by ``overlap`` pixels on every side.
+
+    If ``padded`` is True, the rectangle is in the coordinates of the image
+    embedded in an ``overlap`` pixel border, so it never needs clipping.
+    Otherwise it is clipped to the image.
+    """
+    if padded:
+        return left, top, width + 2 * overlap, height + 2 * overlap
+    x0, y0 = max(0, left - overlap), max(0, top - overlap)
+    x1 = min(image_width, left + width + overlap)
+    y1 = min(image_height, top + height + overlap)
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def _check_overlap(
+    overlap: int, padding: str | None, tile_width: int, tile_height: int
+) -> None:
+    """Validates a tile overlap and padding mode."""
+    if not isinstance(overlap, int) or overlap < 0:
+        raise ValueError("overlap must be a non-negative integer.")
+    if overlap > min(tile_width, tile_height):
+        raise ValueError("overlap must not exceed the tile width or height.")
+    if padding not in _PADDING_MODES:
+        raise ValueError(f"padding must be one of {', '.join(_PADDING_MODES[1:])}.")
+
+
+def _check_workers(workers: int, name: str = "workers") -> None:
+    """Validates a worker or process count."""
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"{name} must be a positive integer.")
+
+
+def _imap(func: Callable[[T], R], items: Iterable[T], workers: int = 1) -> Iterator[R]:
+    """
+    Maps a function over an iterable, optionally using a thread pool.
+
+    Results are yielded in input order. At most ``2 * workers`` calls are in
+    flight at any time, so the input iterable is consumed lazily and memory
+    stays bounded however many items there are. libvips releases the GIL
+    while encoding, so threads give real parallelism here.
+    """
+    _check_workers(workers)
+    if workers == 1:
+        yield from map(func, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[R]] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _timed(
+    tiles: Iterator[tuple[pyvips.Image, int, int]],
+) -> Iterator[tuple[pyvips.Image, int, int, float]]:
+    """Adds the seconds taken to produce each tile to the tuple."""
+    while True:
+        start = time.perf_counter()
+        try:
+            tile, row, col = next(tiles)
+        except StopIteration:
+            return
+        yield tile, row, col, time.perf_counter() - start
+
+
+def _with_limits(method: Callable[..., R]) -> Callable[..., R]:
+    """Runs a method inside ``self.limits``, if it is set."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> R:
+        if self.limits is None:
+            return method(self, *args, **kwargs)
+        with self.limits:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _WriteOptions(NamedTuple):
+    """
+    The per-slice options of :meth:`ImageSlicer._write_tiles`, forwarded
+    as one value to worker processes. They are described in
+    :meth:`ImageSlicer.slice`; ``record`` is its ``manifest``.
+    """
+
+    workers: int = 1
+    save_options: dict[str, Any] | None = None
+    record: bool = False
+    resume: bool = False
+    blank: str | None = None
+    blank_tolerance: float = 0
+    dedupe: bool = False
+    overlap: int = 0
+    padding: str | None = None
+
+
 class ImageSlicer:
     """
     A class to slice a large image into smaller tiles.
@@ -68,44 +509,66 @@ class ImageSlicer:
 
     Attributes:
         source_path (Optional[str]): Path to the source image (if loaded from file).
+        streaming (bool): Whether the source is read top to bottom in strips.
         image (pyvips.Image): The pyvips Image object.
         width (int): The width of the source image.
         height (int): The height of the source image.
+        limits (Optional[VipsLimits]): The libvips limits applied while
+            slicing, which hold the high-water marks of the last job.
+        tile_cache (TileCache): The cache of tiles encoded by
+            :meth:`get_tile`.
     """
 
-    def __init__(self, source: str | Any):
+    def __init__(
+        self,
+        source: str | Any,
+        streaming: bool = False,
+        limits: VipsLimits | None = None,
+        tile_cache_size: int = 64 * 2**20,
+    ):
         """
         Initializes the ImageSlicer.
 
         Args:
-            source: Either a path to the image file or a PIL Image object.
+            source: A path to the image file, a PIL Image object, or an
+                    object exposing the NumPy array interface with shape
+                    (height, width) or (height, width, bands). In-memory
+                    sources are wrapped directly, without re-encoding.
+            streaming: If True, the source file is opened for sequential
+                       access and read top to bottom in strips one tile row
+                       high. Each tile is produced as soon as its strip is
+                       decoded, so peak memory is bounded by one tile row
+                       rather than the whole image. Tiles are always produced
+                       in row order in this mode.
+            limits: libvips cache and thread limits to apply while
+                    :meth:`slice` or :meth:`slice_to_archive` runs. The
+                    previous limits are restored afterwards.
+            tile_cache_size: The most bytes of encoded tiles that
+                             :meth:`get_tile` keeps. Defaults to 64 MiB.
 
         Raises:
             pyvips.error.Error: If the source is not a valid image.
-            ValueError: If PIL Image is provided but Pillow is not installed.
+            ValueError: If the source type, array shape or dtype is not
+                        supported.
         """
+        self.streaming = streaming
+        self.limits = limits
+        self.tile_cache = TileCache(tile_cache_size)
         if isinstance(source, str):
             self.source_path: str | None = source
-            self.image = pyvips.Image.new_from_file(source, access="random")
+            access = "sequential" if streaming else "random"
+            self.image = pyvips.Image.new_from_file(source, access=access)
         elif PILImage is not None and isinstance(source, PILImage.Image):
             self.source_path = None
-            # Convert PIL Image to pyvips Image
-            buffer = io.BytesIO()
-            source.save(buffer, format="PNG")
-            buffer.seek(0)
-            self.image = pyvips.Image.new_from_buffer(
-                buffer.getvalue(), "", access="random"
-            )
+            self.image = _image_from_pil(source)
+        elif hasattr(source, "__array_interface__") or hasattr(source, "__array__"):
+            self.source_path = None
+            self.image = _image_from_array(source)
         else:
-            # Handle invalid types or PIL not available
-            if PILImage is None:
-                raise ValueError(
-                    "source must be either a string path or a PIL Image object"
-                )
-            else:
-                raise ValueError(
-                    "source must be either a string path or a PIL Image object"
-                )
+            raise ValueError(
+                "source must be either a string path or a PIL Image object, "
+                "or an object exposing the NumPy array interface"
+            )
 
         self.width = self.image.width
         self.height = self.image.height
@@ -140,6 +603,27 @@ class ImageSlicer:
             "or 'tile_width' and 'tile_height'."
         )
 
+    def _resolve_tile_dimensions(
+        self,
+        cols: int | None = None,
+        rows: int | None = None,
+        number_of_tiles: int | None = None,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+    ) -> tuple[int, int]:
+        """
+        Validates the slicing criteria and returns the tile width and height.
+        """
+        if not any([cols, rows, number_of_tiles, tile_width, tile_height]):
+            raise ValueError(
+                "Slicing criteria not provided. Please specify 'cols' and "
+                "'rows', 'number_of_tiles', or 'tile_width' and 'tile_height'."
+            )
+
+        return self._calculate_tile_dimensions(
+            cols, rows, number_of_tiles, tile_width, tile_height
+        )
+
     def _generate_tile_info(
         self,
         cols: int | None = None,
@@ -147,34 +631,424 @@ class ImageSlicer:
         number_of_tiles: int | None = None,
         tile_width: int | None = None,
         tile_height: int | None = None,
+        row_band: tuple[int, int] | None = None,
+        overlap: int = 0,
+        padded: bool = False,
+        positions: Iterable[tuple[int, int]] | None = None,
     ) -> Generator[tuple[int, int, int, int, int, int], None, None]:
         """
         A private generator for tile parameters.
 
+        Args:
+            row_band: An optional (first, stop) range of tile rows to limit
+                      the grid to. Row numbers are kept relative to the full
+                      grid.
+            positions: The (row, col) grid positions of the tiles to
+                       generate, in row-major order, as returned by
+                       :meth:`_select_tiles`. Defaults to the whole grid.
+            overlap: The number of pixels to grow each grid cell by on every
+                     side.
+            padded: Whether the tiles are cropped from the image embedded in
+                    an ``overlap`` pixel border. See :func:`_tile_rect`.
+
         Yields:
             A tuple containing (left, top, width, height, row_num, col_num)
             for each tile in the grid.
         """
-        if not any([cols, rows, number_of_tiles, tile_width, tile_height]):
+        tile_w, tile_h = self._resolve_tile_dimensions(
+            cols, rows, number_of_tiles, tile_width, tile_height
+        )
+
+        grid_rows = math.ceil(self.height / tile_h)
+        grid_cols = math.ceil(self.width / tile_w)
+        first_row, stop_row = row_band or (0, grid_rows)
+        if positions is None:
+            positions = (
+                (row, col)
+                for row in range(first_row, min(stop_row, grid_rows))
+                for col in range(grid_cols)
+            )
+        elif row_band is not None:
+            positions = (p for p in positions if first_row <= p[0] < stop_row)
+
+        for row_num, col_num in positions:
+            left = col_num * tile_w
+            top = row_num * tile_h
+            width = min(tile_w, self.width - left)
+            height = min(tile_h, self.height - top)
+            if overlap:
+                left, top, width, height = _tile_rect(
+                    left,
+                    top,
+                    width,
+                    height,
+                    overlap,
+                    padded,
+                    self.width,
+                    self.height,
+                )
+            yield (left, top, width, height, row_num, col_num)
+
+    def _select_tiles(
+        self,
+        tile_width: int,
+        tile_height: int,
+        region: tuple[int, int, int, int] | None = None,
+        tile_coords: Iterable[tuple[int, int]] | None = None,
+    ) -> list[tuple[int, int]] | None:
+        """
+        Returns the grid positions of the tiles intersecting ``region`` and
+        listed in ``tile_coords``, in row-major order, or None if neither is
+        given.
+
+        Raises:
+            ValueError: If ``region`` does not intersect the image, or a
+                        coordinate is outside the grid.
+        """
+        if region is None and tile_coords is None:
+            return None
+
+        grid_rows = math.ceil(self.height / tile_height)
+        grid_cols = math.ceil(self.width / tile_width)
+        selected: set[tuple[int, int]] | None = None
+        if region is not None:
+            left, top, width, height = region
+            right = min(left + width, self.width)
+            bottom = min(top + height, self.height)
+            left, top = max(left, 0), max(top, 0)
+            if left >= right or top >= bottom:
+                raise ValueError(
+                    f"region {tuple(region)} does not intersect the "
+                    f"{self.width}x{self.height} image."
+                )
+            selected = {
+                (row, col)
+                for row in range(top // tile_height, math.ceil(bottom / tile_height))
+                for col in range(left // tile_width, math.ceil(right / tile_width))
+            }
+
+        if tile_coords is not None:
+            coords = set()
+            for row, col in tile_coords:
+                if not (0 <= row < grid_rows and 0 <= col < grid_cols):
+                    raise ValueError(
+                        f"Tile ({row}, {col}) is outside the {grid_rows} row by "
+                        f"{grid_cols} column grid."
+                    )
+                coords.add((row, col))
+            selected = coords if selected is None else selected & coords
+
+        assert selected is not None
+        return sorted(selected)
+
+    def _crop_tiles(
+        self,
+        tile_info: Iterable[tuple[int, int, int, int, int, int]],
+        overlap: int = 0,
+        padding: str | None = None,
+    ) -> Generator[tuple[pyvips.Image, int, int], None, None]:
+        """
+        Crops each tile described by ``tile_info`` from the source.
+
+        If ``padding`` is set, the tiles are cropped from the source embedded
+        in an ``overlap`` pixel border filled with that libvips extend mode.
+
+        In streaming mode each tile is fetched into memory through a single
+        region on the sequentially-opened source. libvips then only keeps the
+        strip of lines covering the current tile row, so tiles must be
+        requested top to bottom.
+        """
+        image = self.image
+        if padding is not None and overlap:
+            image = image.embed(
+                overlap,
+                overlap,
+                image.width + 2 * overlap,
+                image.height + 2 * overlap,
+                extend=padding,
+            )
+
+        if not self.streaming:
+            for left, top, width, height, row, col in tile_info:
+                yield image.crop(left, top, width, height), row, col
+            return
+
+        region = pyvips.Region.new(image)
+        for left, top, width, height, row, col in tile_info:
+            data = region.fetch(left, top, width, height)
+            tile = pyvips.Image.new_from_memory(
+                data, width, height, image.bands, image.format
+            ).copy(interpretation=image.interpretation)
+            yield tile, row, col
+
+    def _write_tiles(
+        self,
+        output_dir: str,
+        naming_format: str,
+        tile_info: Iterable[tuple[int, int, int, int, int, int]],
+        write_options: _WriteOptions,
+        sizes: dict[tuple[int, int], int] | None = None,
+        progress: Callable[[TileEvent], None] | None = None,
+    ) -> tuple[int, list[list[Any]]]:
+        """
+        Crops, encodes and writes the given tiles, returning the number of
+        tiles written or linked and the manifest records.
+
+        Each tile is written to a temporary file and renamed into place, so
+        a tile file is never left half written. The fields named below are
+        those of ``write_options``.
+
+        If ``record`` is True, each tile is encoded in memory first and a
+        manifest record of [row, col, size, sha256] is returned for it, or
+        [row, col, fill] for a blank tile that was skipped. Otherwise the
+        list of records is empty.
+
+        If ``resume`` is True, tiles whose files are current are not cropped
+        or encoded again. ``sizes`` maps (row, col) to the byte size recorded
+        by a previous manifest, if there is one. Temporary files left by an
+        interrupted run are removed.
+
+        ``blank`` and ``dedupe`` are described in :meth:`slice`. Tiles are
+        only linked to copies written by this call. ``overlap`` and
+        ``padding`` must match those ``tile_info`` was generated with.
+
+        If ``progress`` is given, it is called with a :class:`TileEvent` for
+        every tile. Tiles are then encoded in memory, so that encode and
+        write time can be told apart.
+        """
+        workers = write_options.workers
+        options = write_options.save_options or {}
+        record = write_options.record
+        resume = write_options.resume
+        blank = write_options.blank
+        blank_tolerance = write_options.blank_tolerance
+        dedupe = write_options.dedupe
+        overlap = write_options.overlap
+        padding = write_options.padding
+        suffix = os.path.splitext(naming_format)[1]
+        kept: list[tuple[int, int, str]] = []
+        buffered = record or dedupe or blank == "link" or progress is not None
+        # Maps a blank tile's (width, height, fill) or an encoded tile's
+        # checksum to the first file written with it and its size.
+        written: dict[Any, tuple[str, int, str]] = {}
+        lock = threading.Lock()
+
+        def tile_path(row: int, col: int) -> str:
+            return os.path.join(output_dir, naming_format.format(row=row, col=col))
+
+        if resume:
+            min_mtime = None
+            if self.source_path is not None:
+                min_mtime = os.stat(self.source_path).st_mtime
+            pending = []
+            for info in tile_info:
+                row, col = info[4], info[5]
+                path = tile_path(row, col)
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(_atomic_path(path))
+                size = sizes.get((row, col)) if sizes is not None else None
+                if _is_current(path, min_mtime, size):
+                    kept.append((row, col, path))
+                    if progress is not None:
+                        progress(TileEvent(row, col, "kept"))
+                else:
+                    pending.append(info)
+            tile_info = pending
+
+        def write_tile(
+            item: tuple[pyvips.Image, int, int, float],
+        ) -> tuple[bool, list[Any] | None]:
+            tile, row, col, crop_seconds = item
+            output_path = tile_path(row, col)
+            temp_path = _atomic_path(output_path)
+            start = time.perf_counter()
+
+            def report(status: str, size: int = 0, encoded: float = 0.0) -> None:
+                if progress is not None:
+                    now = time.perf_counter()
+                    encode_seconds = (encoded or now) - start
+                    write_seconds = now - encoded if encoded else 0.0
+                    progress(
+                        TileEvent(
+                            row,
+                            col,
+                            status,
+                            crop_seconds,
+                            encode_seconds,
+                            write_seconds,
+                            size,
+                        )
+                    )
+
+            blank_key = None
+            if blank is not None:
+                fill = _uniform_fill(tile, blank_tolerance)
+                if fill is not None and blank == "skip":
+                    report("skipped")
+                    return False, [row, col, fill]
+                if fill is not None:
+                    blank_key = (tile.width, tile.height, *fill)
+                    with lock:
+                        existing = written.get(blank_key)
+                    if existing is not None:
+                        encoded = time.perf_counter()
+                        _link_or_copy(existing[0], output_path)
+                        report("linked", encoded=encoded)
+                        return True, [row, col, existing[1], existing[2]]
+
+            if not buffered:
+                _write_atomically(tile, output_path, options)
+                return True, None
+
+            data = tile.write_to_buffer(suffix, **options)
+            checksum = hashlib.sha256(data).hexdigest()
+            encoded = time.perf_counter()
+            with lock:
+                existing = written.get(checksum) if dedupe else None
+            if existing is not None:
+                _link_or_copy(existing[0], output_path, data)
+                report("linked", encoded=encoded)
+            else:
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, output_path)
+                with lock:
+                    entry = (output_path, len(data), checksum)
+                    if blank_key is not None:
+                        written.setdefault(blank_key, entry)
+                    if dedupe:
+                        written.setdefault(checksum, entry)
+                report("written", len(data), encoded)
+            return True, [row, col, len(data), checksum]
+
+        tiles = _timed(self._crop_tiles(tile_info, overlap, padding))
+        count = 0
+        records = []
+        for wrote, tile_record in _imap(write_tile, tiles, workers):
+            count += wrote
+            if record and tile_record is not None:
+                records.append(tile_record)
+        if record:
+            records.extend(_file_record(path, row, col) for row, col, path in kept)
+        return count, records
+
+    def _slice_with_processes(
+        self,
+        output_dir: str,
+        naming_format: str,
+        tile_width: int,
+        tile_height: int,
+        processes: int,
+        write_options: _WriteOptions,
+        sizes: dict[tuple[int, int], int] | None = None,
+        progress: Callable[[TileEvent], None] | None = None,
+        positions: list[tuple[int, int]] | None = None,
+    ) -> tuple[int, list[list[Any]]]:
+        """
+        Shards the grid into bands of tile rows and slices each band in a
+        separate process, returning the number of tiles written and the
+        manifest records gathered from every band.
+
+        Tile events from the processes are passed to ``progress`` in this
+        process as they arrive. If ``positions`` is given, only those tiles
+        are sliced, and the bands are split over the rows they occupy.
+        """
+        if self.source_path is None:
             raise ValueError(
-                "Slicing criteria not provided. Please specify 'cols' and "
-                "'rows', 'number_of_tiles', or 'tile_width' and 'tile_height'."
+                "processes requires the image to be loaded from a file path."
             )
 
-        tile_w, tile_h = self._calculate_tile_dimensions(
-            cols, rows, number_of_tiles, tile_width, tile_height
-        )
+        grid_rows: list[int] | range = range(math.ceil(self.height / tile_height))
+        if positions is not None:
+            grid_rows = sorted({row for row, _ in positions})
+        count = len(grid_rows)
+        bands = [
+            (
+                grid_rows[i * count // processes],
+                grid_rows[(i + 1) * count // processes - 1] + 1,
+            )
+            for i in range(processes)
+            if i * count // processes < (i + 1) * count // processes
+        ]
+        if not bands:
+            return 0, []
+        band_positions = [
+            (
+                None
+                if positions is None
+                else [p for p in positions if first <= p[0] < stop]
+            )
+            for first, stop in bands
+        ]
+        band_sizes: list[dict[tuple[int, int], int] | None] = [
+            (
+                None
+                if sizes is None
+                else {k: v for k, v in sizes.items() if first <= k[0] < stop}
+            )
+            for first, stop in bands
+        ]
+
+        # libvips is not fork-safe once its thread pool has started.
+        context = multiprocessing.get_context("spawn")
+        manager = context.Manager() if progress is not None else None
+        events = manager.Queue() if manager is not None else None
+        try:
+            with ProcessPoolExecutor(len(bands), mp_context=context) as executor:
+                futures = [
+                    executor.submit(
+                        _slice_band,
+                        self.source_path,
+                        output_dir,
+                        naming_format,
+                        tile_width=tile_width,
+                        tile_height=tile_height,
+                        row_band=band,
+                        streaming=self.streaming,
+                        write_options=write_options,
+                        sizes=band_size,
+                        events=events,
+                        limits=self.limits,
+                        positions=band_position,
+                    )
+                    for band, band_size, band_position in zip(
+                        bands, band_sizes, band_positions
+                    )
+                ]
+                if events is None or progress is None:
+                    wait(futures)
+                else:
+                    while wait(futures, timeout=0.1).not_done or not events.empty():
+                        while not events.empty():
+                            progress(events.get())
+        finally:
+            if manager is not None:
+                manager.shutdown()
+
+        written = 0
+        records = []
+        failures = []
+        for band, future in zip(bands, futures):
+            error = future.exception()
+            if error is None:
+                band_written, band_records = future.result()
+                written += band_written
+                records.extend(band_records)
+            else:
+                failures.append((band, error))
 
-        for r in range(0, self.height, tile_h):
-            for c in range(0, self.width, tile_w):
-                left = c
-                top = r
-                width = min(tile_w, self.width - c)
-                height = min(tile_h, self.height - r)
-                row_num = r // tile_h
-                col_num = c // tile_w
-                yield (left, top, width, height, row_num, col_num)
+        if failures:
+            details = "; ".join(
+                f"rows {first}-{stop - 1}: {error}" for (first, stop), error in failures
+            )
+            raise RuntimeError(
+                f"{len(failures)} of {len(bands)} slicing processes failed: "
+                f"{details}"
+            ) from failures[0][1]
+
+        return written, records
 
+    @_with_limits
     def slice(
         self,
         output_dir: str,
@@ -184,7 +1058,20 @@ class ImageSlicer:
         number_of_tiles: int | None = None,
         tile_width: int | None = None,
         tile_height: int | None = None,
-    ) -> None:
+        workers: int = 1,
+        processes: int = 1,
+        save_options: dict[str, Any] | None = None,
+        manifest: bool = False,
+        resume: bool = False,
+        blank: str | None = None,
+        blank_tolerance: float = 0,
+        dedupe: bool = False,
+        overlap: int = 0,
+        padding: str | None = None,
+        progress: Callable[[TileEvent], None] | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        tile_coords: Iterable[tuple[int, int]] | None = None,
+    ) -> int:
         """
         Slices the image into tiles and saves them to a directory.
 
@@ -205,15 +1092,316 @@ class ImageSlicer:
                              override cols and rows.
             tile_width: The desired width of each tile.
             tile_height: The desired height of each tile.
+            workers: The number of threads used to encode and write tiles
+                     concurrently. Defaults to 1 (sequential).
+            processes: The number of processes to shard the grid across.
+                       Each process opens the source itself and slices a
+                       disjoint band of tile rows with ``workers`` threads.
+                       Requires the image to be loaded from a file path.
+                       Defaults to 1 (no extra processes).
+            save_options: Options passed to the libvips saver selected by
+                          the tile extension, for example
+                          ``{"compression": 1}`` for fast PNG output or
+                          ``{"Q": 85, "strip": True}`` for JPEG.
+            manifest: If True, also write a ``manifest.json`` recording the
+                      source dimensions, tile geometry, naming format and the
+                      byte size and SHA-256 checksum of every tile.
+                      ImageJoiner uses it to plan the join without listing
+                      the directory.
+            resume: If True, keep tiles already in ``output_dir`` that are
+                    current and only crop and encode the rest. A tile is
+                    current if its file exists, is not older than the source
+                    file and, when a manifest from an earlier run with the
+                    same geometry is present, has the recorded size. Use the
+                    same slicing parameters as the interrupted run.
+            blank: What to do with uniform tiles, detected from per-band
+                   min/max statistics before encoding. "skip" writes no file
+                   and records the fill value in the manifest, which implies
+                   ``manifest=True``; ImageJoiner recreates the tile from it.
+                   "link" encodes one copy per size and fill value and
+                   hardlinks the other uniform tiles to it. Defaults to None
+                   (uniform tiles are written like any other).
+            blank_tolerance: The largest difference between the minimum and
+                             maximum of a band for a tile to count as
+                             uniform. Tiles within a nonzero tolerance are
+                             rebuilt from their mean. Defaults to 0.
+            dedupe: If True, hardlink tiles whose encoded bytes are identical
+                    to a tile already written, instead of writing another
+                    copy. With ``processes``, duplicates are only found
+                    within each process's band of rows.
+            overlap: Grow each tile by this many pixels on every side, so
+                     neighbouring tiles share a halo. The grid, and so the
+                     row and column numbers, is unchanged. Defaults to 0.
+            padding: How to fill the halo of tiles at the image edges: one
+                     of "black", "white", "copy", "mirror" or "repeat". With
+                     padding every tile has the same size; without it, the
+                     halo is clipped at the image edges. Defaults to None.
+            progress: A callback called with a :class:`TileEvent` for every
+                      tile, giving its crop, encode and write times, the
+                      bytes written and the number of tiles done out of the
+                      total. It is called from worker threads, one event at
+                      a time. With ``processes``, events are relayed to this
+                      process. See :class:`ProgressReporter`.
+            region: A (left, top, width, height) box in pixels. Only the
+                    tiles of the grid that intersect it are cropped and
+                    written, keeping their row and column numbers in the
+                    full grid. The box is clipped to the image.
+            tile_coords: The (row, col) positions of the only tiles to
+                         write. With ``region``, only tiles selected by both
+                         are written. A manifest then lists just these tiles.
+
+        Returns:
+            The number of tiles written or linked. Blank tiles that were
+            skipped and tiles kept by ``resume`` are not counted.
+
+        Raises:
+            ValueError: If ``blank`` is not None, "skip" or "link", if
+                        ``overlap`` or ``padding`` is invalid, if ``region``
+                        does not intersect the image, or if a tile
+                        coordinate is outside the grid.
+            RuntimeError: If any of the slicing processes failed. Every band
+                          is attempted before the error is raised.
         """
-        os.makedirs(output_dir, exist_ok=True)
-        for left, top, width, height, row, col in self._generate_tile_info(
+        _check_workers(workers)
+        _check_workers(processes, "processes")
+        if blank not in (None, "skip", "link"):
+            raise ValueError("blank must be None, 'skip' or 'link'.")
+        # Skipped tiles can only be rebuilt from the manifest.
+        manifest = manifest or blank == "skip"
+        tile_w, tile_h = self._resolve_tile_dimensions(
             cols, rows, number_of_tiles, tile_width, tile_height
-        ):
-            tile = self.image.crop(left, top, width, height)
-            filename = naming_format.format(row=row, col=col)
-            output_path = os.path.join(output_dir, filename)
-            tile.write_to_file(output_path)
+        )
+        _check_overlap(overlap, padding, tile_w, tile_h)
+        positions = self._select_tiles(tile_w, tile_h, region, tile_coords)
+        os.makedirs(output_dir, exist_ok=True)
+
+        sizes = None
+        previous = _read_manifest(output_dir) if resume else None
+        if previous is not None:
+            geometry = (
+                self.width,
+                self.height,
+                tile_w,
+                tile_h,
+                naming_format,
+                overlap,
+                padding,
+            )
+            if geometry == (
+                previous["width"],
+                previous["height"],
+                previous["tile_width"],
+                previous["tile_height"],
+                previous["naming_format"],
+                previous.get("overlap", 0),
+                previous.get("padding"),
+            ):
+                sizes = {(row, col): size for row, col, size, _ in previous["tiles"]}
+            else:
+                # The tiles on disk were cut differently, so none can be kept.
+                resume = False
+
+        if progress is not None:
+            total = math.ceil(self.width / tile_w) * math.ceil(self.height / tile_h)
+            if positions is not None:
+                total = len(positions)
+            progress = _counted(progress, total)
+
+        write_options = _WriteOptions(
+            workers=workers,
+            save_options=save_options,
+            record=manifest,
+            resume=resume,
+            blank=blank,
+            blank_tolerance=blank_tolerance,
+            dedupe=dedupe,
+            overlap=overlap,
+            padding=padding,
+        )
+        if processes > 1:
+            written, records = self._slice_with_processes(
+                output_dir,
+                naming_format,
+                tile_width=tile_w,
+                tile_height=tile_h,
+                processes=processes,
+                write_options=write_options,
+                sizes=sizes,
+                progress=progress,
+                positions=positions,
+            )
+        else:
+            tile_info = self._generate_tile_info(
+                tile_width=tile_w,
+                tile_height=tile_h,
+                overlap=overlap,
+                padded=padding is not None,
+                positions=positions,
+            )
+            written, records = self._write_tiles(
+                output_dir,
+                naming_format,
+                tile_info,
+                write_options,
+                sizes=sizes,
+                progress=progress,
+            )
+
+        if not manifest:
+            # A manifest left by an earlier run would no longer describe the
+            # tiles in this directory. Files this library did not write are
+            # left alone.
+            if _read_manifest(output_dir) is not None:
+                os.remove(os.path.join(output_dir, MANIFEST_FILENAME))
+            return written
+
+        _write_manifest(
+            output_dir,
+            {
+                "version": MANIFEST_VERSION,
+                "width": self.width,
+                "height": self.height,
+                "bands": self.image.bands,
+                "band_format": self.image.format,
+                "interpretation": self.image.interpretation,
+                "tile_width": tile_w,
+                "tile_height": tile_h,
+                "overlap": overlap,
+                "padding": padding,
+                "rows": math.ceil(self.height / tile_h),
+                "cols": math.ceil(self.width / tile_w),
+                "naming_format": naming_format,
+                "suffix": os.path.splitext(naming_format)[1],
+                "tiles": sorted(r for r in records if len(r) == 4),
+                "blank": sorted(r for r in records if len(r) == 3),
+            },
+        )
+        return written
+
+    @_with_limits
+    def slice_to_archive(
+        self,
+        archive_path: str,
+        naming_format: str = "tile_{row}_{col}.png",
+        cols: int | None = None,
+        rows: int | None = None,
+        number_of_tiles: int | None = None,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+        workers: int = 1,
+        save_options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Slices the image into tiles and packs them into a single archive.
+
+        The archive is an uncompressed zip file with one entry per tile,
+        named with ``naming_format``. Use :class:`TileArchive` or
+        :class:`ImageJoiner` to read it back.
+
+        Args:
+            archive_path: Path of the archive file to create.
+            naming_format: A format string for the tile entry names. The
+                           extension selects the tile format.
+                           Available placeholders: {row}, {col}.
+            cols: The number of columns to slice the image into.
+            rows: The number of rows to slice the image into.
+            number_of_tiles: The total number of tiles to create. This will
+                             override cols and rows.
+            tile_width: The desired width of each tile.
+            tile_height: The desired height of each tile.
+            workers: The number of threads used to encode tiles concurrently.
+            save_options: Options passed to the libvips saver selected by
+                          the tile extension, for example
+                          ``{"compression": 1}`` for fast PNG output or
+                          ``{"Q": 85, "strip": True}`` for JPEG.
+        """
+        _check_workers(workers)
+        encoded_tiles = self.generate_encoded_tiles(
+            fmt=os.path.splitext(naming_format)[1],
+            cols=cols,
+            rows=rows,
+            number_of_tiles=number_of_tiles,
+            tile_width=tile_width,
+            tile_height=tile_height,
+            save_options=save_options,
+            workers=workers,
+        )
+
+        archive_dir = os.path.dirname(archive_path)
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+        with TileArchiveWriter(archive_path, naming_format) as archive:
+            for data, row, col in encoded_tiles:
+                archive.add(row, col, data)
+
+    @_with_limits
+    def slice_pyramid(
+        self,
+        output_path: str,
+        layout: str = "dz",
+        tile_size: int = 256,
+        suffix: str = ".jpg",
+        overlap: int | None = None,
+        depth: str = "onepixel",
+        save_options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Tiles the image at every zoom level in a single pass with libvips
+        dzsave.
+
+        The source is decoded once. Each level is shrunk from the one above
+        it as the tiles of that level are written, so every level costs a
+        quarter of the one before rather than a full read of the source.
+
+        Args:
+            output_path: Where to write the pyramid, without an extension.
+                         The "dz" layout writes ``output_path.dzi`` and an
+                         ``output_path_files`` directory; the other layouts
+                         write an ``output_path`` directory.
+            layout: "dz" for DeepZoom, "google" for XYZ directories of
+                    ``{z}/{y}/{x}`` tiles, "zoomify", "iiif" or "iiif3".
+            tile_size: The width and height of each tile.
+            suffix: The tile format, as a file extension.
+            overlap: The number of pixels tiles share on each side. Defaults
+                     to the libvips default for the layout.
+            depth: How far down to shrink: "onepixel", "onetile" or "one"
+                   for just the full-resolution level.
+            save_options: Options passed to the libvips saver for each tile,
+                          for example ``{"Q": 85}``.
+
+        Raises:
+            ValueError: If ``layout`` is not one of PYRAMID_LAYOUTS, or
+                        ``tile_size`` is not positive.
+        """
+        if layout not in PYRAMID_LAYOUTS:
+            raise ValueError(
+                f"layout must be one of {', '.join(PYRAMID_LAYOUTS)}, got {layout!r}."
+            )
+        if tile_size < 1:
+            raise ValueError("tile_size must be a positive integer.")
+
+        if save_options:
+            # dzsave takes tile saver options in the suffix, as in .jpg[Q=85].
+            encoded = ",".join(
+                f"{key}={str(value).lower() if isinstance(value, bool) else value}"
+                for key, value in save_options.items()
+            )
+            suffix = f"{suffix}[{encoded}]"
+        options: dict[str, Any] = {}
+        if overlap is not None:
+            options["overlap"] = overlap
+
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self.image.dzsave(
+            output_path,
+            layout=layout,
+            tile_size=tile_size,
+            suffix=suffix,
+            depth=depth,
+            **options,
+        )
 
     def generate_tiles(
         self,
@@ -222,6 +1410,10 @@ class ImageSlicer:
         number_of_tiles: int | None = None,
         tile_width: int | None = None,
         tile_height: int | None = None,
+        overlap: int = 0,
+        padding: str | None = None,
+        region: tuple[int, int, int, int] | None = None,
+        tile_coords: Iterable[tuple[int, int]] | None = None,
     ) -> Generator[tuple[pyvips.Image, int, int], None, None]:
         """
         A generator that yields image tiles as pyvips.Image objects.
@@ -235,16 +1427,508 @@ class ImageSlicer:
                              override cols and rows.
             tile_width: The desired width of each tile.
             tile_height: The desired height of each tile.
+            overlap: Grow each tile by this many pixels on every side.
+            padding: How to fill the halo at the image edges, as in
+                     :meth:`slice`. Defaults to clipping it.
+            region: Only yield the tiles intersecting this (left, top,
+                    width, height) box, as in :meth:`slice`.
+            tile_coords: Only yield the tiles at these (row, col) positions.
 
         Yields:
             A tuple containing the pyvips.Image object for the tile,
             its row number, and its column number.
         """
-        for left, top, width, height, row, col in self._generate_tile_info(
+        tile_w, tile_h = self._resolve_tile_dimensions(
             cols, rows, number_of_tiles, tile_width, tile_height
-        ):
-            tile = self.image.crop(left, top, width, height)
-            yield tile, row, col
+        )
+        _check_overlap(overlap, padding, tile_w, tile_h)
+        tile_info = self._generate_tile_info(
+            tile_width=tile_w,
+            tile_height=tile_h,
+            overlap=overlap,
+            padded=padding is not None,
+            positions=self._select_tiles(tile_w, tile_h, region, tile_coords),
+        )
+        yield from self._crop_tiles(tile_info, overlap, padding)
+
+    def get_tile(
+        self,
+        row: int,
+        col: int,
+        fmt: str = ".png",
+        cols: int | None = None,
+        rows: int | None = None,
+        number_of_tiles: int | None = None,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+        save_options: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Returns one tile encoded in memory, without slicing the rest.
+
+        Encoded tiles are kept in :attr:`tile_cache`, a least-recently-used
+        cache bounded by size, so repeated requests for popular tiles are
+        not cropped or encoded again. Use ``tile_cache.stats()`` to see its
+        hit rate. This method is safe to call from several threads.
+
+        Args:
+            row: The row number of the tile.
+            col: The column number of the tile.
+            fmt: The format to encode to, as a file extension such as ".png".
+            cols: The number of columns in the grid.
+            rows: The number of rows in the grid.
+            number_of_tiles: The total number of tiles in the grid.
+            tile_width: The width of each tile.
+            tile_height: The height of each tile.
+            save_options: Options passed to the libvips saver for ``fmt``.
+
+        Returns:
+            The encoded bytes of the tile.
+
+        Raises:
+            ValueError: If the tile is outside the grid, or the image was
+                        opened in streaming mode, which only allows reading
+                        top to bottom.
+        """
+        if self.streaming:
+            raise ValueError("get_tile is not supported in streaming mode.")
+        tile_w, tile_h = self._resolve_tile_dimensions(
+            cols, rows, number_of_tiles, tile_width, tile_height
+        )
+        options = save_options or {}
+        key = (row, col, tile_w, tile_h, fmt, repr(sorted(options.items())))
+        data = self.tile_cache.get(key)
+        if data is not None:
+            return data
+
+        positions = self._select_tiles(tile_w, tile_h, tile_coords=[(row, col)])
+        left, top, width, height, _, _ = next(
+            self._generate_tile_info(
+                tile_width=tile_w, tile_height=tile_h, positions=positions
+            )
+        )
+        data = self.image.crop(left, top, width, height).write_to_buffer(fmt, **options)
+        self.tile_cache.put(key, data)
+        return data
+
+    def generate_encoded_tiles(
+        self,
+        fmt: str = ".png",
+        cols: int | None = None,
+        rows: int | None = None,
+        number_of_tiles: int | None = None,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+        save_options: dict[str, Any] | None = None,
+        workers: int = 1,
+        overlap: int = 0,
+        padding: str | None = None,
+    ) -> Generator[tuple[bytes, int, int], None, None]:
+        """
+        A generator that yields tiles encoded in memory.
+
+        Useful for streaming tiles to a sink, such as object storage, without
+        touching the local filesystem. With more than one worker, tiles are
+        encoded on a thread pool up to ``2 * workers`` tiles ahead of the
+        consumer, and are still yielded in grid order.
+
+        Args:
+            fmt: The format to encode to, as a file extension such as ".png"
+                 or ".webp".
+            cols: The number of columns to slice the image into.
+            rows: The number of rows to slice the image into.
+            number_of_tiles: The total number of tiles to create. This will
+                             override cols and rows.
+            tile_width: The desired width of each tile.
+            tile_height: The desired height of each tile.
+            save_options: Options passed to the libvips saver for ``fmt``.
+            workers: The number of threads used to encode tiles concurrently.
+            overlap: Grow each tile by this many pixels on every side.
+            padding: How to fill the halo at the image edges, as in
+                     :meth:`slice`.
+
+        Yields:
+            A tuple containing the encoded bytes of the tile, its row number,
+            and its column number.
+        """
+        _check_workers(workers)
+        options = save_options or {}
+
+        def encode_tile(item: tuple[pyvips.Image, int, int]) -> tuple[bytes, int, int]:
+            tile, row, col = item
+            return tile.write_to_buffer(fmt, **options), row, col
+
+        tiles = self.generate_tiles(
+            cols, rows, number_of_tiles, tile_width, tile_height, overlap, padding
+        )
+        yield from _imap(encode_tile, tiles, workers)
+
+    def generate_tile_batches(
+        self,
+        batch_size: int,
+        cols: int | None = None,
+        rows: int | None = None,
+        number_of_tiles: int | None = None,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+        pad: bool = True,
+        fill: float = 0,
+        workers: int = 1,
+    ) -> Generator[tuple[Any, list[tuple[int, int]]], None, None]:
+        """
+        A generator that yields tiles as batches of NumPy arrays.
+
+        Each batch is a C-contiguous array of shape (N, height, width, bands)
+        with N <= batch_size, together with the (row, col) of each tile in it.
+        Batches are backed by one preallocated buffer that is reused for
+        every batch, so copy a batch if you need it after the next iteration.
+
+        Args:
+            batch_size: The maximum number of tiles in a batch.
+            cols: The number of columns to slice the image into.
+            rows: The number of rows to slice the image into.
+            number_of_tiles: The total number of tiles to create. This will
+                             override cols and rows.
+            tile_width: The desired width of each tile.
+            tile_height: The desired height of each tile.
+            pad: If True, partial tiles at the right and bottom edges are
+                 padded with ``fill`` to the full tile size. If False, each
+                 partial tile is yielded on its own as a batch of one at its
+                 actual size.
+            fill: The value used for padding.
+            workers: The number of threads used to render tiles to memory.
+
+        Yields:
+            A tuple containing the batch array and a list of (row, col)
+            positions, one per tile in the batch.
+
+        Raises:
+            ValueError: If NumPy is not installed or batch_size is not
+                        positive.
+        """
+        if np is None:
+            raise ValueError("NumPy is required to generate tile batches.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        tile_w, tile_h = self._resolve_tile_dimensions(
+            cols, rows, number_of_tiles, tile_width, tile_height
+        )
+        bands = self.image.bands
+        dtype = np.dtype(_FORMAT_TO_DTYPE[self.image.format])
+        buffer = np.empty((batch_size, tile_h, tile_w, bands), dtype=dtype)
+
+        def render(item: tuple[pyvips.Image, int, int]) -> tuple[Any, int, int]:
+            tile, row, col = item
+            pixels = np.frombuffer(tile.write_to_memory(), dtype=dtype)
+            return pixels.reshape(tile.height, tile.width, bands), row, col
+
+        tile_info = self._generate_tile_info(tile_width=tile_w, tile_height=tile_h)
+        count = 0
+        positions: list[tuple[int, int]] = []
+        for pixels, row, col in _imap(render, self._crop_tiles(tile_info), workers):
+            height, width = pixels.shape[:2]
+            if (height, width) != (tile_h, tile_w) and not pad:
+                yield pixels[np.newaxis].copy(), [(row, col)]
+                continue
+
+            buffer[count, :height, :width] = pixels
+            buffer[count, height:, :] = fill
+            buffer[count, :height, width:] = fill
+            positions.append((row, col))
+            count += 1
+            if count == batch_size:
+                yield buffer, positions
+                count = 0
+                positions = []
+
+        if count:
+            yield buffer[:count], positions
+
+
+def _slice_band(
+    source_path: str,
+    output_dir: str,
+    naming_format: str,
+    tile_width: int,
+    tile_height: int,
+    row_band: tuple[int, int],
+    streaming: bool,
+    write_options: _WriteOptions,
+    sizes: dict[tuple[int, int], int] | None = None,
+    events: Any = None,
+    limits: VipsLimits | None = None,
+    positions: list[tuple[int, int]] | None = None,
+) -> tuple[int, list[list[Any]]]:
+    """
+    Slices one band of tile rows from a source file. This runs in a worker
+    process, so it opens its own copy of the source and applies its own
+    copy of ``limits``. Tile events are put on the ``events`` queue, if
+    given.
+    """
+    applied: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+    if limits is not None:
+        applied = limits
+    with applied:
+        slicer = ImageSlicer(source_path, streaming=streaming)
+        tile_info = slicer._generate_tile_info(
+            tile_width=tile_width,
+            tile_height=tile_height,
+            row_band=row_band,
+            overlap=write_options.overlap,
+            padded=write_options.padding is not None,
+            positions=positions,
+        )
+        return slicer._write_tiles(
+            output_dir,
+            naming_format,
+            tile_info,
+            write_options,
+            sizes=sizes,
+            progress=events.put if events is not None else None,
+        )
+
+
+def _join_grid(grid: list[list[pyvips.Image]]) -> pyvips.Image:
+    """
+    Joins a grid of tiles, given as a list of rows, into one image.
+
+    The mosaic is built with a single arrayjoin rather than a chain of
+    pairwise joins, so the pipeline stays one operation deep however large
+    the grid is. arrayjoin lays tiles out on a grid of the largest tile size,
+    so the result is cropped back to the real size to drop the padding left
+    by partial tiles at the right and bottom edges.
+    """
+    width = sum(tile.width for tile in grid[0])
+    height = sum(row[0].height for row in grid)
+    tiles = [tile for row in grid for tile in row]
+    if len(tiles) == 1:
+        return tiles[0]
+    mosaic = pyvips.Image.arrayjoin(tiles, across=len(grid[0]))
+    return mosaic.crop(0, 0, width, height)
+
+
+def _overlap_spans(
+    sizes: list[int],
+    overlap: int,
+    padded: bool,
+    margins: tuple[int, int] = (0, 0),
+) -> list[tuple[int, int, int]]:
+    """
+    Splits the widths (or heights) of a row (or column) of overlapping tiles
+    into (before, cell, after): the halo before the tile's grid cell, the
+    cell itself and the halo after it.
+
+    Without padding the halo is clipped at the image edges, so the sizes are
+    worked out from the last tile backwards. ``margins`` are the pixels of
+    the image before the first tile's cell and after the last tile's cell,
+    which are not 0 when the tiles cover only a region of the image.
+    """
+    if padded:
+        return [(overlap, size - 2 * overlap, overlap) for size in sizes]
+    spans = []
+    following = margins[1]
+    for i in reversed(range(len(sizes))):
+        before = overlap if i > 0 else min(overlap, margins[0])
+        after = min(overlap, following)
+        cell = sizes[i] - before - after
+        spans.append((before, cell, after))
+        following += cell
+    return spans[::-1]
+
+
+def _cell_segments(
+    spans: list[tuple[int, int, int]], blend: bool
+) -> list[list[tuple[int, list[tuple[int, int, tuple[int, int, int] | None]]]]]:
+    """
+    Cuts each grid cell along one axis into segments to take from the tiles.
+
+    Each segment is (size, sources), and each source is (tile index, offset
+    into the tile, ramp). A ramp of None takes the pixels as they are. When
+    blending, the halos of neighbouring tiles meet in a seam twice the
+    overlap wide, where the tiles are cross-faded: ramp is (direction,
+    phase, half), with direction 1 for the weight rising across the seam and
+    -1 for it falling, phase the position of the segment within the seam
+    and half the overlap.
+    """
+    count = len(spans)
+    # A cell can give up to half its size to each of its two seams, which
+    # only narrows the seam next to a small partial cell at the edge.
+    seams = [
+        (
+            min(spans[i][2], spans[i + 1][0], spans[i][1] // 2, spans[i + 1][1] // 2)
+            if blend
+            else 0
+        )
+        for i in range(count - 1)
+    ]
+    cells = []
+    for i, (before, cell, _) in enumerate(spans):
+        start = seams[i - 1] if i > 0 else 0
+        end = seams[i] if i < count - 1 else 0
+        segments: list[tuple[int, list[tuple[int, int, tuple[int, int, int] | None]]]]
+        segments = []
+        if start:
+            previous = spans[i - 1]
+            segments.append(
+                (
+                    start,
+                    [
+                        (i - 1, previous[0] + previous[1], (-1, start, start)),
+                        (i, before, (1, start, start)),
+                    ],
+                )
+            )
+        if cell - start - end > 0:
+            segments.append((cell - start - end, [(i, before + start, None)]))
+        if end:
+            segments.append(
+                (
+                    end,
+                    [
+                        (i, before + cell - end, (-1, 0, end)),
+                        (i + 1, spans[i + 1][0] - end, (1, 0, end)),
+                    ],
+                )
+            )
+        cells.append(segments)
+    return cells
+
+
+def _seam_weight(
+    width: int,
+    height: int,
+    x_ramp: tuple[int, int, int] | None,
+    y_ramp: tuple[int, int, int] | None,
+) -> pyvips.Image | None:
+    """
+    The cross-fade weight of one tile over a segment. The weights of the
+    tiles sharing a segment add up to one.
+    """
+    weight = None
+    xyz = pyvips.Image.xyz(width, height)
+    for ramp, band in ((x_ramp, 0), (y_ramp, 1)):
+        if ramp is None:
+            continue
+        direction, phase, half = ramp
+        axis = (xyz[band] + phase + 0.5) / (2 * half)
+        if direction < 0:
+            axis = 1 - axis
+        weight = axis if weight is None else weight * axis
+    return weight
+
+
+def _join_overlapping(
+    grid: list[list[pyvips.Image]],
+    x_spans: list[tuple[int, int, int]],
+    y_spans: list[tuple[int, int, int]],
+    blend: bool,
+) -> pyvips.Image:
+    """
+    Joins a grid of overlapping tiles back into one image.
+
+    Each grid cell is rebuilt from its tile with the halo cropped off. When
+    blending, the strips of a cell shared with neighbouring tiles are
+    cross-faded with them instead. The cells are then joined with
+    :func:`_join_grid`.
+    """
+    first = grid[0][0]
+    exact = first.format not in ("float", "double", "complex", "dpcomplex")
+    x_cells = _cell_segments(x_spans, blend)
+    y_cells = _cell_segments(y_spans, blend)
+
+    cells = []
+    for y_segments in y_cells:
+        cell_row = []
+        for x_segments in x_cells:
+            strips = []
+            for height, y_sources in y_segments:
+                pieces = []
+                for width, x_sources in x_segments:
+                    parts = []
+                    for row, top, y_ramp in y_sources:
+                        for col, left, x_ramp in x_sources:
+                            part = grid[row][col].crop(left, top, width, height)
+                            weight = _seam_weight(width, height, x_ramp, y_ramp)
+                            if weight is not None:
+                                part = part * weight
+                            parts.append(part)
+                    total = parts[0]
+                    for part in parts[1:]:
+                        total = total + part
+                    if len(parts) > 1:
+                        if exact:
+                            total = total.rint()
+                        total = total.cast(first.format).copy(
+                            interpretation=first.interpretation
+                        )
+                    pieces.append(total)
+                strip = pieces[0]
+                for piece in pieces[1:]:
+                    strip = strip.join(piece, "horizontal")
+                strips.append(strip)
+            cell = strips[0]
+            for strip in strips[1:]:
+                cell = cell.join(strip, "vertical")
+            cell_row.append(cell)
+        cells.append(cell_row)
+    return _join_grid(cells)
+
+
+def _validate_tiles(
+    tiles: Container[tuple[int, int]],
+    rows: int,
+    cols: int,
+    origin: tuple[int, int] = (0, 0),
+) -> None:
+    """
+    Validate that a tile is present at every position of the grid whose
+    first tile is at ``origin``.
+    """
+    top, left = origin
+    missing_tiles = []
+    for row in range(top, top + rows):
+        for col in range(left, left + cols):
+            if (row, col) not in tiles:
+                missing_tiles.append(f"tile at ({row}, {col})")
+
+    if missing_tiles:
+        raise ValueError(f"Missing tiles: {', '.join(missing_tiles)}")
+
+
+def _tiled_tiff_options(
+    target: str, save_options: dict[str, Any] | None
+) -> dict[str, Any]:
+    """
+    Merges save_options over TILED_TIFF_OPTIONS, checking that ``target``,
+    an output path or format, is a TIFF.
+    """
+    if not target.lower().endswith((".tif", ".tiff")):
+        raise ValueError(f"tiled_tiff needs a .tif or .tiff output, got {target}")
+    return {**TILED_TIFF_OPTIONS, **(save_options or {})}
+
+
+def _report_writes(
+    image: pyvips.Image, progress: Callable[[JoinEvent], None], start: float
+) -> None:
+    """
+    Passes the libvips evaluation progress of ``image`` to ``progress``.
+    libvips throttles "eval" signals, so "posteval" reports completion.
+    """
+
+    def on_eval(image: pyvips.Image, status: Any) -> None:
+        progress(
+            JoinEvent("write", status.npels, status.tpels, time.perf_counter() - start)
+        )
+
+    def on_posteval(image: pyvips.Image, status: Any) -> None:
+        progress(
+            JoinEvent("write", status.tpels, status.tpels, time.perf_counter() - start)
+        )
+
+    image.set_progress(True)
+    image.signal_connect("eval", on_eval)
+    image.signal_connect("posteval", on_posteval)
 
 
 class ImageJoiner:
@@ -252,47 +1936,98 @@ class ImageJoiner:
     A class to join image tiles back into a single image.
 
     Attributes:
-        tiles_dir (str): Path to the directory containing tiles.
+        tiles_dir (str): Path to the directory or archive containing tiles.
         naming_format (str): The naming format used for the tiles.
+        archive (Optional[TileArchive]): The tile archive, if tiles_dir is one.
+        manifest (Optional[dict]): The slice manifest found in tiles_dir, if
+            any. It is only used when its naming format matches.
+        limits (Optional[VipsLimits]): The libvips limits applied while
+            joining, which hold the high-water marks of the last join.
+
+    A joiner reading an archive holds it open until :meth:`close` is called,
+    or until the end of a ``with`` block.
     """
 
-    def __init__(self, tiles_dir: str, naming_format: str = "tile_{row}_{col}.png"):
+    def __init__(
+        self,
+        tiles_dir: str,
+        naming_format: str | None = None,
+        recursive: bool = False,
+        limits: VipsLimits | None = None,
+    ):
         """
         Initialize the ImageJoiner.
 
         Args:
-            tiles_dir: Directory containing the tiles to join.
-            naming_format: The naming format used for the tiles.
+            tiles_dir: Directory containing the tiles to join, or a tile
+                       archive created by ``ImageSlicer.slice_to_archive``.
+            naming_format: The naming format used for the tiles. Defaults
+                           to the format recorded in a tile archive, or
+                           "tile_{row}_{col}.png".
+            recursive: If True, also search subdirectories of tiles_dir. The
+                       naming format is then matched against each file's
+                       path relative to tiles_dir, with "/" separators, so
+                       layouts such as "{row}/{col}.png" can be joined.
+            limits: libvips cache and thread limits to apply while
+                    :meth:`join` runs. The previous limits are restored
+                    afterwards.
         """
         self.tiles_dir = Path(tiles_dir)
-        self.naming_format = naming_format
+        self.recursive = recursive
+        self.limits = limits
 
         if not self.tiles_dir.exists():
             raise ValueError(f"Tiles directory does not exist: {tiles_dir}")
 
-    def _parse_naming_format(self) -> tuple[str, str]:
-        """Parse the naming format to extract row and col placeholders."""
-        # Convert format string to regex pattern
-        pattern = self.naming_format
-        pattern = pattern.replace("{row}", r"(\d+)")
-        pattern = pattern.replace("{col}", r"(\d+)")
-        pattern = "^" + pattern + "$"
-        return pattern, self.naming_format
+        self.archive: TileArchive | None = None
+        self.manifest: dict[str, Any] | None = None
+        self._blank_fills: dict[tuple[int, int], list[float]] = {}
+        if self.tiles_dir.is_file():
+            self.archive = TileArchive(tiles_dir, naming_format)
+            self.naming_format = self.archive.naming_format
+        else:
+            self.naming_format = naming_format or "tile_{row}_{col}.png"
+            manifest = _read_manifest(self.tiles_dir)
+            if manifest is not None and manifest["naming_format"] == self.naming_format:
+                self.manifest = manifest
+                self._blank_fills = {
+                    (row, col): fill for row, col, fill in manifest.get("blank", [])
+                }
+
+    def close(self) -> None:
+        """Close the tile archive, if tiles_dir is one."""
+        if self.archive is not None:
+            self.archive.close()
+
+    def __enter__(self) -> ImageJoiner:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
-    def _discover_tiles(self) -> dict[tuple[int, int], Path]:
+    def _discover_tiles(self) -> dict[tuple[int, int], str]:
         """
         Discover all tiles in the directory and return a mapping of
-        (row, col) to file path.
+        (row, col) to file path, or to entry name for archives.
         """
-        pattern, _ = self._parse_naming_format()
+        match = _compile_naming_format(self.naming_format).match
         tiles = {}
 
-        for file_path in self.tiles_dir.iterdir():
-            if file_path.is_file():
-                match = re.match(pattern, file_path.name)
-                if match:
-                    row, col = int(match.group(1)), int(match.group(2))
-                    tiles[(row, col)] = file_path
+        if self.archive is not None:
+            for name in self.archive.names():
+                m = match(name)
+                if m:
+                    tiles[(int(m["row"]), int(m["col"]))] = name
+        else:
+            for name, path in _scan_files(str(self.tiles_dir), self.recursive):
+                m = match(name)
+                if m:
+                    tiles[(int(m["row"]), int(m["col"]))] = path
 
         if not tiles:
             raise ValueError(
@@ -302,62 +2037,292 @@ class ImageJoiner:
 
         return tiles
 
+    def _tiles_from_manifest(self) -> dict[tuple[int, int], str]:
+        """
+        Map (row, col) to file path using the manifest, without listing the
+        directory. Blank tiles that were skipped are included, although
+        their files do not exist.
+        """
+        assert self.manifest is not None
+        positions = [(row, col) for row, col, *_ in self.manifest["tiles"]]
+        positions.extend(self._blank_fills)
+        return {
+            (row, col): os.path.join(
+                self.tiles_dir, self.naming_format.format(row=row, col=col)
+            )
+            for row, col in positions
+        }
+
     def _calculate_grid_dimensions(
-        self, tiles: dict[tuple[int, int], Path]
-    ) -> tuple[int, int]:
-        """Calculate the number of rows and columns from discovered tiles."""
-        rows = max(row for row, _ in tiles.keys()) + 1
-        cols = max(col for _, col in tiles.keys()) + 1
-        return rows, cols
+        self, tiles: dict[tuple[int, int], str]
+    ) -> tuple[int, int, int, int]:
+        """
+        Calculate the first row and column and the number of rows and
+        columns spanned by the discovered tiles.
+        """
+        top = min(row for row, _ in tiles.keys())
+        left = min(col for _, col in tiles.keys())
+        rows = max(row for row, _ in tiles.keys()) + 1 - top
+        cols = max(col for _, col in tiles.keys()) + 1 - left
+        return top, left, rows, cols
+
+    def _grid_margins(
+        self, top: int, left: int, rows: int, cols: int, overlap: int
+    ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Return the pixels of the image before and after the joined grid,
+        across and down, which overlapping tiles take their outer halos
+        from. Without a manifest, a grid that does not start at (0, 0) is
+        assumed to have a full halo before it and none after it.
+        """
+        if self.manifest is None:
+            return (overlap if left else 0, 0), (overlap if top else 0, 0)
+        tile_w, tile_h = self.manifest["tile_width"], self.manifest["tile_height"]
+        return (
+            (left * tile_w, max(0, self.manifest["width"] - (left + cols) * tile_w)),
+            (top * tile_h, max(0, self.manifest["height"] - (top + rows) * tile_h)),
+        )
+
+    def _open_tile(self, tile_path: str, access: str = "random") -> pyvips.Image:
+        """Open a discovered tile from the directory or archive."""
+        if self.archive is not None:
+            data = self.archive.read_name(tile_path)
+            return pyvips.Image.new_from_buffer(data, "", access=access)
+        return pyvips.Image.new_from_file(tile_path, access=access)
+
+    def _blank_tile(self, row: int, col: int, fill: list[float]) -> pyvips.Image:
+        """Recreate a uniform tile that was skipped when slicing."""
+        assert self.manifest is not None
+        tile_w, tile_h = self.manifest["tile_width"], self.manifest["tile_height"]
+        _, _, width, height = _tile_rect(
+            col * tile_w,
+            row * tile_h,
+            min(tile_w, self.manifest["width"] - col * tile_w),
+            min(tile_h, self.manifest["height"] - row * tile_h),
+            self.manifest.get("overlap", 0),
+            self.manifest.get("padding") is not None,
+            self.manifest["width"],
+            self.manifest["height"],
+        )
+        tile = pyvips.Image.black(width, height, bands=self.manifest["bands"]) + fill
+        return tile.cast(self.manifest["band_format"]).copy(
+            interpretation=self.manifest["interpretation"]
+        )
+
+    def _load_tile(
+        self,
+        tiles: dict[tuple[int, int], str],
+        row: int,
+        col: int,
+        access: str = "random",
+        origin: tuple[int, int] = (0, 0),
+    ) -> pyvips.Image:
+        """
+        Open the tile at (row, col) of a grid whose first tile is at
+        ``origin``, recreating it if it was skipped.
+        """
+        row, col = row + origin[0], col + origin[1]
+        fill = self._blank_fills.get((row, col))
+        if fill is not None:
+            return self._blank_tile(row, col, fill)
+        return self._open_tile(tiles[(row, col)], access=access)
 
-    def _validate_tiles(
-        self, tiles: dict[tuple[int, int], Path], rows: int, cols: int
+    def _join_streaming(
+        self,
+        tiles: dict[tuple[int, int], str],
+        rows: int,
+        cols: int,
+        output_path: str,
+        save_options: dict[str, Any],
+        overlap: int = 0,
+        padded: bool = False,
+        progress: Callable[[JoinEvent], None] | None = None,
+        origin: tuple[int, int] = (0, 0),
+        margins: tuple[tuple[int, int], tuple[int, int]] = ((0, 0), (0, 0)),
     ) -> None:
-        """Validate that all expected tiles are present."""
-        missing_tiles = []
-        for row in range(rows):
-            for col in range(cols):
-                if (row, col) not in tiles:
-                    missing_tiles.append(f"tile at ({row}, {col})")
+        """
+        Join the tiles one tile row at a time.
+
+        Each row of tiles is opened, decoded into a strip and appended to a
+        raw temporary file next to the output, then released before the next
+        row is opened. The output is then encoded from a memory map of that
+        file, so open files and resident memory are both bounded by one row
+        of tiles.
+        """
+        start = time.perf_counter()
+        y_spans = x_spans = None
+        if overlap:
+            heights = [
+                self._load_tile(tiles, row, 0, "sequential", origin).height
+                for row in range(rows)
+            ]
+            y_spans = _overlap_spans(heights, overlap, padded, margins[1])
+
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, raw_path = tempfile.mkstemp(suffix=".raw", dir=output_dir)
+        try:
+            with os.fdopen(fd, "w+b") as raw_file:
+                width = height = bands = 0
+                band_format = interpretation = None
+                for row in range(rows):
+                    row_tiles = [
+                        self._load_tile(tiles, row, col, "sequential", origin)
+                        for col in range(cols)
+                    ]
+                    if y_spans is None:
+                        strip = _join_grid([row_tiles])
+                    else:
+                        if x_spans is None:
+                            widths = [tile.width for tile in row_tiles]
+                            x_spans = _overlap_spans(
+                                widths, overlap, padded, margins[0]
+                            )
+                        strip = _join_overlapping(
+                            [row_tiles], x_spans, [y_spans[row]], False
+                        )
+                    if band_format is None:
+                        width, bands = strip.width, strip.bands
+                        band_format = strip.format
+                        interpretation = strip.interpretation
+                    elif strip.format != band_format:
+                        strip = strip.cast(band_format)
+                    raw_file.write(strip.write_to_memory())
+                    height += strip.height
+                    del row_tiles, strip
+                    if progress is not None:
+                        progress(
+                            JoinEvent(
+                                "open",
+                                (row + 1) * cols,
+                                rows * cols,
+                                time.perf_counter() - start,
+                            )
+                        )
+                raw_file.flush()
 
-        if missing_tiles:
-            raise ValueError(f"Missing tiles: {', '.join(missing_tiles)}")
+                with mmap.mmap(raw_file.fileno(), 0) as pixels:
+                    final_image = pyvips.Image.new_from_memory(
+                        pixels, width, height, bands, band_format
+                    ).copy(interpretation=interpretation)
+                    if progress is not None:
+                        _report_writes(final_image, progress, start)
+                    final_image.write_to_file(output_path, **save_options)
+                    del final_image
+        finally:
+            os.remove(raw_path)
 
-    def join(self, output_path: str) -> None:
+    @_with_limits
+    def join(
+        self,
+        output_path: str,
+        save_options: dict[str, Any] | None = None,
+        streaming: bool = False,
+        overlap: int | None = None,
+        padded: bool | None = None,
+        blend: bool = False,
+        progress: Callable[[JoinEvent], None] | None = None,
+        tiled_tiff: bool = False,
+    ) -> None:
         """
         Join the tiles back into a single image.
 
         Args:
             output_path: Path where the joined image will be saved.
+            save_options: Options passed to the libvips saver selected by
+                          the output extension, for example
+                          ``{"compression": 1}`` for fast PNG output.
+            streaming: If True, open and decode only one row of tiles at a
+                       time, so open files and memory are bounded by one row
+                       of tiles. This needs temporary disk space next to the
+                       output for the uncompressed image.
+            overlap: The halo, in pixels, that the tiles were sliced with.
+                     Each tile is cropped back to its grid cell. Defaults to
+                     the overlap recorded in the manifest, or 0.
+            padded: Whether the tiles at the image edges were padded, so
+                    they have a halo on every side. Defaults to the padding
+                    recorded in the manifest, or False.
+            blend: If True, cross-fade neighbouring tiles where their halos
+                   overlap instead of cropping the halos off, hiding seams
+                   between tiles processed independently, such as model
+                   predictions. Not supported with ``streaming``.
+            progress: A callback called with a :class:`JoinEvent` as each
+                      tile is opened and as libvips computes and writes the
+                      output. See :class:`ProgressReporter`.
+            tiled_tiff: If True, write a tiled, pyramidal BigTIFF that
+                        viewers can open and pan without decoding the whole
+                        image. ``save_options`` override TILED_TIFF_OPTIONS,
+                        for example ``{"compression": "jpeg", "Q": 90}``.
+
+        Raises:
+            ValueError: If tiles are missing, if ``blend`` is combined with
+                        ``streaming``, or if ``tiled_tiff`` is set and
+                        output_path is not a .tif or .tiff file.
         """
-        tiles = self._discover_tiles()
-        rows, cols = self._calculate_grid_dimensions(tiles)
-        self._validate_tiles(tiles, rows, cols)
+        if blend and streaming:
+            raise ValueError("blend is not supported for streaming joins.")
+        if tiled_tiff:
+            save_options = _tiled_tiff_options(output_path, save_options)
+        start = time.perf_counter()
+        if overlap is None:
+            overlap = self.manifest.get("overlap", 0) if self.manifest else 0
+        if padded is None:
+            padded = bool(self.manifest and self.manifest.get("padding"))
+        if self.manifest is not None:
+            tiles = self._tiles_from_manifest()
+        else:
+            tiles = self._discover_tiles()
+        # A slice limited by region or tile_coords lists fewer tiles than
+        # its full grid, so the grid is taken from the tiles present and
+        # starts at the first row and column among them.
+        top, left, rows, cols = self._calculate_grid_dimensions(tiles)
+        origin = (top, left)
+        _validate_tiles(tiles, rows, cols, origin)
+        margins = self._grid_margins(top, left, rows, cols, overlap)
 
-        # Create rows of tiles without loading dimensions
+        if streaming:
+            self._join_streaming(
+                tiles,
+                rows,
+                cols,
+                output_path,
+                save_options or {},
+                overlap,
+                padded,
+                progress,
+                origin,
+                margins,
+            )
+            return
 
-        # Create rows of tiles
-        tile_rows = []
+        grid = []
         for row in range(rows):
-            row_tiles = []
-            for col in range(cols):
-                tile_path = str(tiles[(row, col)])
-                tile = pyvips.Image.new_from_file(tile_path)
-                row_tiles.append(tile)
-
-            # Join tiles horizontally to create a row
-            row_image = row_tiles[0]
-            for tile in row_tiles[1:]:
-                row_image = row_image.join(tile, "horizontal")
-            tile_rows.append(row_image)
-
-        # Join rows vertically to create the final image
-        final_image = tile_rows[0]
-        for row_image in tile_rows[1:]:
-            final_image = final_image.join(row_image, "vertical")
+            grid.append(
+                [self._load_tile(tiles, row, col, origin=origin) for col in range(cols)]
+            )
+            if progress is not None:
+                progress(
+                    JoinEvent(
+                        "open",
+                        (row + 1) * cols,
+                        rows * cols,
+                        time.perf_counter() - start,
+                    )
+                )
+        if overlap:
+            x_spans = _overlap_spans(
+                [tile.width for tile in grid[0]], overlap, padded, margins[0]
+            )
+            y_spans = _overlap_spans(
+                [row[0].height for row in grid], overlap, padded, margins[1]
+            )
+            final_image = _join_overlapping(grid, x_spans, y_spans, blend)
+        else:
+            final_image = _join_grid(grid)
 
         # Save the final image
-        final_image.write_to_file(output_path)
+        if progress is not None:
+            _report_writes(final_image, progress, start)
+        final_image.write_to_file(output_path, **(save_options or {}))
 
 
 def slice_image(
@@ -369,12 +2334,27 @@ def slice_image(
     number_of_tiles: int | None = None,
     tile_width: int | None = None,
     tile_height: int | None = None,
-) -> None:
+    workers: int = 1,
+    processes: int = 1,
+    streaming: bool = False,
+    save_options: dict[str, Any] | None = None,
+    manifest: bool = False,
+    resume: bool = False,
+    blank: str | None = None,
+    blank_tolerance: float = 0,
+    dedupe: bool = False,
+    overlap: int = 0,
+    padding: str | None = None,
+    progress: Callable[[TileEvent], None] | None = None,
+    limits: VipsLimits | None = None,
+    region: tuple[int, int, int, int] | None = None,
+    tile_coords: Iterable[tuple[int, int]] | None = None,
+) -> int:
     """
     A convenience function to slice an image and save the tiles.
 
     Args:
-        source: Either a path to the image file or a PIL Image object.
+        source: A path to the image file, a PIL Image object or a NumPy array.
         output_dir: The directory to save the tiles in.
         naming_format: A format string for the output filenames.
         cols: The number of columns to slice the image into.
@@ -382,9 +2362,29 @@ def slice_image(
         number_of_tiles: The total number of tiles to create.
         tile_width: The desired width of each tile.
         tile_height: The desired height of each tile.
+        workers: The number of threads used to encode and write tiles.
+        processes: The number of processes to shard the grid across.
+        streaming: If True, read the source top to bottom in strips one tile
+                   row high to bound peak memory.
+        save_options: Options passed to the libvips saver for each tile.
+        manifest: If True, also write a manifest describing the tiles.
+        resume: If True, only write tiles that are missing or stale.
+        blank: "skip" or "link" to skip or hardlink uniform tiles.
+        blank_tolerance: The per-band range within which a tile is uniform.
+        dedupe: If True, hardlink tiles with identical encoded bytes.
+        overlap: Grow each tile by this many pixels on every side.
+        padding: How to fill the halo at the image edges, such as "mirror".
+        progress: A callback called with a TileEvent for every tile.
+        limits: libvips cache and thread limits to apply while slicing.
+        region: Only write the tiles intersecting this (left, top, width,
+                height) box.
+        tile_coords: Only write the tiles at these (row, col) positions.
+
+    Returns:
+        The number of tiles written or linked, as :meth:`ImageSlicer.slice`.
     """
-    slicer = ImageSlicer(source)
-    slicer.slice(
+    slicer = ImageSlicer(source, streaming=streaming, limits=limits)
+    return slicer.slice(
         output_dir=output_dir,
         naming_format=naming_format,
         cols=cols,
@@ -392,13 +2392,236 @@ def slice_image(
         number_of_tiles=number_of_tiles,
         tile_width=tile_width,
         tile_height=tile_height,
+        workers=workers,
+        processes=processes,
+        save_options=save_options,
+        manifest=manifest,
+        resume=resume,
+        blank=blank,
+        blank_tolerance=blank_tolerance,
+        dedupe=dedupe,
+        overlap=overlap,
+        padding=padding,
+        progress=progress,
+        region=region,
+        tile_coords=tile_coords,
+    )
+
+
+def slice_pyramid(
+    source: str | Any,
+    output_path: str,
+    layout: str = "dz",
+    tile_size: int = 256,
+    suffix: str = ".jpg",
+    overlap: int | None = None,
+    depth: str = "onepixel",
+    save_options: dict[str, Any] | None = None,
+    streaming: bool = False,
+    limits: VipsLimits | None = None,
+) -> None:
+    """
+    A convenience function to tile an image at every zoom level.
+
+    Args:
+        source: A path to the image file, a PIL Image object or a NumPy array.
+        output_path: Where to write the pyramid, without an extension.
+        layout: "dz", "google", "zoomify", "iiif" or "iiif3".
+        tile_size: The width and height of each tile.
+        suffix: The tile format, as a file extension.
+        overlap: The number of pixels tiles share on each side.
+        depth: "onepixel", "onetile" or "one".
+        save_options: Options passed to the libvips saver for each tile.
+        streaming: If True, read the source top to bottom in one pass.
+        limits: libvips cache and thread limits to apply while tiling.
+    """
+    slicer = ImageSlicer(source, streaming=streaming, limits=limits)
+    slicer.slice_pyramid(
+        output_path,
+        layout=layout,
+        tile_size=tile_size,
+        suffix=suffix,
+        overlap=overlap,
+        depth=depth,
+        save_options=save_options,
     )
 
 
+def _expand_sources(sources: str | Iterable[str]) -> tuple[list[str], list[str]]:
+    """
+    Expands a batch of sources into image paths, and the glob patterns and
+    directories that gave no images.
+
+    Each source may be an image path, a directory, whose files with an image
+    suffix known to libvips are taken in name order, or a glob pattern such
+    as "scans/**/*.tif".
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    suffixes = {suffix.lower() for suffix in pyvips.get_suffixes()}
+    paths: list[str] = []
+    unmatched: list[str] = []
+    for source in map(os.fspath, sources):
+        if os.path.isdir(source):
+            with os.scandir(source) as entries:
+                matches = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in suffixes
+                )
+        elif not os.path.exists(source) and any(c in source for c in "*?["):
+            matches = sorted(glob.glob(source, recursive=True))
+        else:
+            matches = [source]
+        if not matches:
+            unmatched.append(source)
+        paths.extend(matches)
+    return paths, unmatched
+
+
+def _plan_batch(
+    sources: str | Iterable[str], continue_on_error: bool
+) -> tuple[list[str], list[str], list[str]]:
+    """
+    Expands a batch of sources into image paths, the output subdirectory
+    name of each, and the glob patterns and directories that gave no images.
+
+    Raises:
+        ValueError: If two sources would share an output subdirectory, or
+                    if a source matches no images and ``continue_on_error``
+                    is False.
+    """
+    paths, unmatched = _expand_sources(sources)
+    if unmatched and not continue_on_error:
+        raise ValueError(f"No images match {', '.join(unmatched)}")
+    names = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    seen: dict[str, str] = {}
+    for path, name in zip(paths, names):
+        if name in seen:
+            raise ValueError(
+                f"{seen[name]} and {path} would both be sliced into {name}"
+            )
+        seen[name] = path
+    return paths, names, unmatched
+
+
+def slice_images(
+    sources: str | Iterable[str],
+    output_dir: str,
+    naming_format: str = "tile_{row}_{col}.png",
+    cols: int | None = None,
+    rows: int | None = None,
+    number_of_tiles: int | None = None,
+    tile_width: int | None = None,
+    tile_height: int | None = None,
+    jobs: int = 1,
+    streaming: bool = False,
+    continue_on_error: bool = False,
+    limits: VipsLimits | None = None,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Slices many images in one call, writing the tiles of each into its own
+    subdirectory of ``output_dir``, named after the image without its
+    extension.
+
+    Images are sliced concurrently on a pool of ``jobs`` threads, which
+    share one libvips instance, so there is no per-image interpreter or
+    library start-up cost.
+
+    Args:
+        sources: An image path, a directory, a glob pattern, or an iterable
+                 of any of these.
+        output_dir: The directory to create the per-image subdirectories in.
+        naming_format: A format string for the output filenames.
+        cols: The number of columns to slice each image into.
+        rows: The number of rows to slice each image into.
+        number_of_tiles: The total number of tiles to create per image.
+        tile_width: The desired width of each tile.
+        tile_height: The desired height of each tile.
+        jobs: The number of images sliced concurrently.
+        streaming: If True, read each source top to bottom in strips.
+        continue_on_error: If True, record images that fail and carry on
+                           with the rest, instead of raising the first error.
+        limits: libvips cache and thread limits to apply for the whole
+                batch. They are shared by the images sliced concurrently.
+        **options: Any other keyword arguments of :meth:`ImageSlicer.slice`,
+                   such as ``workers``, ``save_options`` or ``manifest``.
+                   A ``progress`` callback receives the tile events of
+                   every image, with ``done`` and ``total`` counted per
+                   image.
+
+    Returns:
+        A summary with the number of ``images`` sliced, the number of
+        ``tiles`` written and ``pixels`` sliced, the elapsed ``seconds`` and
+        a list of ``failed`` (source, error message) pairs. With
+        ``continue_on_error``, a glob pattern or directory that matches no
+        images is listed as failed.
+
+    Raises:
+        ValueError: If two sources would share an output subdirectory, or
+                    if a glob pattern or directory matches no images and
+                    ``continue_on_error`` is False.
+    """
+    _check_workers(jobs, "jobs")
+    paths, names, unmatched = _plan_batch(sources, continue_on_error)
+
+    def slice_one(item: tuple[str, str]) -> tuple[str, int, int, str | None]:
+        path, name = item
+        try:
+            slicer = ImageSlicer(path, streaming=streaming)
+            tiles = slicer.slice(
+                os.path.join(output_dir, name),
+                naming_format,
+                cols,
+                rows,
+                number_of_tiles,
+                tile_width,
+                tile_height,
+                **options,
+            )
+        except Exception as error:
+            if not continue_on_error:
+                raise
+            return path, 0, 0, f"{type(error).__name__}: {error}"
+        return path, tiles, slicer.width * slicer.height, None
+
+    start = time.perf_counter()
+    summary: dict[str, Any] = {
+        "images": 0,
+        "tiles": 0,
+        "pixels": 0,
+        "failed": [(source, "No images match") for source in unmatched],
+    }
+    applied: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+    if limits is not None:
+        applied = limits
+    with applied:
+        for path, tiles, pixels, error in _imap(slice_one, zip(paths, names), jobs):
+            if error is not None:
+                summary["failed"].append((path, error))
+                continue
+            summary["images"] += 1
+            summary["tiles"] += tiles
+            summary["pixels"] += pixels
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
 def join_image(
     tiles_dir: str,
     output_path: str,
-    naming_format: str = "tile_{row}_{col}.png",
+    naming_format: str | None = None,
+    save_options: dict[str, Any] | None = None,
+    streaming: bool = False,
+    recursive: bool = False,
+    overlap: int | None = None,
+    padded: bool | None = None,
+    blend: bool = False,
+    progress: Callable[[JoinEvent], None] | None = None,
+    limits: VipsLimits | None = None,
+    tiled_tiff: bool = False,
 ) -> None:
     """
     A convenience function to join tiles back into a single image.
@@ -406,7 +2629,110 @@ def join_image(
     Args:
         tiles_dir: Directory containing the tiles to join.
         output_path: Path where the joined image will be saved.
-        naming_format: The naming format used for the tiles.
+        naming_format: The naming format used for the tiles. Defaults to the
+                       format recorded in a tile archive, or
+                       "tile_{row}_{col}.png".
+        save_options: Options passed to the libvips saver for the output.
+        streaming: If True, decode one row of tiles at a time to bound open
+                   files and memory.
+        recursive: If True, also search subdirectories of tiles_dir, matching
+                   the naming format against relative paths.
+        overlap: The halo the tiles were sliced with. Defaults to the
+                 manifest's, or 0.
+        padded: Whether the edge tiles were padded. Defaults to the
+                manifest's, or False.
+        blend: If True, cross-fade overlapping tiles instead of cropping.
+        progress: A callback called with a JoinEvent as the join advances.
+        limits: libvips cache and thread limits to apply while joining.
+        tiled_tiff: If True, write a tiled, pyramidal BigTIFF.
+    """
+    with ImageJoiner(
+        tiles_dir, naming_format, recursive=recursive, limits=limits
+    ) as joiner:
+        joiner.join(
+            output_path,
+            save_options=save_options,
+            streaming=streaming,
+            overlap=overlap,
+            padded=padded,
+            blend=blend,
+            progress=progress,
+            tiled_tiff=tiled_tiff,
+        )
+
+
+def join_tiles(
+    tiles: Iterable[tuple[Any, int, int]],
+    output_path: str | None = None,
+    fmt: str = ".png",
+    save_options: dict[str, Any] | None = None,
+    overlap: int = 0,
+    padded: bool = False,
+    blend: bool = False,
+    progress: Callable[[JoinEvent], None] | None = None,
+    tiled_tiff: bool = False,
+) -> bytes | None:
     """
-    joiner = ImageJoiner(tiles_dir, naming_format)
-    joiner.join(output_path)
+    Joins tiles held in memory into a single image, without writing the
+    tiles to disk first.
+
+    The tiles can come straight from ``ImageSlicer.generate_tiles`` or
+    ``generate_encoded_tiles``, after any processing. Each one is wrapped
+    as it arrives and only decoded, once, as libvips writes the output.
+
+    Args:
+        tiles: An iterable of ``(tile, row, col)``, where ``tile`` is a
+               pyvips Image, encoded image bytes, a PIL Image or a NumPy
+               array.
+        output_path: Where to save the joined image. If None, it is encoded
+                     in memory and returned.
+        fmt: The format to encode to when output_path is None, as a file
+             extension.
+        save_options: Options passed to the libvips saver.
+        overlap: The halo, in pixels, the tiles were sliced with.
+        padded: Whether the edge tiles were padded.
+        blend: If True, cross-fade overlapping tiles instead of cropping.
+        progress: A callback called with a JoinEvent once the tiles are
+                  gathered and as the output is written.
+        tiled_tiff: If True, write a tiled, pyramidal BigTIFF. Needs a .tif
+                    output_path or fmt.
+
+    Returns:
+        The encoded image if output_path is None, otherwise None.
+
+    Raises:
+        ValueError: If there are no tiles, a position is given twice or
+                    missing, or a tile is of an unsupported type.
+    """
+    start = time.perf_counter()
+    images: dict[tuple[int, int], pyvips.Image] = {}
+    for tile, row, col in tiles:
+        if (row, col) in images:
+            raise ValueError(f"Tile ({row}, {col}) was given more than once.")
+        images[(row, col)] = _tile_image(tile)
+    if not images:
+        raise ValueError("No tiles to join.")
+    rows = max(row for row, _ in images) + 1
+    cols = max(col for _, col in images) + 1
+    _validate_tiles(images, rows, cols)
+    if tiled_tiff:
+        save_options = _tiled_tiff_options(output_path or fmt, save_options)
+    if progress is not None:
+        progress(
+            JoinEvent("open", len(images), len(images), time.perf_counter() - start)
+        )
+
+    grid = [[images[(row, col)] for col in range(cols)] for row in range(rows)]
+    if overlap:
+        x_spans = _overlap_spans([tile.width for tile in grid[0]], overlap, padded)
+        y_spans = _overlap_spans([row[0].height for row in grid], overlap, padded)
+        final_image = _join_overlapping(grid, x_spans, y_spans, blend)
+    else:
+        final_image = _join_grid(grid)
+
+    if progress is not None:
+        _report_writes(final_image, progress, start)
+    if output_path is None:
+        return final_image.write_to_buffer(fmt, **(save_options or {}))
+    final_image.write_to_file(output_path, **(save_options or {}))
+    return None
@@ -0,0 +1,127 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pyvips
+
+from image_slicer import (
+    ImageSlicer,
+    generate_encoded_tiles_async,
+    generate_tiles_async,
+    join_image_async,
+    slice_image_async,
+)
+
+TEST_IMAGE_WIDTH = 100
+TEST_IMAGE_HEIGHT = 85
+
+
+@pytest.fixture(scope="module")
+def test_image_path(tmpdir_factory):
+    """
+    Creates a temporary RGB gradient PNG image for testing.
+    """
+    path = str(tmpdir_factory.mktemp("data").join("test_image.png"))
+    xyz = pyvips.Image.xyz(TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    image = xyz[0].bandjoin([xyz[1], xyz[0] + xyz[1]]).cast("uchar")
+    image.write_to_file(path)
+    return path
+
+
+async def test_slice_and_join_image_async(test_image_path, tmp_path):
+    """
+    Tests slicing and joining an image from a coroutine.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+
+    written = await slice_image_async(
+        test_image_path, tiles_dir, cols=3, rows=2, workers=3
+    )
+    assert written == len(os.listdir(tiles_dir)) == 6
+
+    await join_image_async(tiles_dir, output_path)
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(test_image_path)
+    assert (joined - source).abs().max() == 0
+
+
+async def test_concurrent_jobs_share_a_bounded_executor(test_image_path, tmp_path):
+    """
+    Tests that several slicing jobs can run concurrently on one executor.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        await asyncio.gather(
+            *(
+                slice_image_async(
+                    test_image_path,
+                    str(tmp_path / f"job_{i}"),
+                    number_of_tiles=4,
+                    workers=2,
+                    executor=executor,
+                )
+                for i in range(4)
+            )
+        )
+
+    for i in range(4):
+        assert len(os.listdir(tmp_path / f"job_{i}")) == 4
+
+
+async def test_generate_tiles_async(test_image_path):
+    """
+    Tests iterating over tiles asynchronously.
+    """
+    slicer = ImageSlicer(test_image_path)
+    positions = []
+    async for tile, row, col in generate_tiles_async(slicer, cols=4, rows=3):
+        assert isinstance(tile, pyvips.Image)
+        positions.append((row, col))
+
+    assert positions == [(r, c) for r in range(3) for c in range(4)]
+
+
+async def test_generate_encoded_tiles_async(test_image_path):
+    """
+    Tests that encoded tiles are yielded in grid order with several workers.
+    """
+    slicer = ImageSlicer(test_image_path, streaming=True)
+    encoded = [
+        item
+        async for item in generate_encoded_tiles_async(
+            slicer, fmt=".jpg", tile_width=30, tile_height=25, workers=4
+        )
+    ]
+
+    assert [(row, col) for _, row, col in encoded] == [
+        (r, c) for r in range(4) for c in range(4)
+    ]
+    assert all(data[:2] == b"\xff\xd8" for data, _, _ in encoded)
+
+
+async def test_slice_image_async_propagates_errors(tmp_path):
+    """
+    Tests that errors from the executor are raised in the coroutine.
+    """
+    with pytest.raises(pyvips.Error):
+        await slice_image_async("missing.png", str(tmp_path), number_of_tiles=4)
+
+
+async def test_slice_image_async_writes_tiles_atomically(
+    test_image_path, tmp_path, monkeypatch
+):
+    """
+    Tests that tiles only appear under their final name once fully written.
+    """
+    tiles_dir = tmp_path / "tiles"
+
+    def interrupted(src, dst):
+        raise OSError("interrupted")
+
+    monkeypatch.setattr("image_slicer.slicer.os.replace", interrupted)
+    with pytest.raises(OSError, match="interrupted"):
+        await slice_image_async(test_image_path, str(tiles_dir), cols=2, rows=2)
+
+    names = os.listdir(tiles_dir)
+    assert names and all(".partial" in name for name in names)
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 from unittest.mock import patch
@@ -5,7 +6,9 @@ from unittest.mock import patch
 import pytest
 import pyvips
 
+from image_slicer import TileArchive
 from image_slicer.cli import main
+from image_slicer.join_cli import main as join_main
 
 
 @pytest.fixture(scope="module")
@@ -158,6 +161,352 @@ def test_main_custom_format_short_form(test_image_path, tmp_path):
     assert "piece_1_1.png" in files
 
 
+def test_main_with_workers(test_image_path, tmp_path):
+    """
+    Tests the CLI main function with the workers option.
+    """
+    output_dir = str(tmp_path / "output_cli_workers")
+
+    with patch(
+        "sys.argv",
+        ["imslice", test_image_path, output_dir, "-g", "4", "3", "--workers", "3"],
+    ):
+        main()
+
+    files = os.listdir(output_dir)
+    assert len(files) == 12
+
+
+def test_main_with_archive(test_image_path, tmp_path):
+    """
+    Tests the CLI main function writing a tile archive.
+    """
+    archive_path = tmp_path / "tiles.zip"
+
+    with patch(
+        "sys.argv",
+        ["imslice", test_image_path, str(archive_path), "-g", "2", "2", "--archive"],
+    ):
+        main()
+
+    assert archive_path.is_file()
+    with TileArchive(str(archive_path)) as archive:
+        assert (archive.rows, archive.cols) == (2, 2)
+
+
+def test_join_main_with_archive_naming_format(test_image_path, tmp_path):
+    """
+    Tests that imjoin reads an archive with the naming format it records.
+    """
+    archive_path = str(tmp_path / "tiles.zip")
+    output_path = str(tmp_path / "joined.png")
+    with patch(
+        "sys.argv",
+        [
+            "imslice",
+            test_image_path,
+            archive_path,
+            "-g",
+            "2",
+            "2",
+            "-f",
+            "t_{row}_{col}.png",
+            "--archive",
+        ],
+    ):
+        main()
+
+    with patch("sys.argv", ["imjoin", archive_path, output_path]):
+        join_main()
+
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined.width, joined.height) == (100, 85)
+
+
+def test_main_with_save_options(test_image_path, tmp_path):
+    """
+    Tests that encoder options are collected and passed to slice_image.
+    """
+    with (
+        patch("image_slicer.cli.slice_image") as mock_slice_image,
+        patch(
+            "sys.argv",
+            [
+                "imslice",
+                test_image_path,
+                str(tmp_path),
+                "-g",
+                "2",
+                "2",
+                "-q",
+                "80",
+                "--strip",
+                "--save-option",
+                "tile=true",
+                "--save-option",
+                "compression=deflate",
+            ],
+        ),
+    ):
+        main()
+
+    assert mock_slice_image.call_args.kwargs["save_options"] == {
+        "Q": 80,
+        "strip": True,
+        "tile": True,
+        "compression": "deflate",
+    }
+
+
+def test_main_with_malformed_save_option(test_image_path, tmp_path):
+    """
+    Tests that a save option without '=' is rejected.
+    """
+    with patch(
+        "sys.argv",
+        ["imslice", test_image_path, str(tmp_path), "-n", "4", "--save-option", "Q"],
+    ):
+        with pytest.raises(SystemExit):
+            main()
+
+
+def test_join_main_with_save_options(test_image_path, tmp_path):
+    """
+    Tests the imjoin CLI with encoder options.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    with patch("sys.argv", ["imslice", test_image_path, tiles_dir, "-n", "4"]):
+        main()
+
+    with patch("sys.argv", ["imjoin", tiles_dir, output_path, "--compression", "1"]):
+        join_main()
+
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined.width, joined.height) == (100, 85)
+
+
+def test_join_main_with_tiled_tiff(test_image_path, tmp_path):
+    """
+    Tests writing a tiled TIFF with imjoin, and its argument checks.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.tif")
+    with patch("sys.argv", ["imslice", test_image_path, tiles_dir, "-n", "4"]):
+        main()
+
+    args = ["--tiled-tiff", "--tiff-tile-size", "32", "--no-pyramid"]
+    with patch("sys.argv", ["imjoin", tiles_dir, output_path, *args]):
+        join_main()
+
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined.width, joined.height) == (100, 85)
+    assert joined.get("n-pages") == 1
+
+    for argv in (
+        [tiles_dir, str(tmp_path / "joined.png"), "--tiled-tiff"],
+        [tiles_dir, output_path, "--tiled-tiff", "--tiff-tile-size", "40"],
+        [tiles_dir, output_path, "--no-pyramid"],
+    ):
+        with patch("sys.argv", ["imjoin", *argv]):
+            with pytest.raises(SystemExit):
+                join_main()
+
+
+def test_main_with_several_sources(test_image_path, tmp_path, capsys):
+    """
+    Tests slicing several images into per-image subdirectories.
+    """
+    other_path = str(tmp_path / "other.png")
+    pyvips.Image.black(40, 30).write_to_file(other_path)
+    output_dir = tmp_path / "tiles"
+
+    with patch(
+        "sys.argv",
+        ["imslice", test_image_path, other_path, str(output_dir), "-g", "2", "2"],
+    ):
+        main()
+
+    assert sorted(os.listdir(output_dir)) == ["other", "test_image"]
+    assert len(os.listdir(output_dir / "other")) == 4
+    assert "Sliced 2 of 2 images into 8 tiles" in capsys.readouterr().err
+
+
+def test_main_with_unmatched_pattern(tmp_path, capsys):
+    """
+    Tests that a glob pattern matching no images is reported as an error.
+    """
+    pattern = str(tmp_path / "*.png")
+    with patch("sys.argv", ["imslice", pattern, str(tmp_path / "tiles"), "-n", "4"]):
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+    assert excinfo.value.code == 2
+    assert "No images match" in capsys.readouterr().err
+
+
+def test_main_batch_slicing_error_is_not_a_usage_error(test_image_path, tmp_path):
+    """
+    Tests that an image failing to slice in a batch raises its error instead
+    of being reported as a command-line usage error.
+    """
+    other_path = str(tmp_path / "other.png")
+    pyvips.Image.black(40, 30).write_to_file(other_path)
+    argv = [test_image_path, other_path, str(tmp_path / "tiles"), "-n", "4"]
+
+    with patch("sys.argv", ["imslice", *argv, "--region", "50", "0", "10", "10"]):
+        with pytest.raises(ValueError, match="does not intersect"):
+            main()
+
+
+def test_main_with_sources_from_stdin(test_image_path, tmp_path, capsys):
+    """
+    Tests reading source paths from stdin and continuing past failures.
+    """
+    output_dir = tmp_path / "tiles"
+    stdin = io.StringIO(f"{test_image_path}\n{tmp_path / 'missing.png'}\n")
+
+    with (
+        patch("sys.stdin", stdin),
+        patch(
+            "sys.argv",
+            ["imslice", "-", str(output_dir), "-n", "4", "--continue-on-error"],
+        ),
+    ):
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+    assert excinfo.value.code == 1
+    assert os.listdir(output_dir) == ["test_image"]
+    err = capsys.readouterr().err
+    assert "Sliced 1 of 2 images" in err
+    assert "Failed: " in err and "missing.png" in err
+
+
+def test_main_with_progress_and_stats(test_image_path, tmp_path, capsys):
+    """
+    Tests that --progress and --stats report on stderr for imslice and imjoin.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+
+    with patch(
+        "sys.argv",
+        [
+            "imslice",
+            test_image_path,
+            tiles_dir,
+            "-g",
+            "2",
+            "2",
+            "--progress",
+            "--stats",
+        ],
+    ):
+        main()
+
+    err = capsys.readouterr().err
+    assert "4/4 tiles" in err
+    assert "Sliced 4 tiles" in err and "encode" in err
+
+    output_path = str(tmp_path / "joined.png")
+    with patch("sys.argv", ["imjoin", tiles_dir, output_path, "--stats"]):
+        join_main()
+
+    err = capsys.readouterr().err
+    assert "open 4/4" not in err
+    assert "Joined 4 tiles" in err
+
+
+def test_main_with_vips_limits(test_image_path, tmp_path, capsys):
+    """
+    Tests that --stats reports the libvips high-water marks.
+    """
+    with patch(
+        "sys.argv",
+        [
+            "imslice",
+            test_image_path,
+            str(tmp_path / "tiles"),
+            "-n",
+            "4",
+            "--vips-cache-max",
+            "0",
+            "--vips-concurrency",
+            "1",
+            "--stats",
+        ],
+    ):
+        main()
+
+    assert "libvips cache high-water: 0 operations" in capsys.readouterr().err
+
+
+def test_main_with_region_and_tile_coords(test_image_path, tmp_path):
+    """
+    Tests slicing only the tiles selected by --region and --tile-coords.
+    """
+    output_dir = tmp_path / "tiles"
+    with patch(
+        "sys.argv",
+        [
+            "imslice",
+            test_image_path,
+            str(output_dir),
+            "-g",
+            "4",
+            "4",
+            "--region",
+            "0",
+            "0",
+            "50",
+            "40",
+            "--tile-coords",
+            "0,0",
+            "1,1",
+            "3,3",
+        ],
+    ):
+        main()
+
+    assert sorted(os.listdir(output_dir)) == ["tile_0_0.png", "tile_1_1.png"]
+
+
+def test_main_with_pyramid(test_image_path, tmp_path):
+    """
+    Tests writing a pyramid with --pyramid, and its argument checks.
+    """
+    output_path = tmp_path / "pyramid"
+    with patch(
+        "sys.argv",
+        [
+            "imslice",
+            test_image_path,
+            str(output_path),
+            "-t",
+            "64",
+            "64",
+            "-f",
+            "{row}.jpg",
+            "--pyramid",
+            "google",
+            "--quality",
+            "80",
+        ],
+    ):
+        main()
+
+    assert sorted(os.listdir(output_path)) == ["0", "1", "blank.png"]
+    assert sorted(os.listdir(output_path / "1" / "1")) == ["0.jpg", "1.jpg"]
+
+    for extra in (["-t", "64", "32"], ["-t", "64", "64", "--manifest"]):
+        with patch(
+            "sys.argv",
+            ["imslice", test_image_path, str(output_path), "--pyramid", "dz", *extra],
+        ):
+            with pytest.raises(SystemExit):
+                main()
+
+
 def test_main_missing_required_argument():
     """
     Tests that CLI raises SystemExit when required mutually exclusive group is missing.
@@ -0,0 +1,58 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+import pyvips
+
+from image_slicer import ImageSlicer
+from image_slicer.server import make_server
+
+
+@pytest.fixture(scope="module")
+def tile_server(tmpdir_factory):
+    """
+    Serves 30x25 PNG tiles of a 100x85 gradient on a free local port.
+    """
+    path = str(tmpdir_factory.mktemp("data").join("gradient.png"))
+    xyz = pyvips.Image.xyz(100, 85)
+    xyz[0].bandjoin([xyz[1], xyz[0] + xyz[1]]).cast("uchar").write_to_file(path)
+    slicer = ImageSlicer(path)
+    server = make_server(slicer, 30, 25, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield slicer, f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_returns_tiles(tile_server):
+    """
+    Tests that tiles are served from the slicer's cache.
+    """
+    slicer, url = tile_server
+    with urllib.request.urlopen(f"{url}/3/2") as response:
+        assert response.headers["Content-Type"] == "image/png"
+        data = response.read()
+    with urllib.request.urlopen(f"{url}/3/2.png") as response:
+        assert response.read() == data
+
+    tile = pyvips.Image.new_from_buffer(data, "")
+    assert (tile.width, tile.height) == (30, 10)
+    with urllib.request.urlopen(f"{url}/stats") as response:
+        stats = json.load(response)
+    assert stats["hits"] >= 1 and stats["tiles"] >= 1
+
+
+@pytest.mark.parametrize("path", ["/4/0", "/tiles", "/1/x", "/3/2.jpg"])
+def test_server_rejects_unknown_tiles(tile_server, path):
+    """
+    Tests that paths outside the grid, in the wrong form or with another
+    format's extension are not found.
+    """
+    _, url = tile_server
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        urllib.request.urlopen(url + path)
+    assert excinfo.value.code == 404
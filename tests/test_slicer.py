@@ -1,11 +1,29 @@
+import hashlib
+import io
+import json
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import pyvips
 
-from image_slicer import ImageJoiner, ImageSlicer, join_image, slice_image
-from image_slicer.slicer import _get_grid_from_tiles
+from image_slicer import (
+    ImageJoiner,
+    ImageSlicer,
+    JoinEvent,
+    ProgressReporter,
+    TileArchive,
+    TileCache,
+    TileEvent,
+    VipsLimits,
+    join_image,
+    join_tiles,
+    slice_image,
+    slice_images,
+    slice_pyramid,
+)
+from image_slicer.slicer import MANIFEST_FILENAME, _get_grid_from_tiles
 
 try:
     from PIL import Image as PILImage
@@ -335,7 +353,7 @@ def test_join_image_convenience_function(test_image_path, tmp_path):
     output_path = str(tmp_path / "joined.png")
 
     # Slice the image
-    slice_image(test_image_path, tiles_dir, cols=3, rows=2)
+    assert slice_image(test_image_path, tiles_dir, cols=3, rows=2) == 6
 
     # Join using convenience function
     join_image(tiles_dir, output_path)
@@ -428,3 +446,1587 @@ def test_join_tiles_with_partial_edges(test_image_path, tmp_path):
     joined_image = pyvips.Image.new_from_file(output_path)
     assert joined_image.width == TEST_IMAGE_WIDTH
     assert joined_image.height == TEST_IMAGE_HEIGHT
+
+
+def test_slice_with_workers_matches_sequential(test_image_path, tmp_path):
+    """
+    Tests that slicing with a thread pool produces the same tiles as slicing
+    sequentially.
+    """
+    sequential_dir = str(tmp_path / "sequential")
+    parallel_dir = str(tmp_path / "parallel")
+    slicer = ImageSlicer(test_image_path)
+    slicer.slice(output_dir=sequential_dir, tile_width=30, tile_height=25)
+    slicer.slice(output_dir=parallel_dir, tile_width=30, tile_height=25, workers=4)
+
+    assert sorted(os.listdir(parallel_dir)) == sorted(os.listdir(sequential_dir))
+    for filename in os.listdir(sequential_dir):
+        expected = pyvips.Image.new_from_file(os.path.join(sequential_dir, filename))
+        actual = pyvips.Image.new_from_file(os.path.join(parallel_dir, filename))
+        assert (actual.width, actual.height) == (expected.width, expected.height)
+
+
+def test_slice_with_invalid_workers_raises_error(test_image_path, tmp_path):
+    """
+    Tests that a non-positive worker count raises a ValueError.
+    """
+    slicer = ImageSlicer(test_image_path)
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        slicer.slice(output_dir=str(tmp_path / "out"), cols=2, rows=2, workers=0)
+
+
+def test_slice_with_processes(test_image_path, tmp_path):
+    """
+    Tests that sharding the grid across processes writes every tile.
+    """
+    output_dir = str(tmp_path / "output_processes")
+    slicer = ImageSlicer(test_image_path)
+    slicer.slice(output_dir=output_dir, cols=3, rows=4, processes=2, workers=2)
+
+    files = sorted(os.listdir(output_dir))
+    assert files == sorted(f"tile_{r}_{c}.png" for r in range(4) for c in range(3))
+    tile = pyvips.Image.new_from_file(os.path.join(output_dir, "tile_3_2.png"))
+    assert tile.width == TEST_IMAGE_WIDTH - 2 * math.ceil(TEST_IMAGE_WIDTH / 3)
+
+
+def test_slice_with_processes_gathers_errors(test_image_path, tmp_path):
+    """
+    Tests that failures in worker processes are reported in the parent.
+    """
+    slicer = ImageSlicer(test_image_path)
+    with pytest.raises(RuntimeError, match="2 of 2 slicing processes failed"):
+        slicer.slice(
+            output_dir=str(tmp_path / "output_processes_error"),
+            naming_format="tile_{row}_{col}.not-an-image-format",
+            cols=2,
+            rows=2,
+            processes=2,
+        )
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL/Pillow not available")
+def test_slice_with_processes_requires_file_source(tmp_path):
+    """
+    Tests that process sharding is rejected for in-memory sources.
+    """
+    pil_image = PILImage.new("RGB", (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT))
+    slicer = ImageSlicer(pil_image)
+    with pytest.raises(ValueError, match="processes requires"):
+        slicer.slice(output_dir=str(tmp_path / "out"), cols=2, rows=2, processes=2)
+
+
+@pytest.fixture(scope="module")
+def gradient_image_path(tmpdir_factory):
+    """
+    Creates a temporary RGB gradient PNG so that every tile has distinct pixels.
+    """
+    path = str(tmpdir_factory.mktemp("data").join("gradient.png"))
+    xyz = pyvips.Image.xyz(TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    image = xyz[0].bandjoin([xyz[1], xyz[0] + xyz[1]]).cast("uchar")
+    image.write_to_file(path)
+    return path
+
+
+def test_streaming_generate_tiles_matches_random_access(gradient_image_path):
+    """
+    Tests that streaming mode yields the same tiles as random access.
+    """
+    random_tiles = ImageSlicer(gradient_image_path).generate_tiles(
+        tile_width=30, tile_height=25
+    )
+    streaming_slicer = ImageSlicer(gradient_image_path, streaming=True)
+    streaming_tiles = streaming_slicer.generate_tiles(tile_width=30, tile_height=25)
+
+    for (expected, r1, c1), (actual, r2, c2) in zip(random_tiles, streaming_tiles):
+        assert (r1, c1) == (r2, c2)
+        assert (actual.width, actual.height) == (expected.width, expected.height)
+        assert (actual - expected).abs().max() == 0
+
+
+def test_streaming_slice(gradient_image_path, tmp_path):
+    """
+    Tests slicing a sequentially-read source.
+    """
+    output_dir = str(tmp_path / "output_streaming")
+    slice_image(gradient_image_path, output_dir, cols=3, rows=3, streaming=True)
+
+    assert len(os.listdir(output_dir)) == 9
+    tile = pyvips.Image.new_from_file(os.path.join(output_dir, "tile_2_2.png"))
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    expected = source.crop(68, 58, tile.width, tile.height)
+    assert (tile - expected).abs().max() == 0
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL/Pillow not available")
+@pytest.mark.parametrize(
+    "mode, bands, band_format",
+    [
+        ("L", 1, "uchar"),
+        ("LA", 2, "uchar"),
+        ("RGB", 3, "uchar"),
+        ("RGBA", 4, "uchar"),
+        ("I;16", 1, "ushort"),
+        ("F", 1, "float"),
+        ("P", 3, "uchar"),
+        ("1", 1, "uchar"),
+    ],
+)
+def test_pil_image_modes(mode, bands, band_format):
+    """
+    Tests that PIL images are wrapped with the right band count and format.
+    """
+    pil_image = PILImage.new(mode, (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT))
+    slicer = ImageSlicer(pil_image)
+    assert slicer.image.bands == bands
+    assert slicer.image.format == band_format
+    assert (slicer.width, slicer.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL/Pillow not available")
+def test_pil_image_pixels_are_preserved():
+    """
+    Tests that pixel values survive wrapping a PIL image.
+    """
+    pil_image = PILImage.new("RGB", (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT))
+    pil_image.putpixel((10, 20), (1, 2, 3))
+    slicer = ImageSlicer(pil_image)
+    assert slicer.image(10, 20) == [1.0, 2.0, 3.0]
+    assert slicer.image.interpretation == "srgb"
+
+
+def test_numpy_array_input(tmp_path):
+    """
+    Tests that NumPy arrays are accepted as sources.
+    """
+    np = pytest.importorskip("numpy")
+    array = np.zeros((TEST_IMAGE_HEIGHT, TEST_IMAGE_WIDTH, 3), dtype=np.uint8)
+    array[20, 10] = (1, 2, 3)
+    slicer = ImageSlicer(array)
+
+    assert slicer.source_path is None
+    assert (slicer.width, slicer.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    assert slicer.image.bands == 3
+    assert slicer.image(10, 20) == [1.0, 2.0, 3.0]
+
+    output_dir = str(tmp_path / "output_numpy")
+    slicer.slice(output_dir=output_dir, cols=2, rows=2)
+    assert len(os.listdir(output_dir)) == 4
+
+
+@pytest.mark.parametrize(
+    "dtype, band_format",
+    [("uint16", "ushort"), ("int16", "short"), ("float32", "float"), (">f8", "double")],
+)
+def test_numpy_array_dtypes(dtype, band_format):
+    """
+    Tests that 2D arrays of various dtypes map onto single-band images.
+    """
+    np = pytest.importorskip("numpy")
+    array = np.arange(TEST_IMAGE_WIDTH * TEST_IMAGE_HEIGHT, dtype=dtype).reshape(
+        TEST_IMAGE_HEIGHT, TEST_IMAGE_WIDTH
+    )
+    slicer = ImageSlicer(array)
+    assert slicer.image.bands == 1
+    assert slicer.image.format == band_format
+    assert slicer.image(3, 2) == [2 * TEST_IMAGE_WIDTH + 3]
+
+
+def test_non_contiguous_numpy_array_input():
+    """
+    Tests that strided views are copied into a contiguous layout.
+    """
+    np = pytest.importorskip("numpy")
+    array = np.arange(40 * 60, dtype=np.uint8).reshape(40, 60)[::2, ::3]
+    slicer = ImageSlicer(array)
+    assert (slicer.width, slicer.height) == (20, 20)
+    assert slicer.image(1, 1) == [float(array[1, 1])]
+
+
+def test_numpy_array_with_invalid_shape_raises_error():
+    """
+    Tests that arrays which are not 2D or 3D are rejected.
+    """
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Array sources must have shape"):
+        ImageSlicer(np.zeros((2, 3, 4, 5), dtype=np.uint8))
+
+
+def test_generate_tile_batches_with_padding(gradient_image_path):
+    """
+    Tests that batches have a fixed shape, reuse one buffer and pad edges.
+    """
+    np = pytest.importorskip("numpy")
+    slicer = ImageSlicer(gradient_image_path)
+    source = slicer.image.numpy()
+
+    batches = []
+    buffer_ids = set()
+    for batch, positions in slicer.generate_tile_batches(
+        batch_size=4, tile_width=30, tile_height=25, fill=7
+    ):
+        assert batch.flags["C_CONTIGUOUS"]
+        assert batch.shape[1:] == (25, 30, 3)
+        assert len(positions) == batch.shape[0]
+        buffer_ids.add(id(batch if batch.base is None else batch.base))
+        batches.append((batch.copy(), positions))
+
+    # 4 cols x 4 rows, in batches of 4, backed by a single buffer.
+    assert [len(positions) for _, positions in batches] == [4, 4, 4, 4]
+    assert len(buffer_ids) == 1
+
+    batch, positions = batches[0]
+    assert positions[1] == (0, 1)
+    assert np.array_equal(batch[1], source[0:25, 30:60])
+
+    # Tile (0, 3) is 10 pixels wide; the rest of it is padding.
+    assert np.array_equal(batch[3, :, :10], source[0:25, 90:100])
+    assert (batch[3, :, 10:] == 7).all()
+
+
+def test_generate_tile_batches_without_padding(gradient_image_path):
+    """
+    Tests that partial tiles are yielded at their own size when not padding.
+    """
+    pytest.importorskip("numpy")
+    slicer = ImageSlicer(gradient_image_path)
+    shapes = {}
+    for batch, positions in slicer.generate_tile_batches(
+        batch_size=3, tile_width=30, tile_height=25, pad=False, workers=2
+    ):
+        for position in positions:
+            shapes[position] = batch.shape[1:3]
+
+    assert len(shapes) == 16
+    assert shapes[(0, 0)] == (25, 30)
+    assert shapes[(0, 3)] == (25, 10)
+    assert shapes[(3, 0)] == (10, 30)
+    assert shapes[(3, 3)] == (10, 10)
+
+
+def test_slice_to_archive_and_read_tiles(gradient_image_path, tmp_path):
+    """
+    Tests packing tiles into an archive and reading them back at random.
+    """
+    archive_path = str(tmp_path / "tiles.zip")
+    slicer = ImageSlicer(gradient_image_path)
+    slicer.slice_to_archive(archive_path, tile_width=30, tile_height=25, workers=2)
+
+    with TileArchive(archive_path) as archive:
+        assert (archive.rows, archive.cols) == (4, 4)
+        assert archive.naming_format == "tile_{row}_{col}.png"
+        assert (3, 3) in archive
+        assert (4, 0) not in archive
+
+        tile = archive.open_tile(2, 1)
+        expected = slicer.image.crop(30, 50, 30, 25)
+        assert (tile - expected).abs().max() == 0
+
+        with pytest.raises(KeyError):
+            archive.read(9, 9)
+
+
+def test_archive_entries_are_stored_uncompressed(test_image_path, tmp_path):
+    """
+    Tests that the archive is a plain zip file with stored entries.
+    """
+    import zipfile
+
+    archive_path = str(tmp_path / "tiles.zip")
+    ImageSlicer(test_image_path).slice_to_archive(
+        archive_path, naming_format="t_{row}_{col}.jpg", cols=2, rows=2
+    )
+
+    with zipfile.ZipFile(archive_path) as archive:
+        infos = archive.infolist()
+        assert sorted(info.filename for info in infos) == [
+            "t_0_0.jpg",
+            "t_0_1.jpg",
+            "t_1_0.jpg",
+            "t_1_1.jpg",
+        ]
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in infos)
+
+
+def test_join_from_archive(gradient_image_path, tmp_path):
+    """
+    Tests that ImageJoiner can rebuild the image from a tile archive.
+    """
+    archive_path = str(tmp_path / "tiles.zip")
+    output_path = str(tmp_path / "joined.png")
+    ImageSlicer(gradient_image_path).slice_to_archive(archive_path, cols=3, rows=3)
+
+    join_image(archive_path, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined.width, joined.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_from_archive_uses_recorded_naming_format(gradient_image_path, tmp_path):
+    """
+    Tests that joining an archive defaults to the naming format it records.
+    """
+    archive_path = str(tmp_path / "tiles.zip")
+    output_path = str(tmp_path / "joined.png")
+    ImageSlicer(gradient_image_path).slice_to_archive(
+        archive_path, naming_format="t/{row:02d}-{col:02d}.png", cols=2, rows=2
+    )
+
+    join_image(archive_path, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source).abs().max() == 0
+    with ImageJoiner(archive_path) as joiner:
+        assert joiner.naming_format == "t/{row:02d}-{col:02d}.png"
+
+
+def test_join_from_archive_closes_it(gradient_image_path, tmp_path, monkeypatch):
+    """
+    Tests that the archive opened by a joiner is closed after joining.
+    """
+    archive_path = str(tmp_path / "tiles.zip")
+    output_path = str(tmp_path / "joined.png")
+    ImageSlicer(gradient_image_path).slice_to_archive(archive_path, cols=2, rows=2)
+
+    with ImageJoiner(archive_path) as joiner:
+        joiner.join(output_path)
+    assert joiner.archive._zip.fp is None
+
+    closed = []
+    close = TileArchive.close
+    monkeypatch.setattr(
+        TileArchive, "close", lambda self: closed.append(self) or close(self)
+    )
+    join_image(archive_path, output_path)
+    assert len(closed) == 1
+
+
+def test_tile_archive_rejects_non_zip_files(test_image_path):
+    """
+    Tests that opening something other than an archive raises ValueError.
+    """
+    with pytest.raises(ValueError, match="Not a tile archive"):
+        TileArchive(test_image_path)
+
+
+def test_slice_with_save_options(gradient_image_path, tmp_path):
+    """
+    Tests that save options are passed through to the tile encoder.
+    """
+    fast_dir = str(tmp_path / "fast")
+    small_dir = str(tmp_path / "small")
+    slicer = ImageSlicer(gradient_image_path)
+    slicer.slice(fast_dir, cols=2, rows=2, save_options={"compression": 0})
+    slicer.slice(small_dir, cols=2, rows=2, save_options={"compression": 9})
+
+    fast_size = os.path.getsize(os.path.join(fast_dir, "tile_0_0.png"))
+    small_size = os.path.getsize(os.path.join(small_dir, "tile_0_0.png"))
+    assert small_size < fast_size
+
+
+def test_join_with_save_options(gradient_image_path, tmp_path):
+    """
+    Tests that save options are passed through to the output encoder.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    slice_image(gradient_image_path, tiles_dir, cols=2, rows=2)
+
+    high_path = str(tmp_path / "high.jpg")
+    low_path = str(tmp_path / "low.jpg")
+    join_image(tiles_dir, high_path, save_options={"Q": 95})
+    join_image(tiles_dir, low_path, save_options={"Q": 5, "strip": True})
+
+    assert os.path.getsize(low_path) < os.path.getsize(high_path)
+
+
+def test_generate_encoded_tiles(gradient_image_path):
+    """
+    Tests that tiles are yielded as encoded bytes in grid order.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    encoded = list(
+        slicer.generate_encoded_tiles(fmt=".webp", cols=3, rows=2, workers=3)
+    )
+
+    assert [(row, col) for _, row, col in encoded] == [
+        (r, c) for r in range(2) for c in range(3)
+    ]
+    data, _, _ = encoded[4]
+    assert data[8:12] == b"WEBP"
+    tile = pyvips.Image.new_from_buffer(data, "")
+    assert (tile.width, tile.height) == (34, 42)
+
+
+def test_generate_encoded_tiles_with_save_options(gradient_image_path):
+    """
+    Tests that save options are applied when encoding in memory.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    lossless = next(
+        slicer.generate_encoded_tiles(
+            fmt=".webp", cols=2, rows=2, save_options={"lossless": True}
+        )
+    )
+    decoded = pyvips.Image.new_from_buffer(lossless[0], "")
+    assert (decoded - slicer.image.crop(0, 0, 50, 43)).abs().max() == 0
+
+
+def test_join_many_tiles_with_partial_edges(gradient_image_path, tmp_path):
+    """
+    Tests that joining a large grid of partial-edged tiles restores the source.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(gradient_image_path, tiles_dir, tile_width=7, tile_height=6)
+
+    join_image(tiles_dir, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined.width, joined.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_single_tile(gradient_image_path, tmp_path):
+    """
+    Tests joining a grid with a single tile.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(gradient_image_path, tiles_dir, number_of_tiles=1)
+
+    join_image(tiles_dir, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined.width, joined.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+
+
+@pytest.mark.parametrize("naming_format", ["tile_{row}_{col}.png", "t_{row}_{col}.jpg"])
+def test_streaming_join(gradient_image_path, tmp_path, naming_format):
+    """
+    Tests that a streaming join matches the source and cleans up after itself.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_dir = tmp_path / "joined"
+    output_dir.mkdir()
+    output_path = str(output_dir / "joined.png")
+    slice_image(
+        gradient_image_path,
+        tiles_dir,
+        naming_format=naming_format,
+        tile_width=30,
+        tile_height=25,
+    )
+
+    join_image(tiles_dir, output_path, naming_format=naming_format, streaming=True)
+
+    assert os.listdir(output_dir) == ["joined.png"]
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined.width, joined.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    assert joined.bands == 3
+    if naming_format.endswith(".png"):
+        assert (joined - source).abs().max() == 0
+
+
+def test_streaming_join_from_archive(gradient_image_path, tmp_path):
+    """
+    Tests a streaming join reading 16-bit tiles from an archive.
+    """
+    pytest.importorskip("numpy")
+    source = (pyvips.Image.new_from_file(gradient_image_path) * 256).cast("ushort")
+    source = source.copy(interpretation="rgb16")
+    archive_path = str(tmp_path / "tiles.zip")
+    output_path = str(tmp_path / "joined.png")
+    ImageSlicer(source.numpy()).slice_to_archive(archive_path, cols=3, rows=3)
+
+    join_image(archive_path, output_path, streaming=True)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    assert joined.format == "ushort"
+    assert (joined - source).abs().max() == 0
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_slice_writes_manifest(gradient_image_path, tmp_path, processes):
+    """
+    Tests that the manifest describes the source, the grid and every tile.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(
+        gradient_image_path,
+        str(tiles_dir),
+        tile_width=30,
+        tile_height=25,
+        processes=processes,
+        manifest=True,
+    )
+
+    manifest = json.loads((tiles_dir / MANIFEST_FILENAME).read_text())
+    assert (manifest["width"], manifest["height"]) == (
+        TEST_IMAGE_WIDTH,
+        TEST_IMAGE_HEIGHT,
+    )
+    assert (manifest["tile_width"], manifest["tile_height"]) == (30, 25)
+    assert (manifest["rows"], manifest["cols"]) == (4, 4)
+    assert manifest["bands"] == 3
+    assert manifest["suffix"] == ".png"
+    assert [(row, col) for row, col, _, _ in manifest["tiles"]] == [
+        (r, c) for r in range(4) for c in range(4)
+    ]
+    for row, col, size, checksum in manifest["tiles"]:
+        data = (tiles_dir / f"tile_{row}_{col}.png").read_bytes()
+        assert len(data) == size
+        assert hashlib.sha256(data).hexdigest() == checksum
+
+
+def test_join_uses_manifest_instead_of_discovery(
+    gradient_image_path, tmp_path, monkeypatch
+):
+    """
+    Tests that a join planned from the manifest does not scan the directory.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(gradient_image_path, tiles_dir, cols=3, rows=2, manifest=True)
+
+    def fail(self):
+        raise AssertionError("tiles directory was scanned")
+
+    monkeypatch.setattr(ImageJoiner, "_discover_tiles", fail)
+    join_image(tiles_dir, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_ignores_manifest_for_other_naming_format(gradient_image_path, tmp_path):
+    """
+    Tests that a manifest for a different naming format falls back to discovery.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    slice_image(gradient_image_path, tiles_dir, cols=2, rows=2, manifest=True)
+
+    joiner = ImageJoiner(tiles_dir, naming_format="tile_{row}_{col}.jpg")
+
+    assert joiner.manifest is None
+
+
+def test_slice_without_manifest_removes_stale_manifest(gradient_image_path, tmp_path):
+    """
+    Tests that re-slicing without a manifest removes the old one.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2, manifest=True)
+    slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2)
+
+    assert not (tiles_dir / MANIFEST_FILENAME).exists()
+    assert ImageJoiner(str(tiles_dir)).manifest is None
+
+
+def test_slice_without_manifest_keeps_foreign_manifest(gradient_image_path, tmp_path):
+    """
+    Tests that a manifest.json this library did not write is not removed.
+    """
+    tiles_dir = tmp_path / "tiles"
+    tiles_dir.mkdir()
+    for content in ('{"mine": 1}', '{"version": 1, "tiles": []}'):
+        (tiles_dir / MANIFEST_FILENAME).write_text(content)
+        slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2)
+
+        assert (tiles_dir / MANIFEST_FILENAME).read_text() == content
+
+
+def test_join_naming_format_is_escaped(gradient_image_path, tmp_path):
+    """
+    Tests that "." in the naming format only matches a literal dot.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2)
+    (tiles_dir / "tile_5_5xpng").write_bytes(b"not a tile")
+
+    joiner = ImageJoiner(str(tiles_dir))
+
+    assert sorted(joiner._discover_tiles()) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+
+def test_join_with_format_spec(gradient_image_path, tmp_path):
+    """
+    Tests joining tiles named with zero-padded placeholders.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    naming_format = "r{row:03d}[c{col:03d}].png"
+    slice_image(gradient_image_path, tiles_dir, naming_format, cols=3, rows=2)
+    assert "r001[c002].png" in os.listdir(tiles_dir)
+
+    join_image(tiles_dir, output_path, naming_format)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_recursive(gradient_image_path, tmp_path):
+    """
+    Tests joining tiles laid out in one subdirectory per row.
+    """
+    tiles_dir = tmp_path / "tiles"
+    output_path = str(tmp_path / "joined.png")
+    slicer = ImageSlicer(gradient_image_path)
+    for tile, row, col in slicer.generate_tiles(cols=3, rows=2):
+        (tiles_dir / str(row)).mkdir(parents=True, exist_ok=True)
+        tile.write_to_file(str(tiles_dir / str(row) / f"{col}.png"))
+
+    with pytest.raises(ValueError, match="No tiles found"):
+        join_image(str(tiles_dir), output_path, "{row}/{col}.png")
+    join_image(str(tiles_dir), output_path, "{row}/{col}.png", recursive=True)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_with_unsupported_placeholder_raises_error(test_image_path, tmp_path):
+    """
+    Tests that naming formats with unknown placeholders are rejected.
+    """
+    slice_image(test_image_path, str(tmp_path), cols=2, rows=2)
+
+    with pytest.raises(ValueError, match="Unsupported placeholder"):
+        join_image(str(tmp_path), str(tmp_path / "out.png"), "{name}_{row}_{col}.png")
+
+
+def test_resume_only_writes_missing_and_stale_tiles(gradient_image_path, tmp_path):
+    """
+    Tests that a resumed slice keeps current tiles and rewrites the rest.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(gradient_image_path, str(tiles_dir), cols=3, rows=2)
+    source_mtime = os.stat(gradient_image_path).st_mtime
+    (tiles_dir / "tile_0_0.png").write_bytes(b"kept")
+    (tiles_dir / "tile_0_1.png").write_bytes(b"")
+    (tiles_dir / "tile_0_2.png").unlink()
+    (tiles_dir / "tile_1_0.png").write_bytes(b"stale")
+    os.utime(tiles_dir / "tile_1_0.png", (source_mtime - 10, source_mtime - 10))
+
+    slice_image(gradient_image_path, str(tiles_dir), cols=3, rows=2, resume=True)
+
+    assert (tiles_dir / "tile_0_0.png").read_bytes() == b"kept"
+    for name in ("tile_0_1.png", "tile_0_2.png", "tile_1_0.png"):
+        assert pyvips.Image.new_from_file(str(tiles_dir / name)).bands == 3
+    assert sorted(os.listdir(tiles_dir)) == sorted(
+        f"tile_{r}_{c}.png" for r in range(2) for c in range(3)
+    )
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_resume_removes_partial_files(gradient_image_path, tmp_path, processes):
+    """
+    Tests that a resumed slice removes the temporary files of an
+    interrupted run, next to kept and rewritten tiles alike.
+    """
+    tiles_dir = tmp_path / "tiles"
+    options = {"cols": 2, "rows": 2, "processes": processes}
+    slice_image(gradient_image_path, str(tiles_dir), **options)
+    (tiles_dir / "tile_1_1.png").unlink()
+    for name in ("tile_0_0.png", "tile_1_1.png"):
+        (tiles_dir / f"{name}.partial.png").write_bytes(b"interrupted")
+
+    slice_image(gradient_image_path, str(tiles_dir), resume=True, **options)
+
+    assert sorted(os.listdir(tiles_dir)) == [
+        f"tile_{r}_{c}.png" for r in range(2) for c in range(2)
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_resume_checks_manifest_sizes(gradient_image_path, tmp_path, processes):
+    """
+    Tests that a resumed slice rewrites tiles whose size differs from the
+    manifest, and records every tile in the new manifest.
+    """
+    tiles_dir = tmp_path / "tiles"
+    options = {"cols": 3, "rows": 2, "processes": processes, "manifest": True}
+    slice_image(gradient_image_path, str(tiles_dir), **options)
+    expected = (tiles_dir / MANIFEST_FILENAME).read_text()
+    (tiles_dir / "tile_1_2.png").write_bytes(b"truncated")
+
+    slice_image(gradient_image_path, str(tiles_dir), resume=True, **options)
+
+    assert (tiles_dir / MANIFEST_FILENAME).read_text() == expected
+
+
+def test_slice_leaves_no_partial_files(gradient_image_path, tmp_path):
+    """
+    Tests that tiles are renamed into place after being written.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2, workers=2)
+
+    assert not [name for name in os.listdir(tiles_dir) if "partial" in name]
+
+
+@pytest.fixture(scope="module")
+def sparse_image_path(tmpdir_factory):
+    """
+    Creates a mostly white RGB PNG with a gradient patch in one corner.
+    """
+    path = str(tmpdir_factory.mktemp("data").join("sparse_image.png"))
+    xyz = pyvips.Image.xyz(40, 30)
+    patch = xyz[0].bandjoin([xyz[1], xyz[0] + xyz[1]]).cast("uchar")
+    image = pyvips.Image.black(TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT, bands=3) + 255
+    image = image.cast("uchar").insert(patch, 0, 0)
+    image.write_to_file(path)
+    return path
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_slice_skips_blank_tiles(sparse_image_path, tmp_path, processes):
+    """
+    Tests that skipped blank tiles are recorded and rebuilt by the joiner.
+    """
+    tiles_dir = tmp_path / "tiles"
+    output_path = str(tmp_path / "joined.png")
+    slice_image(
+        sparse_image_path,
+        str(tiles_dir),
+        tile_width=30,
+        tile_height=25,
+        processes=processes,
+        blank="skip",
+    )
+
+    manifest = json.loads((tiles_dir / MANIFEST_FILENAME).read_text())
+    written = {(row, col) for row, col, _, _ in manifest["tiles"]}
+    assert written == {(0, 0), (0, 1), (1, 0), (1, 1)}
+    assert len(manifest["blank"]) == 12
+    assert all(fill == [255, 255, 255] for _, _, fill in manifest["blank"])
+    assert len(os.listdir(tiles_dir)) == 5
+
+    join_image(str(tiles_dir), output_path)
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(sparse_image_path)
+    assert (joined - source).abs().max() == 0
+
+
+def test_slice_links_blank_tiles(sparse_image_path, tmp_path):
+    """
+    Tests that uniform tiles of the same size share one file.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(
+        sparse_image_path, str(tiles_dir), tile_width=30, tile_height=25, blank="link"
+    )
+
+    assert len(os.listdir(tiles_dir)) == 16
+    assert os.path.samefile(tiles_dir / "tile_0_2.png", tiles_dir / "tile_2_2.png")
+    assert not os.path.samefile(tiles_dir / "tile_0_2.png", tiles_dir / "tile_0_3.png")
+    assert not os.path.samefile(tiles_dir / "tile_0_0.png", tiles_dir / "tile_2_2.png")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_slice_reports_progress(sparse_image_path, tmp_path, processes):
+    """
+    Tests that every tile is reported once with its status and size.
+    """
+    tiles_dir = tmp_path / "tiles"
+    events = []
+    slice_image(
+        sparse_image_path,
+        str(tiles_dir),
+        tile_width=30,
+        tile_height=25,
+        processes=processes,
+        blank="link",
+        progress=events.append,
+    )
+
+    assert all(isinstance(event, TileEvent) for event in events)
+    assert [event.done for event in events] == list(range(1, 17))
+    assert {event.total for event in events} == {16}
+    assert sorted((e.row, e.col) for e in events) == [
+        (r, c) for r in range(4) for c in range(4)
+    ]
+    written = [e for e in events if e.status == "written"]
+    inodes = {os.stat(tiles_dir / name).st_ino for name in os.listdir(tiles_dir)}
+    assert len(written) == len(inodes)
+    assert all(
+        e.status == "linked" and e.bytes_written == 0
+        for e in events
+        if e not in written
+    )
+    for event in written:
+        path = tiles_dir / f"tile_{event.row}_{event.col}.png"
+        assert event.bytes_written == os.path.getsize(path)
+        assert event.encode_seconds > 0
+
+
+def test_slice_reports_kept_tiles_on_resume(gradient_image_path, tmp_path):
+    """
+    Tests that tiles kept by resume are reported as kept.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(gradient_image_path, str(tiles_dir), cols=2, rows=2)
+    os.remove(tiles_dir / "tile_1_1.png")
+
+    events = []
+    slice_image(
+        gradient_image_path,
+        str(tiles_dir),
+        cols=2,
+        rows=2,
+        resume=True,
+        progress=events.append,
+    )
+
+    statuses = {(e.row, e.col): e.status for e in events}
+    assert statuses == {
+        (0, 0): "kept",
+        (0, 1): "kept",
+        (1, 0): "kept",
+        (1, 1): "written",
+    }
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_join_reports_progress(gradient_image_path, tmp_path, streaming):
+    """
+    Tests that joining reports opened tiles and then written pixels.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    slice_image(gradient_image_path, tiles_dir, cols=3, rows=2)
+    events = []
+
+    join_image(
+        tiles_dir,
+        str(tmp_path / "joined.png"),
+        streaming=streaming,
+        progress=events.append,
+    )
+
+    assert all(isinstance(event, JoinEvent) for event in events)
+    opened = [(e.done, e.total) for e in events if e.stage == "open"]
+    assert opened == [(3, 6), (6, 6)]
+    writes = [e for e in events if e.stage == "write"]
+    assert writes and events[-1].stage == "write"
+    assert writes[-1].done == writes[-1].total == TEST_IMAGE_WIDTH * TEST_IMAGE_HEIGHT
+
+
+def test_progress_reporter_summary(gradient_image_path, tmp_path):
+    """
+    Tests that the reporter's live line and summary describe the job.
+    """
+    stream = io.StringIO()
+    reporter = ProgressReporter(stream)
+    slice_image(
+        gradient_image_path, str(tmp_path / "tiles"), cols=2, rows=2, progress=reporter
+    )
+    reporter.close()
+
+    assert "4/4 tiles" in stream.getvalue()
+    assert stream.getvalue().endswith("\n")
+    assert reporter.tiles == 4
+    assert reporter.statuses == {"written": 4}
+    summary = reporter.summary()
+    assert summary.startswith("Sliced 4 tiles")
+    assert "encode" in summary
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_slice_applies_and_restores_limits(gradient_image_path, tmp_path, processes):
+    """
+    Tests that libvips limits apply while slicing and are restored after.
+    """
+    before = (pyvips.cache_get_max(), pyvips.concurrency_get())
+    limits = VipsLimits(cache_max=7, cache_max_mem=2**20, concurrency=3)
+    seen = set()
+
+    def check_limits(event):
+        seen.add((pyvips.cache_get_max(), pyvips.concurrency_get()))
+
+    slicer = ImageSlicer(gradient_image_path, limits=limits)
+    slicer.slice(str(tmp_path / "tiles"), cols=2, rows=2, processes=processes)
+    with limits:
+        slice_image(
+            gradient_image_path,
+            str(tmp_path / "more"),
+            cols=2,
+            rows=2,
+            progress=check_limits,
+        )
+
+    assert seen == {(7, 3)}
+    assert (pyvips.cache_get_max(), pyvips.concurrency_get()) == before
+    assert 0 <= limits.cache_highwater <= 7
+    assert limits.rss_highwater is None or limits.rss_highwater > 0
+    assert limits.report()["cache_max"] == 7
+
+
+def test_join_applies_limits(gradient_image_path, tmp_path):
+    """
+    Tests that a joiner's limits cap the libvips cache while joining.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    slice_image(gradient_image_path, tiles_dir, cols=3, rows=2)
+    limits = VipsLimits(cache_max=0)
+
+    join_image(tiles_dir, str(tmp_path / "joined.png"), limits=limits)
+
+    assert limits.cache_highwater == 0
+    assert limits.seconds > 0
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_join_tiled_tiff(gradient_image_path, tmp_path, streaming):
+    """
+    Tests joining into a tiled, pyramidal TIFF with lossless pixels.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.tif")
+    slice_image(gradient_image_path, tiles_dir, cols=3, rows=2)
+
+    join_image(
+        tiles_dir,
+        output_path,
+        streaming=streaming,
+        tiled_tiff=True,
+        save_options={"tile_width": 32, "tile_height": 32},
+    )
+
+    original = pyvips.Image.new_from_file(gradient_image_path)
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined - original).abs().max() == 0
+    assert joined.get("n-pages") > 1
+    level = pyvips.Image.new_from_file(output_path, page=1)
+    assert (level.width, level.height) == (50, 42)
+
+
+def test_join_tiled_tiff_needs_tiff_output(test_image_path, tmp_path):
+    """
+    Tests that tiled_tiff rejects outputs that are not TIFF files.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    slice_image(test_image_path, tiles_dir, cols=2, rows=2)
+    with pytest.raises(ValueError, match="tif"):
+        join_image(tiles_dir, str(tmp_path / "joined.png"), tiled_tiff=True)
+
+
+def test_join_tiles_from_encoded_bytes(gradient_image_path):
+    """
+    Tests joining encoded tiles in memory into an encoded buffer.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    tiles = slicer.generate_encoded_tiles(".png", tile_width=30, tile_height=25)
+    data = join_tiles(tiles, fmt=".png")
+
+    joined = pyvips.Image.new_from_buffer(data, "")
+    assert (joined - slicer.image).abs().max() == 0
+
+
+def test_join_tiles_from_mixed_sources(gradient_image_path, tmp_path):
+    """
+    Tests joining overlapping arrays, images and bytes into a file.
+    """
+    pytest.importorskip("numpy")
+    slicer = ImageSlicer(gradient_image_path)
+    tiles = []
+    for i, (tile, row, col) in enumerate(
+        slicer.generate_tiles(tile_width=40, tile_height=30, overlap=4)
+    ):
+        kind = i % 3
+        if kind == 0:
+            tiles.append((tile.numpy(), row, col))
+        elif kind == 1:
+            tiles.append((tile.write_to_buffer(".png"), row, col))
+        else:
+            tiles.append((tile, row, col))
+    output_path = str(tmp_path / "joined.tif")
+
+    result = join_tiles(reversed(tiles), output_path, overlap=4, tiled_tiff=True)
+
+    assert result is None
+    joined = pyvips.Image.new_from_file(output_path)
+    assert (joined - slicer.image).abs().max() == 0
+
+
+def test_join_tiles_rejects_bad_grids(gradient_image_path):
+    """
+    Tests that missing, repeated and unsupported tiles raise ValueError.
+    """
+    tile = pyvips.Image.new_from_file(gradient_image_path).crop(0, 0, 10, 10)
+    with pytest.raises(ValueError, match="No tiles"):
+        join_tiles([])
+    with pytest.raises(ValueError, match=r"Missing tiles: tile at \(0, 1\)"):
+        join_tiles([(tile, 0, 0), (tile, 1, 1), (tile, 1, 0)])
+    with pytest.raises(ValueError, match="more than once"):
+        join_tiles([(tile, 0, 0), (tile, 0, 0)])
+    with pytest.raises(ValueError, match="not str"):
+        join_tiles([("tile.png", 0, 0)])
+    with pytest.raises(ValueError, match="tif"):
+        join_tiles([(tile, 0, 0)], fmt=".png", tiled_tiff=True)
+
+
+def test_invalid_limits_raise_error():
+    """
+    Tests that negative limits are rejected.
+    """
+    with pytest.raises(ValueError, match="cache_max_mem"):
+        VipsLimits(cache_max_mem=-1)
+    with pytest.raises(ValueError, match="concurrency"):
+        VipsLimits(concurrency=0)
+
+
+def test_limits_are_shared_by_overlapping_jobs(gradient_image_path, tmp_path):
+    """
+    Tests that entering limits already in use joins the running session,
+    which restores the previous limits only when the last job exits.
+    """
+    before = pyvips.cache_get_max()
+    limits = VipsLimits(cache_max=7)
+    with limits:
+        with limits:
+            assert pyvips.cache_get_max() == 7
+        assert pyvips.cache_get_max() == 7
+    assert pyvips.cache_get_max() == before
+
+    slicer = ImageSlicer(gradient_image_path, limits=limits)
+    with ThreadPoolExecutor(4) as executor:
+        counts = list(
+            executor.map(
+                lambda i: slicer.slice(str(tmp_path / str(i)), cols=2, rows=2),
+                range(4),
+            )
+        )
+    assert counts == [4] * 4
+    assert pyvips.cache_get_max() == before
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_slice_region(gradient_image_path, tmp_path, processes):
+    """
+    Tests that only tiles intersecting the region are written, numbered as
+    in the full grid.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(
+        gradient_image_path,
+        str(tiles_dir),
+        tile_width=30,
+        tile_height=25,
+        processes=processes,
+        region=(35, 20, 30, 40),
+    )
+
+    assert sorted(os.listdir(tiles_dir)) == [
+        f"tile_{r}_{c}.png" for r in range(3) for c in range(1, 3)
+    ]
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    tile = pyvips.Image.new_from_file(str(tiles_dir / "tile_2_1.png"))
+    assert (tile - source.crop(30, 50, 30, 25)).abs().max() == 0
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_generate_tiles_with_tile_coords(gradient_image_path, streaming):
+    """
+    Tests selecting tiles by coordinate, alone and combined with a region.
+    """
+    slicer = ImageSlicer(gradient_image_path, streaming=streaming)
+    coords = [(3, 3), (0, 1), (2, 0)]
+    tiles = list(
+        slicer.generate_tiles(tile_width=30, tile_height=25, tile_coords=coords)
+    )
+
+    assert [(row, col) for _, row, col in tiles] == [(0, 1), (2, 0), (3, 3)]
+    assert (tiles[2][0].width, tiles[2][0].height) == (10, 10)
+
+    both = ImageSlicer(gradient_image_path).generate_tiles(
+        tile_width=30, tile_height=25, region=(0, 0, 60, 60), tile_coords=coords
+    )
+    assert [(row, col) for _, row, col in both] == [(0, 1), (2, 0)]
+
+
+def test_join_region_with_manifest(gradient_image_path, tmp_path):
+    """
+    Tests joining a region sliced with a manifest, which lists only the
+    selected tiles of the full grid.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(
+        gradient_image_path,
+        tiles_dir,
+        tile_width=25,
+        tile_height=20,
+        region=(0, 0, 50, 30),
+        manifest=True,
+    )
+    assert ImageJoiner(tiles_dir).manifest is not None
+
+    join_image(tiles_dir, output_path)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source.crop(0, 0, 50, 40)).abs().max() == 0
+
+
+@pytest.mark.parametrize("manifest", [True, False])
+@pytest.mark.parametrize("streaming", [False, True])
+def test_join_region_away_from_origin(
+    gradient_image_path, tmp_path, manifest, streaming
+):
+    """
+    Tests joining a region whose first tile is not at (0, 0), with tiles
+    listed by the manifest and discovered in the directory.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(
+        gradient_image_path,
+        tiles_dir,
+        tile_width=25,
+        tile_height=20,
+        region=(50, 40, 30, 30),
+        manifest=manifest,
+    )
+    assert sorted(os.listdir(tiles_dir)) == [
+        name for name in ["manifest.json"] if manifest
+    ] + [f"tile_{r}_{c}.png" for r in range(2, 4) for c in range(2, 4)]
+
+    join_image(tiles_dir, output_path, streaming=streaming)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source.crop(50, 40, 50, 40)).abs().max() == 0
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_join_overlapping_region_away_from_origin(
+    gradient_image_path, tmp_path, streaming
+):
+    """
+    Tests that the outer halos of an overlapping region inside the image are
+    cropped off using the manifest.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(
+        gradient_image_path,
+        tiles_dir,
+        tile_width=25,
+        tile_height=20,
+        overlap=4,
+        region=(30, 25, 40, 30),
+        manifest=True,
+    )
+
+    join_image(tiles_dir, output_path, streaming=streaming)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined - source.crop(25, 20, 50, 40)).abs().max() == 0
+
+
+def test_join_missing_tile_reports_grid_position(gradient_image_path, tmp_path):
+    """
+    Tests that a tile missing from a grid away from the origin is reported
+    at its position in the full grid.
+    """
+    tiles_dir = tmp_path / "tiles"
+    slice_image(
+        gradient_image_path,
+        str(tiles_dir),
+        tile_width=25,
+        tile_height=20,
+        region=(50, 40, 30, 30),
+    )
+    os.remove(tiles_dir / "tile_3_2.png")
+
+    with pytest.raises(ValueError, match=r"tile at \(3, 2\)"):
+        join_image(str(tiles_dir), str(tmp_path / "joined.png"))
+
+
+def test_slice_region_reports_selected_total(gradient_image_path, tmp_path):
+    """
+    Tests that progress counts only the selected tiles.
+    """
+    events = []
+    slice_image(
+        gradient_image_path,
+        str(tmp_path / "tiles"),
+        cols=4,
+        rows=4,
+        tile_coords=[(1, 1), (2, 2)],
+        progress=events.append,
+    )
+
+    assert [(e.done, e.total) for e in events] == [(1, 2), (2, 2)]
+
+
+def test_invalid_tile_selection_raises_error(gradient_image_path, tmp_path):
+    """
+    Tests that regions outside the image and coordinates outside the grid
+    are rejected.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    with pytest.raises(ValueError, match="does not intersect"):
+        slicer.slice(str(tmp_path), cols=2, rows=2, region=(100, 0, 10, 10))
+    with pytest.raises(ValueError, match="outside"):
+        slicer.slice(str(tmp_path), cols=2, rows=2, tile_coords=[(0, 2)])
+
+
+def test_get_tile_uses_cache(gradient_image_path):
+    """
+    Tests that get_tile matches the sliced tile and caches encoded bytes.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    expected = {
+        (row, col): data
+        for data, row, col in slicer.generate_encoded_tiles(
+            ".png", tile_width=30, tile_height=25
+        )
+    }
+
+    first = slicer.get_tile(3, 2, ".png", tile_width=30, tile_height=25)
+    second = slicer.get_tile(3, 2, ".png", tile_width=30, tile_height=25)
+
+    assert first == second == expected[(3, 2)]
+    stats = slicer.tile_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["tiles"]) == (1, 1, 1)
+    assert stats["bytes"] == len(first)
+
+    slicer.get_tile(3, 2, ".jpg", tile_width=30, tile_height=25)
+    assert slicer.tile_cache.stats()["tiles"] == 2
+
+
+def test_get_tile_rejects_bad_requests(gradient_image_path):
+    """
+    Tests that tiles outside the grid and streaming sources are rejected.
+    """
+    with pytest.raises(ValueError, match="outside"):
+        ImageSlicer(gradient_image_path).get_tile(0, 4, cols=4, rows=4)
+    with pytest.raises(ValueError, match="streaming"):
+        ImageSlicer(gradient_image_path, streaming=True).get_tile(0, 0, cols=4, rows=4)
+
+
+def test_tile_cache_evicts_least_recently_used():
+    """
+    Tests that the tile cache stays within its size, evicting old tiles.
+    """
+    cache = TileCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"1234")
+    cache.put("huge", b"x" * 11)
+
+    assert cache.get("b") is None
+    assert cache.get("huge") is None
+    assert cache.get("c") == b"1234"
+    stats = cache.stats()
+    assert (stats["tiles"], stats["bytes"], stats["evictions"]) == (2, 8, 1)
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+def test_slice_pyramid_writes_deepzoom(gradient_image_path, tmp_path):
+    """
+    Tests that a DeepZoom pyramid has every level down to one pixel.
+    """
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    output_path = str(tmp_path / "pyramid" / "gradient")
+    ImageSlicer(gradient_image_path).slice_pyramid(
+        output_path, tile_size=32, suffix=".png", overlap=0
+    )
+
+    levels_dir = output_path + "_files"
+    assert os.path.exists(output_path + ".dzi")
+    levels = sorted(int(name) for name in os.listdir(levels_dir) if name.isdigit())
+    assert levels == list(range(8))  # 100 pixels wide: 2**7 >= 100
+    top = os.path.join(levels_dir, "7")
+    assert len(os.listdir(top)) == 12  # 4 columns by 3 rows of 32 pixels
+    tile = pyvips.Image.new_from_file(os.path.join(top, "1_0.png"))
+    assert (tile - source.crop(32, 0, 32, 32)).abs().max() == 0
+    smallest = pyvips.Image.new_from_file(os.path.join(levels_dir, "0", "0_0.png"))
+    assert (smallest.width, smallest.height) == (1, 1)
+
+
+def test_slice_pyramid_google_layout(gradient_image_path, tmp_path):
+    """
+    Tests the XYZ layout and that save options reach the tile saver.
+    """
+    sizes = {}
+    for quality in (10, 95):
+        output_path = str(tmp_path / f"q{quality}")
+        slice_pyramid(
+            gradient_image_path,
+            output_path,
+            layout="google",
+            tile_size=32,
+            suffix=".jpg",
+            save_options={"Q": quality, "strip": True},
+        )
+        assert sorted(os.listdir(output_path)) == ["0", "1", "2", "blank.png"]
+        assert sorted(os.listdir(os.path.join(output_path, "2"))) == ["0", "1", "2"]
+        tile = pyvips.Image.new_from_file(os.path.join(output_path, "2", "0", "3.jpg"))
+        assert (tile.width, tile.height) == (32, 32)
+        sizes[quality] = os.path.getsize(os.path.join(output_path, "0", "0", "0.jpg"))
+
+    assert sizes[10] < sizes[95]
+
+
+def test_slice_pyramid_rejects_bad_arguments(test_image_path, tmp_path):
+    """
+    Tests that unknown layouts and tile sizes raise ValueError.
+    """
+    slicer = ImageSlicer(test_image_path)
+    with pytest.raises(ValueError, match="layout"):
+        slicer.slice_pyramid(str(tmp_path / "out"), layout="tms")
+    with pytest.raises(ValueError, match="tile_size"):
+        slicer.slice_pyramid(str(tmp_path / "out"), tile_size=0)
+
+
+def test_slice_dedupes_identical_tiles(gradient_image_path, tmp_path):
+    """
+    Tests that tiles with identical encoded bytes are hardlinked.
+    """
+    pytest.importorskip("numpy")
+    tile = pyvips.Image.new_from_file(gradient_image_path).crop(0, 0, 25, 20)
+    source = tile.replicate(3, 2).copy_memory()
+    tiles_dir = tmp_path / "tiles"
+    output_path = str(tmp_path / "joined.png")
+
+    ImageSlicer(source.numpy()).slice(
+        str(tiles_dir), tile_width=25, tile_height=20, dedupe=True, manifest=True
+    )
+
+    paths = [tiles_dir / f"tile_{r}_{c}.png" for r in range(2) for c in range(3)]
+    assert all(os.path.samefile(paths[0], path) for path in paths[1:])
+    join_image(str(tiles_dir), output_path)
+    assert (pyvips.Image.new_from_file(output_path) - source).abs().max() == 0
+
+
+def test_slice_with_invalid_blank_mode_raises_error(test_image_path, tmp_path):
+    """
+    Tests that unknown blank modes are rejected.
+    """
+    with pytest.raises(ValueError, match="blank must be"):
+        slice_image(test_image_path, str(tmp_path), cols=2, rows=2, blank="drop")
+
+
+def test_generate_tiles_with_overlap(gradient_image_path):
+    """
+    Tests that tiles grow by the overlap, clipped at the image edges.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    sizes = {
+        (row, col): (tile.width, tile.height)
+        for tile, row, col in slicer.generate_tiles(
+            tile_width=30, tile_height=25, overlap=5
+        )
+    }
+
+    assert len(sizes) == 16
+    assert sizes[(0, 0)] == (35, 30)
+    assert sizes[(1, 1)] == (40, 35)
+    assert sizes[(3, 3)] == (15, 15)
+
+
+def test_generate_tiles_with_mirror_padding(gradient_image_path):
+    """
+    Tests that padded tiles all have the same size and mirrored edges.
+    """
+    slicer = ImageSlicer(gradient_image_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    tiles = {
+        (row, col): tile
+        for tile, row, col in slicer.generate_tiles(
+            tile_width=50, tile_height=85, overlap=4, padding="mirror"
+        )
+    }
+
+    assert {(t.width, t.height) for t in tiles.values()} == {(58, 93)}
+    assert (tiles[(0, 0)].crop(4, 4, 50, 85) - source.crop(0, 0, 50, 85)).max() == 0
+    assert (
+        tiles[(0, 0)].crop(0, 4, 4, 85) - source.crop(0, 0, 4, 85).flip("horizontal")
+    ).abs().max() == 0
+
+
+@pytest.mark.parametrize("padding", [None, "mirror"])
+@pytest.mark.parametrize(
+    "blend,streaming", [(False, False), (False, True), (True, False)]
+)
+def test_join_overlapping_tiles(
+    gradient_image_path, tmp_path, padding, blend, streaming
+):
+    """
+    Tests that overlapping tiles are joined back without duplicated halos.
+    """
+    tiles_dir = str(tmp_path / "tiles")
+    output_path = str(tmp_path / "joined.png")
+    slice_image(
+        gradient_image_path,
+        tiles_dir,
+        tile_width=30,
+        tile_height=25,
+        overlap=12,
+        padding=padding,
+        manifest=True,
+    )
+
+    join_image(tiles_dir, output_path, blend=blend, streaming=streaming)
+
+    joined = pyvips.Image.new_from_file(output_path)
+    source = pyvips.Image.new_from_file(gradient_image_path)
+    assert (joined.width, joined.height) == (TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT)
+    assert (joined - source).abs().max() == 0
+
+
+def test_join_blends_overlapping_tiles(tmp_path):
+    """
+    Tests that blending cross-fades tiles that disagree in their overlap.
+    """
+    tiles_dir = tmp_path / "tiles"
+    output_path = str(tmp_path / "joined.png")
+    flat_path = str(tmp_path / "flat.png")
+    flat = (pyvips.Image.black(TEST_IMAGE_WIDTH, TEST_IMAGE_HEIGHT) + 100).cast("uchar")
+    flat.write_to_file(flat_path)
+    slice_image(flat_path, str(tiles_dir), tile_width=30, tile_height=25, overlap=8)
+    for name in os.listdir(tiles_dir):
+        row, col = map(int, name[5:-4].split("_"))
+        tile = pyvips.Image.new_from_file(str(tiles_dir / name))
+        offset = 40 if (row + col) % 2 else -40
+        (tile + offset).cast("uchar").copy_memory().write_to_file(str(tiles_dir / name))
+
+    def largest_step(image):
+        image = image.cast("int")
+        width, height = image.width, image.height
+        across = image.crop(1, 0, width - 1, height) - image.crop(
+            0, 0, width - 1, height
+        )
+        down = image.crop(0, 1, width, height - 1) - image.crop(0, 0, width, height - 1)
+        return max(across.abs().max(), down.abs().max())
+
+    join_image(str(tiles_dir), output_path, overlap=8)
+    assert largest_step(pyvips.Image.new_from_file(output_path)) == 80
+    join_image(str(tiles_dir), output_path, overlap=8, blend=True)
+    assert largest_step(pyvips.Image.new_from_file(output_path)) <= 8
+
+
+def test_slice_with_invalid_overlap_raises_error(test_image_path, tmp_path):
+    """
+    Tests that negative or oversized overlaps and unknown paddings are rejected.
+    """
+    with pytest.raises(ValueError, match="non-negative"):
+        slice_image(test_image_path, str(tmp_path), cols=2, rows=2, overlap=-1)
+    with pytest.raises(ValueError, match="must not exceed"):
+        slice_image(test_image_path, str(tmp_path), cols=2, rows=2, overlap=60)
+    with pytest.raises(ValueError, match="padding must be"):
+        slice_image(
+            test_image_path, str(tmp_path), cols=2, rows=2, overlap=2, padding="edge"
+        )
+
+
+@pytest.fixture
+def image_batch_dir(tmp_path):
+    """
+    Creates a directory with three small images and a text file.
+    """
+    batch_dir = tmp_path / "images"
+    batch_dir.mkdir()
+    for i, size in enumerate((40, 60, 80)):
+        pyvips.Image.black(size, size).write_to_file(str(batch_dir / f"img_{i}.png"))
+    (batch_dir / "notes.txt").write_text("not an image")
+    return batch_dir
+
+
+@pytest.mark.parametrize("kind", ["list", "directory", "glob"])
+def test_slice_images(image_batch_dir, tmp_path, kind):
+    """
+    Tests slicing a batch of images into per-image subdirectories.
+    """
+    sources = {
+        "list": sorted(str(p) for p in image_batch_dir.glob("*.png")),
+        "directory": str(image_batch_dir),
+        "glob": str(image_batch_dir / "img_*.png"),
+    }[kind]
+    output_dir = tmp_path / "tiles"
+
+    summary = slice_images(sources, str(output_dir), cols=2, rows=2, jobs=2)
+
+    assert sorted(os.listdir(output_dir)) == ["img_0", "img_1", "img_2"]
+    assert all(
+        len(os.listdir(output_dir / name)) == 4 for name in os.listdir(output_dir)
+    )
+    assert summary["images"] == 3
+    assert summary["tiles"] == 12
+    assert summary["pixels"] == 40 * 40 + 60 * 60 + 80 * 80
+    assert summary["failed"] == []
+
+
+def test_slice_images_continue_on_error(image_batch_dir, tmp_path):
+    """
+    Tests that failures are recorded when continuing on error.
+    """
+    sources = [str(image_batch_dir / "notes.txt"), str(image_batch_dir / "img_0.png")]
+
+    with pytest.raises(pyvips.Error):
+        slice_images(sources, str(tmp_path / "strict"), cols=2, rows=2)
+    summary = slice_images(
+        sources, str(tmp_path / "tiles"), cols=2, rows=2, continue_on_error=True
+    )
+
+    assert summary["images"] == 1
+    assert [path for path, _ in summary["failed"]] == [sources[0]]
+    assert os.listdir(tmp_path / "tiles") == ["img_0"]
+
+
+def test_slice_images_counts_written_tiles(image_batch_dir, tmp_path):
+    """
+    Tests that the summary counts the tiles written, not the full grids.
+    """
+    sources = str(image_batch_dir / "img_*.png")
+
+    selected = slice_images(
+        sources, str(tmp_path / "selected"), cols=2, rows=2, tile_coords=[(0, 0)]
+    )
+    skipped = slice_images(
+        sources, str(tmp_path / "skipped"), cols=2, rows=2, blank="skip"
+    )
+
+    assert (selected["images"], selected["tiles"]) == (3, 3)
+    assert (skipped["images"], skipped["tiles"]) == (3, 0)
+
+
+def test_slice_images_reports_unmatched_patterns(image_batch_dir, tmp_path):
+    """
+    Tests that a glob pattern matching no images is an error, or a failure
+    when continuing on error.
+    """
+    pattern = str(image_batch_dir / "*.tif")
+    sources = [pattern, str(image_batch_dir / "img_0.png")]
+
+    with pytest.raises(ValueError, match="No images match"):
+        slice_images(sources, str(tmp_path / "strict"), cols=2, rows=2)
+    summary = slice_images(
+        sources, str(tmp_path / "tiles"), cols=2, rows=2, continue_on_error=True
+    )
+
+    assert summary["images"] == 1
+    assert summary["failed"] == [(pattern, "No images match")]
+
+
+def test_slice_images_rejects_colliding_names(image_batch_dir, tmp_path):
+    """
+    Tests that two sources with the same name are rejected before slicing.
+    """
+    other = tmp_path / "other"
+    other.mkdir()
+    pyvips.Image.black(10, 10).write_to_file(str(other / "img_0.jpg"))
+
+    with pytest.raises(ValueError, match="would both be sliced into img_0"):
+        slice_images(
+            [str(image_batch_dir), str(other)], str(tmp_path / "tiles"), cols=2, rows=2
+        )